@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+"""Benchmark for constructing tags with asyncio.
+
+Renders a page of 20 fragments, each one fetched from a data source with a
+latency between 10 and 200 ms, and measures the time to the first chunk and
+the total time of:
+
+  - sequential: fetching the fragments one after the other before
+    constructing the page.
+  - async: streaming the page with ``Element.iter_render_async()``, the
+    fragments being given as coroutines.
+"""
+
+import asyncio
+import time
+
+from korona.html.tags import Div, H1, Head, Html
+
+FRAGMENTS = 20
+LATENCIES = [0.01 + 0.19 * (index * 7 % FRAGMENTS) / FRAGMENTS
+             for index in range(FRAGMENTS)]
+
+
+async def fetch(index):
+    """Returns the fragment after its latency."""
+    await asyncio.sleep(LATENCIES[index])
+    return Div(text=[H1(text='fragment {0}'.format(index)),
+                     Div(text='abcd' * 10)])
+
+
+def page(fragments):
+    return Html(text=[Head(), Div(align='center', text=fragments)])
+
+
+async def sequential():
+    start = time.time()
+    fragments = [await fetch(index) for index in range(FRAGMENTS)]
+    chunks = iter(page(fragments).iter_render())
+    next(chunks)
+    first = time.time() - start
+    list(chunks)
+    return first, time.time() - start
+
+
+async def concurrent():
+    start = time.time()
+    first = None
+    fragments = [fetch(index) for index in range(FRAGMENTS)]
+    async for _ in page(fragments).iter_render_async(chunk_size=4096):
+        first = first or time.time() - start
+    return first, time.time() - start
+
+
+def main():
+    print('{0:12} {1:>16} {2:>12}'.format('renderer', 'first chunk (ms)',
+                                          'total (ms)'))
+    for name, function in [('sequential', sequential),
+                           ('async', concurrent)]:
+        loop = asyncio.new_event_loop()
+        first, total = loop.run_until_complete(function())
+        loop.close()
+        print('{0:12} {1:16.1f} {2:12.1f}'.format(name, first * 1e3,
+                                                  total * 1e3))
+
+
+if __name__ == '__main__':
+    main()
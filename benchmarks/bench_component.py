@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+"""Benchmark for the memoized components.
+
+Constructs a page of 10000 product cards drawn from 100 distinct products,
+for both renderer backends:
+
+  - function: the cards are built by a plain function and constructed.
+  - component: the cards are built by a component (``@korona.component``),
+    so every distinct card is only constructed once.
+
+The hit rate of the component is printed along with the times.
+"""
+
+import timeit
+
+import korona
+from korona.html.tags import A, Cite, Div, H1
+from korona.templates.html.renderer import BACKENDS, set_backend
+
+PRODUCTS = [('product {0}'.format(index % 100), index % 100)
+            for index in range(10000)]
+NUMBER = 10
+
+
+def product_card(name, price):
+    return Div(align='center',
+               text=[H1(text=name),
+                     Cite(text='{0} EUR'.format(price)),
+                     A(href='/products/{0}'.format(price), text='details')])
+
+
+def functions():
+    Div(text=[product_card(name, price)
+              for name, price in PRODUCTS]).construct()
+
+
+def get_components():
+    card = korona.component(product_card)
+
+    def components():
+        Div(text=[card(name, price) for name, price in PRODUCTS]).construct()
+
+    return card, components
+
+
+def main():
+    print('{0:10} {1:>14} {2:>15} {3:>9} {4:>9}'
+          .format('backend', 'function (ms)', 'component (ms)', 'speedup',
+                  'hit rate'))
+    for backend in BACKENDS:
+        set_backend(backend)
+        card, components = get_components()
+        function = min(timeit.repeat(functions, number=1, repeat=NUMBER))
+        component = min(timeit.repeat(components, number=1, repeat=NUMBER))
+        print('{0:10} {1:14.1f} {2:15.1f} {3:8.1f}x {4:9.3f}'
+              .format(backend, function * 1000, component * 1000,
+                      function / component, card.info().hit_rate))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+"""Benchmark for constructing tags in bulk.
+
+Compares the per-row cost of constructing tags one by one
+(``Tag(**row).construct()``) with constructing them in bulk with
+``Tag.construct_many(rows)``, for both renderer backends. Every row is still
+validated and rendered on its own, so both are expected to be about the same.
+"""
+
+import timeit
+
+from korona.html.tags import A, Div, Img, Input
+from korona.templates.html.renderer import BACKENDS, set_backend
+
+ROWS = 10000
+REPEAT = 5
+
+WORKLOADS = [
+    (A, [{'href': 'www.google.com/{0}'.format(i),
+          'rel': 'nofollow',
+          'target': '_blank',
+          'text': 'link {0}'.format(i)} for i in range(ROWS)]),
+    (Img, [{'src': 'www.google.com/{0}.png'.format(i),
+            'alt': 'image {0}'.format(i),
+            'height': 10,
+            'width': 10} for i in range(ROWS)]),
+    (Input, [{'type': 'text',
+              'name': 'field{0}'.format(i),
+              'value': str(i),
+              'placeholder': 'value'} for i in range(ROWS)]),
+    (Div, [{'align': 'center', 'text': 'row {0}'.format(i)}
+           for i in range(ROWS)])
+]
+
+
+def per_row(function, rows):
+    """Returns the best time (in microseconds) per row for the function."""
+    timing = min(timeit.repeat(function, number=1, repeat=REPEAT))
+    return timing / len(rows) * 1e6
+
+
+def main():
+    print('{0:8} {1:10} {2:>12} {3:>16} {4:>8}'
+          .format('tag', 'backend', 'scalar (us)', 'construct_many',
+                  'speedup'))
+    for backend in BACKENDS:
+        set_backend(backend)
+        for tag, rows in WORKLOADS:
+            scalar = per_row(
+                lambda: ''.join([tag(**row).construct() for row in rows]),
+                rows)
+            bulk = per_row(lambda: tag.construct_many(rows, separator=''),
+                           rows)
+            print('{0:8} {1:10} {2:12.2f} {3:16.2f} {4:7.2f}x'
+                  .format(tag.__name__, backend, scalar, bulk, scalar / bulk))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""Benchmark for writing large documents.
+
+Writes a page of 100k rows to ``os.devnull`` and measures the time and the
+peak memory (the growth of the maximum resident set size of the process
+writing the page) of:
+
+  - tree: building the whole tree of tags and streaming it.
+  - generator: streaming a tree whose rows are generated while it is
+    written.
+  - document: writing the page with the :class:`Document` builder, without
+    any tree.
+"""
+
+from multiprocessing import Pool
+import os
+import resource
+import time
+
+from korona.html.root.document import Document
+from korona.html.tags import A, Div, Html, Input
+
+ROWS = 100000
+
+
+def row(index):
+    """Returns the tags of a row of the page."""
+    return [A(href='www.google.com', text='row {0}'.format(index)),
+            Input(type='text', name='row{0}'.format(index))]
+
+
+def write_tree(fp):
+    page = Html(text=Div(align='center',
+                         text=[Div(text=row(index))
+                               for index in range(ROWS)]))
+    page.render_to(fp)
+
+
+def write_generator(fp):
+    page = Html(text=Div(align='center',
+                         text=(Div(text=row(index))
+                               for index in range(ROWS))))
+    page.render_to(fp)
+
+
+def write_document(fp):
+    with Document(fp) as doc:
+        with doc.tag(Html):
+            with doc.tag(Div, align='center'):
+                for index in range(ROWS):
+                    with doc.tag(Div):
+                        doc.write(row(index))
+
+
+def measure(name):
+    """Returns the time (in seconds) and the peak memory (in MB) of writing
+    the page with the named writer.
+    """
+    function = WRITERS[name]
+    before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    with open(os.devnull, 'w') as fp:
+        start = time.time()
+        function(fp)
+        elapsed = time.time() - start
+    after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return elapsed, (after - before) / 1024.0
+
+
+WRITERS = {'tree': write_tree,
+           'generator': write_generator,
+           'document': write_document}
+
+
+def main():
+    print('{0:10} {1:>10} {2:>10}'.format('writer', 'time (s)',
+                                          'peak (MB)'))
+    for name in ['tree', 'generator', 'document']:
+        # Every writer runs in a new process so that the peak memory of one
+        # writer is not hidden by the previous one.
+        pool = Pool(1, maxtasksperchild=1)
+        elapsed, peak = pool.apply(measure, (name,))
+        pool.close()
+        pool.join()
+        print('{0:10} {1:10.2f} {2:10.2f}'.format(name, elapsed, peak))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+"""Benchmark for the flush points of the streamed tags.
+
+Streams a page whose rows are generated from a slow data source (0.2 ms per
+row) in chunks of 16k characters, and measures the time until the end of the
+``<head>`` is yielded, with and without a flush point after the head.
+"""
+
+import time
+
+from korona.html.tags import Base, Div, Head, Html
+
+ROWS = 2000
+
+
+def rows():
+    for index in range(ROWS):
+        time.sleep(0.0002)
+        yield Div(text='row {0}'.format(index))
+
+
+def measure(flush_after):
+    """Returns the time (in ms) until the head is yielded and the total
+    time.
+    """
+    page = Html(text=[Head(text=Base(href='www.google.com')),
+                      Div(text=rows())])
+    start = time.time()
+    head = None
+    for chunk in page.iter_render(chunk_size=16384, flush_after=flush_after):
+        if head is None and '</head>' in chunk:
+            head = time.time() - start
+    return head * 1e3, (time.time() - start) * 1e3
+
+
+def main():
+    print('{0:12} {1:>10} {2:>12}'.format('flush after', 'head (ms)',
+                                          'total (ms)'))
+    for name, flush_after in [('-', ()), ('head', ['head'])]:
+        head, total = measure(flush_after)
+        print('{0:12} {1:10.1f} {2:12.1f}'.format(name, head, total))
+
+
+if __name__ == '__main__':
+    main()
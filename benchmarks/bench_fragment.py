@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""Benchmark for the fragment functions compiled from trees with slots.
+
+Renders 10000 cards (a title and a link) per run, for both renderer
+backends:
+
+  - tree: the tree of every card is built and constructed.
+  - plan: the card is compiled once into a render plan.
+  - fragment: the card is compiled once into a fragment function.
+  - format: the card is written by hand with ``str.format``, as a baseline.
+"""
+
+import timeit
+
+from korona.html.root.fragment import compile_fragment
+from korona.html.root.plan import compile_plan
+from korona.html.root.slot import Slot
+from korona.html.tags import A, Div, H1
+from korona.templates.html.renderer import BACKENDS, set_backend
+
+ROWS = [('https://www.example.com/items/{0}'.format(index),
+         'item {0}'.format(index)) for index in range(10000)]
+NUMBER = 10
+CARD = ('<div id="card" ><h1 >{1}</h1>'
+        '<a rel="nofollow" href="{0}" >{1}</a></div>')
+
+
+def get_card(href, title):
+    """Returns the tree of a card."""
+    return Div(id='card',
+               text=[H1(text=title),
+                     A.with_slots(rel='nofollow', href=href, text=title)])
+
+
+def trees():
+    for href, title in ROWS:
+        get_card(href, title).construct()
+
+
+def plans():
+    plan = compile_plan(get_card(Slot('href', default='/'), Slot('title')))
+    for href, title in ROWS:
+        plan.render(href=href, title=title)
+
+
+def fragments():
+    render = compile_fragment(get_card(Slot('href', default='/'),
+                                       Slot('title')))
+    for href, title in ROWS:
+        render(href=href, title=title)
+
+
+def formats():
+    for href, title in ROWS:
+        CARD.format(href, title)
+
+
+def main():
+    print('{0:10} {1:>10} {2:>10} {3:>14} {4:>12}'
+          .format('backend', 'tree (ms)', 'plan (ms)', 'fragment (ms)',
+                  'format (ms)'))
+    for backend in BACKENDS:
+        set_backend(backend)
+        times = [min(timeit.repeat(function, number=1, repeat=NUMBER))
+                 for function in [trees, plans, fragments, formats]]
+        print('{0:10} {1:10.1f} {2:10.1f} {3:14.1f} {4:12.1f}'
+              .format(backend, *[time * 1000 for time in times]))
+
+
+if __name__ == '__main__':
+    main()
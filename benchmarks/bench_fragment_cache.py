@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""Benchmark for the fragment cache.
+
+Constructs a page section (a list of 500 products) per request, for both
+renderer backends and both storages:
+
+  - uncached: the section is built and constructed on every request.
+  - cached: the section is taken from a fragment cache, with the
+    dependency keys ``products`` and ``currency``, and built again after
+    ``products`` is invalidated every 100 requests.
+"""
+
+import shutil
+import tempfile
+import timeit
+
+from korona.html.root.fragment_cache import FragmentCache
+from korona.html.tags import DD, DL, DT
+from korona.lib.cache import FileStorage, MemoryStorage
+from korona.templates.html.renderer import BACKENDS, set_backend
+
+PRODUCTS = [('product {0}'.format(index), '{0} EUR'.format(index))
+            for index in range(500)]
+DEPS = ['products', 'currency']
+NUMBER = 200
+
+
+def get_section():
+    return DL(text=[[DT(text=name), DD(text=price)]
+                    for name, price in PRODUCTS])
+
+
+def get_requests(cache):
+    def requests():
+        for index in range(NUMBER):
+            if index % 100 == 99:
+                cache.invalidate(dep='products')
+            cache.cached('products', get_section, deps=DEPS)
+
+    return requests
+
+
+def uncached():
+    for _ in range(NUMBER):
+        get_section().construct()
+
+
+def main():
+    directory = tempfile.mkdtemp()
+    try:
+        print('{0:10} {1:8} {2:>15} {3:>13} {4:>9}'
+              .format('backend', 'storage', 'uncached (ms)', 'cached (ms)',
+                      'speedup'))
+        for backend in BACKENDS:
+            set_backend(backend)
+            base = min(timeit.repeat(uncached, number=1, repeat=3))
+            for name, storage in [('memory', MemoryStorage()),
+                                  ('file', FileStorage(directory))]:
+                requests = get_requests(FragmentCache(storage))
+                time = min(timeit.repeat(requests, number=1, repeat=3))
+                print('{0:10} {1:8} {2:15.1f} {3:13.1f} {4:8.1f}x'
+                      .format(backend, name, base * 1000, time * 1000,
+                              base / time))
+                storage.clear()
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""Benchmark for constructing tags with global attributes.
+
+Compares constructing 100k tags without any global attribute against the
+same tags with a ``class`` attribute (and with ``id``, ``class`` and
+``style``), for both renderer backends. The global attributes are rendered
+by the template of the tag, in the same pass as its other attributes. The
+last row of every tag renders the ``class`` attribute with a separate
+``GlobalAttributes`` template for comparison.
+"""
+
+import timeit
+
+from korona.html.root.global_attributes import GlobalAttributes
+from korona.html.tags import A, Div
+from korona.templates.html.renderer import BACKENDS, set_backend
+
+NUMBER = 100000
+REPEAT = 3
+
+WORKLOADS = [
+    (A, {'href': 'www.google.com', 'text': 'google'}),
+    (Div, {'text': 'abcd'})
+]
+
+GLOBAL_ATTRIBUTES = [
+    ('none', {}),
+    ('class', {'class_': 'item'}),
+    ('id, class, style', {'id': 'item', 'class_': 'item',
+                          'style': 'color:blue;'})
+]
+
+
+def timing(function):
+    """Returns the best time (in milliseconds) for constructing NUMBER
+    tags.
+    """
+    return min(timeit.repeat(function, number=NUMBER, repeat=REPEAT)) * 1e3
+
+
+def main():
+    print('{0:6} {1:10} {2:>18} {3:>10} {4:>8}'
+          .format('tag', 'backend', 'global attributes', 'time (ms)',
+                  'extra'))
+    for backend in BACKENDS:
+        set_backend(backend)
+        for tag, attributes in WORKLOADS:
+            base = None
+            for name, global_attributes in GLOBAL_ATTRIBUTES:
+                values = dict(attributes, **global_attributes)
+                elapsed = timing(lambda: tag(**values).construct())
+                base = base or elapsed
+                print('{0:6} {1:10} {2:>18} {3:10.1f} {4:7.1f}%'
+                      .format(tag.__name__, backend, name, elapsed,
+                              (elapsed / base - 1) * 100))
+
+            def separate():
+                html = tag(**attributes).construct()
+                return (html[:html.index('>')] +
+                        GlobalAttributes(**{'class': 'item'}).construct() +
+                        html[html.index('>'):])
+
+            elapsed = timing(separate)
+            print('{0:6} {1:10} {2:>18} {3:10.1f} {4:7.1f}%'
+                  .format(tag.__name__, backend, 'class (separate)',
+                          elapsed, (elapsed / base - 1) * 100))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""Benchmark for the time taken to import korona in a fresh process.
+
+Short lived workers (CLI tools, serverless functions) pay for the import of
+korona on every start. The tag modules are imported on first access and the
+templates are compiled lazily, so an import only pays for the tags which are
+actually used. This benchmark compares the lazy imports with importing every
+tag and compiling every template up front.
+"""
+
+import statistics
+import subprocess
+import sys
+import time
+
+RUNS = 20
+
+BASELINE = 'pass'
+LAZY = 'import korona.html.tags'
+SINGLE_TAG = 'from korona.html.tags import A'
+ALL_TAGS = """\
+import korona.html.tags as tags
+for name in tags.__all__:
+    getattr(tags, name)
+"""
+EAGER = """\
+import korona.html.tags
+from korona.templates.html import global_attributes, tags
+templates = [getattr(tags, name) for name in tags.__all__]
+templates.append(global_attributes.global_attributes)
+for template in templates:
+    template.template
+"""
+FIRST_RENDER = """\
+from korona.html.tags import A, Div
+A(href='www.google.com', text='google').construct()
+Div(align='center', text='abcd').construct()
+"""
+
+
+def measure(code, runs=RUNS):
+    """Returns the median time (in milliseconds) for running the given code in
+    a fresh python process.
+    """
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.check_call([sys.executable, '-c', code])
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def main():
+    baseline = measure(BASELINE)
+    results = [('lazy import', measure(LAZY)),
+               ('import <a> only', measure(SINGLE_TAG)),
+               ('import all the tags', measure(ALL_TAGS)),
+               ('lazy import + render <a>, <div>', measure(FIRST_RENDER)),
+               ('eager compile of all templates', measure(EAGER))]
+
+    print('{0:32} {1:8.2f} ms'.format('python startup:', baseline))
+    for name, timing in results:
+        print('{0:32} {1:8.2f} ms ({2:+.2f} ms over baseline)'
+              .format(name + ':', timing, timing - baseline))
+
+
+if __name__ == '__main__':
+    main()
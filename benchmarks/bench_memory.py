@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""Benchmark for the memory used by large trees of tags.
+
+Measures the memory held by a tree of 1M tags before it is constructed. The
+tags only store the attributes which are set and have no instance
+dictionary. They are compared with tags storing a dictionary of all their
+attributes in an instance dictionary, as the tags did before.
+"""
+
+import gc
+import tracemalloc
+
+from korona.html.tags import A, Div, Img, Input
+
+ROWS = 250000
+
+
+class DictTag(object):
+    """Tag storing all its attribute values in an instance dictionary."""
+    def __init__(self, tag, values):
+        self.tag = tag
+        self.values = values
+
+
+def compact_tree():
+    """Returns a tree of tags storing only the attributes which are set."""
+    return [Div.trusted(text=[A.trusted(href='www.google.com', text='google'),
+                              Img.trusted(src='www.google.com/logo.png',
+                                          alt='logo'),
+                              Input.trusted(type='text', name='query')])
+            for _ in range(ROWS)]
+
+
+def dict_tree():
+    """Returns the same tree of tags storing all their attributes."""
+    def tag(element):
+        values = dict(element.values)
+        if isinstance(values.get('text'), list):
+            values['text'] = [tag(child) for child in values['text']]
+        return DictTag(element.tag, values)
+
+    return [tag(element) for element in compact_tree()]
+
+
+def memory(function):
+    """Returns the memory (in MB) held by the object returned by the
+    function.
+    """
+    gc.collect()
+    tracemalloc.start()
+    tree = function()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del tree
+    return size / 1024.0 / 1024.0
+
+
+def main():
+    compact = memory(compact_tree)
+    full = memory(dict_tree)
+    print('{0:>8} {1:>18} {2:>18} {3:>8}'
+          .format('tags', 'all values (MB)', 'set values (MB)', 'saving'))
+    print('{0:8} {1:18.2f} {2:18.2f} {3:7.1f}%'
+          .format(ROWS * 4, full, compact, (1 - compact / full) * 100))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""Benchmark for constructing deeply nested pages.
+
+Constructing the inner tags first and passing their output as the text of
+the outer tag copies every inner string again at each level, so the cost
+grows quadratically with the depth. Constructing the same page from a tree
+of tags writes every tag once into a single buffer.
+"""
+
+import timeit
+
+from korona.html.tags import Div
+
+REPEAT = 5
+DEPTHS = [10, 50, 100, 200, 400]
+# Every level of the page holds some content besides the nested tag.
+CONTENT = 'x' * 1000
+
+
+def concatenated(depth):
+    """Constructs the page by passing the inner output as text."""
+    text = CONTENT
+    for _ in range(depth):
+        text = Div(align='left', text=CONTENT + text).construct()
+    return text
+
+
+def nested(depth):
+    """Constructs the page from a tree of tags."""
+    tag = CONTENT
+    for _ in range(depth):
+        tag = Div(align='left', text=[CONTENT, tag])
+    return tag.construct()
+
+
+def main():
+    print('{0:>6} {1:>18} {2:>18}'
+          .format('depth', 'concatenated (ms)', 'nested tree (ms)'))
+    for depth in DEPTHS:
+        assert concatenated(depth) == nested(depth)
+        results = [min(timeit.repeat(lambda: build(depth),
+                                     number=10,
+                                     repeat=REPEAT)) / 10 * 1000
+                   for build in (concatenated, nested)]
+        print('{0:6} {1:18.3f} {2:18.3f}'.format(depth, *results))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+"""Benchmark for constructing a large document across a pool of processes.
+
+Constructs a page of ROWS x CELLS table cells (200k by default, set the
+``KORONA_BENCH_CELLS`` environment variable for more, Ex. 2000000) serially
+and with ``render_parallel`` for 1 to 16 workers, with the renderer backend
+of the process (See ``KORONA_RENDERER``). The speedup is bounded by the
+number of cpus of the machine.
+"""
+
+import multiprocessing
+import os
+import time
+
+from korona.html.root.parallel import render_parallel
+from korona.html.tags import Div, Head, Html
+from korona.templates.html.renderer import get_backend
+
+CELLS = 20
+ROWS = int(os.environ.get('KORONA_BENCH_CELLS', 200000)) // CELLS
+WORKERS = [1, 2, 4, 8, 16]
+
+
+def page():
+    return Html(text=[Head(),
+                      Div(text=[Div(text=[Div.trusted(text=str(row * cell))
+                                          for cell in range(CELLS)])
+                                for row in range(ROWS)])])
+
+
+def main():
+    tree = page()
+    print('{0} cells, {1} cpus, {2} backend'.format(
+        ROWS * CELLS, multiprocessing.cpu_count(), get_backend()))
+
+    start = time.time()
+    expected = tree.construct()
+    serial = time.time() - start
+
+    print('{0:>8} {1:>10} {2:>8}'.format('workers', 'time (s)', 'speedup'))
+    print('{0:>8} {1:10.2f} {2:7.2f}x'.format('serial', serial, 1))
+    for workers in WORKERS:
+        start = time.time()
+        html = render_parallel(tree, workers=workers)
+        elapsed = time.time() - start
+        assert html == expected
+        print('{0:>8} {1:10.2f} {2:7.2f}x'.format(workers, elapsed,
+                                                  serial / elapsed))
+
+
+if __name__ == '__main__':
+    main()
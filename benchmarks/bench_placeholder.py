@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+"""Benchmark for the placeholders of the slow fragments of a page.
+
+Streams a page of 5 widgets, one of which comes from a slow query (500 ms)
+while the others take 10 ms, and measures the time to the first chunk, the
+time until the rest of the page (``</html>``) is written and the total
+time of:
+
+  - inline: the widgets are written in place, waiting for their queries.
+  - placeholder: the widgets are placeholders written at the end of the
+    stream as soon as their queries are done.
+
+Both with threads (``iter_render``) and with asyncio
+(``iter_render_async``).
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import time
+
+from korona.html.root.placeholder import Placeholder
+from korona.html.tags import Div, H1, Head, Html
+
+LATENCIES = [0.01, 0.5, 0.01, 0.01, 0.01]
+
+
+def widget(index):
+    return Div(text=[H1(text='widget {0}'.format(index)), 'abcd' * 10])
+
+
+def query(index):
+    time.sleep(LATENCIES[index])
+    return widget(index)
+
+
+async def query_async(index):
+    await asyncio.sleep(LATENCIES[index])
+    return widget(index)
+
+
+def page(widgets):
+    return Html(text=[Head(), Div(text='header'), widgets,
+                      Div(text='footer')])
+
+
+def measure(chunks):
+    """Returns the time (in ms) to the first chunk, to the end of the page
+    and the total time of streaming the chunks.
+    """
+    start = time.time()
+    first = shell = None
+    for chunk in chunks:
+        first = first or time.time() - start
+        if shell is None and '</html>' in chunk:
+            shell = time.time() - start
+    return first * 1e3, shell * 1e3, (time.time() - start) * 1e3
+
+
+async def measure_async(chunks):
+    start = time.time()
+    first = shell = None
+    async for chunk in chunks:
+        first = first or time.time() - start
+        if shell is None and '</html>' in chunk:
+            shell = time.time() - start
+    return first * 1e3, shell * 1e3, (time.time() - start) * 1e3
+
+
+def run_threads(placeholders):
+    with ThreadPoolExecutor(len(LATENCIES)) as executor:
+        futures = [executor.submit(query, index)
+                   for index in range(len(LATENCIES))]
+        if placeholders:
+            widgets = [Placeholder(future) for future in futures]
+        else:
+            widgets = (future.result() for future in futures)
+        return measure(page(widgets).iter_render(chunk_size=4096))
+
+
+def run_asyncio(placeholders):
+    async def run():
+        queries = [query_async(index) for index in range(len(LATENCIES))]
+        if placeholders:
+            widgets = [Placeholder(query) for query in queries]
+        else:
+            widgets = queries
+        return await measure_async(
+            page(widgets).iter_render_async(chunk_size=4096))
+
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(run())
+    finally:
+        loop.close()
+
+
+def main():
+    print('{0:8} {1:12} {2:>16} {3:>12} {4:>10}'
+          .format('runner', 'widgets', 'first chunk (ms)', 'page (ms)',
+                  'total (ms)'))
+    for runner, function in [('threads', run_threads),
+                             ('asyncio', run_asyncio)]:
+        for name, placeholders in [('inline', False),
+                                   ('placeholder', True)]:
+            first, shell, total = function(placeholders)
+            print('{0:8} {1:12} {2:16.1f} {3:12.1f} {4:10.1f}'
+                  .format(runner, name, first, shell, total))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""Benchmark for the render plans of mostly static pages.
+
+Renders a page with 3 slots (a title, a user name and a list of messages)
+and a static skeleton of 10 to 1000 rows, per request:
+
+  - tree: the tree of the page is built and constructed.
+  - plan: the page is compiled once into a render plan and only the slots
+    are rendered.
+
+The time of the plan should not grow with the size of the skeleton.
+"""
+
+import timeit
+
+from korona.html.root.plan import compile_plan
+from korona.html.root.slot import Slot
+from korona.html.tags import A, Cite, Div, H1, Head, Html
+from korona.templates.html.renderer import BACKENDS, set_backend
+
+SIZES = [10, 100, 1000]
+NUMBER = 200
+
+
+def get_page(size, title, user, messages):
+    """Returns the page with a skeleton of ``size`` rows."""
+    skeleton = [Div(align='center',
+                    text=[A(href='/section/{0}'.format(row),
+                            text='section {0}'.format(row)),
+                          Cite(text='description')])
+                for row in range(size)]
+    return Html(text=[Head(),
+                      H1(text=title),
+                      Div(text=['Hello ', user]),
+                      Div(text=skeleton),
+                      Div(text=messages)])
+
+
+def get_messages():
+    return [Div(text='message {0}'.format(index)) for index in range(3)]
+
+
+def main():
+    print('{0:10} {1:>6} {2:>12} {3:>12} {4:>9}'
+          .format('backend', 'rows', 'tree (ms)', 'plan (ms)', 'speedup'))
+    for backend in BACKENDS:
+        set_backend(backend)
+        for size in SIZES:
+            plan = compile_plan(get_page(size, Slot('title'), Slot('user'),
+                                         Slot('messages')))
+            tree = timeit.timeit(
+                lambda: get_page(size, 'title', 'user',
+                                 get_messages()).construct(),
+                number=NUMBER) / NUMBER
+            planned = timeit.timeit(
+                lambda: plan.render(title='title', user='user',
+                                    messages=get_messages()),
+                number=NUMBER) / NUMBER
+            print('{0:10} {1:6} {2:12.3f} {3:12.3f} {4:8.1f}x'
+                  .format(backend, size, tree * 1000, planned * 1000,
+                          tree / planned))
+
+
+if __name__ == '__main__':
+    main()
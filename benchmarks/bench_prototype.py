@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+"""Benchmark for the variants of tag prototypes.
+
+Creates and constructs 10000 links which only differ in their href and text
+and 10000 text inputs which only differ in their name and value, for both
+renderer backends:
+
+  - tag: every tag is created with all its attributes.
+  - variant: the tags are variants of a prototype with the shared
+    attributes (``Tag.prototype(...).with_(...)``).
+"""
+
+import timeit
+
+from korona.html.tags import A, Input
+from korona.templates.html.renderer import BACKENDS, set_backend
+
+ROWS = [('https://www.example.com/items/{0}'.format(index),
+         'item {0}'.format(index)) for index in range(10000)]
+NUMBER = 10
+
+
+def links():
+    for url, label in ROWS:
+        A(rel='nofollow', target='_blank', href=url, text=label).construct()
+
+
+def link_variants():
+    link = A.prototype(rel='nofollow', target='_blank')
+    for url, label in ROWS:
+        link.with_(href=url, text=label).construct()
+
+
+def inputs():
+    for name, value in ROWS:
+        Input(type='text', required=True, autocomplete='off', name=name,
+              value=value).construct()
+
+
+def input_variants():
+    field = Input.prototype(type='text', required=True, autocomplete='off')
+    for name, value in ROWS:
+        field.with_(name=name, value=value).construct()
+
+
+def main():
+    print('{0:10} {1:8} {2:>10} {3:>12} {4:>9}'
+          .format('backend', 'tags', 'tag (ms)', 'variant (ms)', 'speedup'))
+    for backend in BACKENDS:
+        set_backend(backend)
+        for name, tags, variants in [('links', links, link_variants),
+                                     ('inputs', inputs, input_variants)]:
+            tag = min(timeit.repeat(tags, number=1, repeat=NUMBER))
+            variant = min(timeit.repeat(variants, number=1, repeat=NUMBER))
+            print('{0:10} {1:8} {2:10.1f} {3:12.1f} {4:8.2f}x'
+                  .format(backend, name, tag * 1000, variant * 1000,
+                          tag / variant))
+
+
+if __name__ == '__main__':
+    main()
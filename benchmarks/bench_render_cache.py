@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+"""Benchmark for the render cache.
+
+Compares constructing the same tags over and over (Ex. the navigation links
+of a page) with and without a render cache, for both renderer backends.
+"""
+
+import timeit
+
+from korona.html.root.element import set_render_cache
+from korona.html.tags import A, HR, Img
+from korona.lib.cache import RenderCache
+from korona.templates.html.renderer import BACKENDS, set_backend
+
+NUMBER = 20000
+REPEAT = 5
+
+WORKLOADS = [
+    (A, {'href': 'www.google.com', 'rel': 'nofollow', 'text': 'google'}),
+    (HR, {'align': 'center', 'size': 2}),
+    (Img, {'src': 'www.google.com/logo.png', 'alt': 'logo', 'height': 10})
+]
+
+
+def timing(function):
+    """Returns the best time (in microseconds) for a call of the
+    function.
+    """
+    return min(timeit.repeat(function, number=NUMBER,
+                             repeat=REPEAT)) / NUMBER * 1e6
+
+
+def main():
+    print('{0:6} {1:10} {2:>15} {3:>13} {4:>8}'
+          .format('tag', 'backend', 'uncached (us)', 'cached (us)',
+                  'speedup'))
+    for backend in BACKENDS:
+        set_backend(backend)
+        for tag, attributes in WORKLOADS:
+            instance = tag(**attributes)
+
+            set_render_cache(None)
+            uncached = timing(instance.construct)
+
+            cache = RenderCache()
+            set_render_cache(cache)
+            cached = timing(instance.construct)
+            set_render_cache(None)
+
+            print('{0:6} {1:10} {2:15.2f} {3:13.2f} {4:7.2f}x'
+                  .format(tag.__name__, backend, uncached, cached,
+                          uncached / cached))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+"""Benchmark for the memory used while constructing large documents.
+
+``construct()`` returns the whole document as one string, so its peak memory
+grows with the size of the document. ``render_to()`` streams the document in
+chunks and, with the rows given as a generator, its peak memory stays the
+same whatever the size of the document.
+"""
+
+import os
+import tracemalloc
+
+from korona.html.tags import A, Div, Html
+
+SIZES = [10000, 50000, 200000]
+
+
+def rows(size):
+    """Yields the rows of the document."""
+    for i in range(size):
+        yield Div(align='left',
+                  text=[A(href='www.google.com/{0}'.format(i),
+                          text='link {0}'.format(i))])
+
+
+def peak_memory(function):
+    """Returns the peak memory (in MB) allocated while running the
+    function.
+    """
+    tracemalloc.start()
+    function()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 1024.0 / 1024.0
+
+
+def main():
+    print('{0:>8} {1:>16} {2:>16}'
+          .format('rows', 'construct (MB)', 'render_to (MB)'))
+    with open(os.devnull, 'w') as devnull:
+        for size in SIZES:
+            construct = peak_memory(
+                lambda: Html(text=rows(size)).construct())
+            stream = peak_memory(
+                lambda: Html(text=rows(size)).render_to(devnull))
+            print('{0:8} {1:16.2f} {2:16.2f}'.format(size, construct, stream))
+
+
+if __name__ == '__main__':
+    main()
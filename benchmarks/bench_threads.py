@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+"""Benchmark for rendering tags from many threads.
+
+Renders a mixed workload (leaf tags, a small page and a streamed page) from
+a ``ThreadPoolExecutor`` of 1 to 32 threads and reports the throughput, for
+both renderer backends, with and without a shared render cache. On a build
+of python with the GIL the throughput cannot grow with the threads, but it
+should not drop either: a drop shows contention between the threads.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import time
+
+from korona.html.root.element import set_render_cache
+from korona.html.tags import A, Div, H1, Head, Html, Input
+from korona.lib.cache import RenderCache
+from korona.templates.html.renderer import BACKENDS, set_backend
+
+TASKS = 4000
+THREADS = [1, 2, 4, 8, 16, 32]
+
+
+def task(index):
+    """Renders the mixed workload."""
+    A(href='www.google.com', text='google', class_='link').construct()
+    Input(type='text', name='query', required=True).construct()
+    rows = [Div(text=str(row)) for row in range(10)]
+    title = H1(text='title {0}'.format(index % 10))
+    page = Html(text=[Head(), Div(align='center', text=[title] + rows)])
+    page.construct()
+    for _ in page.iter_render(chunk_size=256):
+        pass
+
+
+def throughput(threads):
+    """Returns the number of tasks rendered per second by the threads."""
+    with ThreadPoolExecutor(threads) as executor:
+        start = time.time()
+        list(executor.map(task, range(TASKS)))
+        return TASKS / (time.time() - start)
+
+
+def main():
+    print('{0:10} {1:6} {2:>8} {3:>12} {4:>9}'
+          .format('backend', 'cache', 'threads', 'tasks/s', 'scaling'))
+    for backend in BACKENDS:
+        set_backend(backend)
+        for cache in [None, RenderCache()]:
+            set_render_cache(cache)
+            base = None
+            for threads in THREADS:
+                result = throughput(threads)
+                base = base or result
+                print('{0:10} {1:6} {2:8} {3:12.0f} {4:8.2f}x'
+                      .format(backend, 'on' if cache else 'off', threads,
+                              result, result / base))
+    set_render_cache(None)
+
+
+if __name__ == '__main__':
+    main()
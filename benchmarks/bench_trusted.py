@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""Benchmark for constructing trusted tags.
+
+Compares creating (and constructing) tags with validated attributes
+(``Tag(**attributes)``) against trusted tags whose attributes are not
+validated (``Tag.trusted(**attributes)``), for both renderer backends.
+"""
+
+import timeit
+
+from korona.html.tags import A, Input
+from korona.templates.html.renderer import BACKENDS, set_backend
+
+NUMBER = 20000
+REPEAT = 5
+
+WORKLOADS = [
+    (A, {'charset': 'UTF-8',
+         'href': 'www.google.com',
+         'hreflang': 'en',
+         'rel': 'nofollow',
+         'rev': 'nofollow',
+         'shape': 'rect',
+         'coords': '1,2,3,4',
+         'target': '_blank',
+         'text': 'google'}),
+    (Input, {'type': 'number',
+             'name': 'quantity',
+             'value': '1',
+             'min': 1,
+             'max': 10,
+             'step': 1,
+             'required': True,
+             'autofocus': True})
+]
+
+
+def timing(function):
+    """Returns the best time (in microseconds) for a call of the
+    function.
+    """
+    return min(timeit.repeat(function, number=NUMBER,
+                             repeat=REPEAT)) / NUMBER * 1e6
+
+
+def main():
+    print('{0:8} {1:10} {2:>18} {3:>14} {4:>12} {5:>8}'
+          .format('tag', 'backend', 'step', 'validated (us)', 'trusted (us)',
+                  'speedup'))
+    for tag, attributes in WORKLOADS:
+        results = [
+            ('create', None,
+             timing(lambda: tag(**attributes)),
+             timing(lambda: tag.trusted(**attributes)))]
+        for backend in BACKENDS:
+            set_backend(backend)
+            results.append((
+                'create + construct', backend,
+                timing(lambda: tag(**attributes).construct()),
+                timing(lambda: tag.trusted(**attributes).construct())))
+
+        for step, backend, validated, trusted in results:
+            print('{0:8} {1:10} {2:>18} {3:14.2f} {4:12.2f} {5:7.2f}x'
+                  .format(tag.__name__, backend or '-', step, validated,
+                          trusted, validated / trusted))
+
+
+if __name__ == '__main__':
+    main()
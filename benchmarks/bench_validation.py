@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+"""Benchmark for validating the attributes of the tags.
+
+Compares the validation function compiled from the ``ATTRIBUTES`` schema of a
+tag against calling the generic validation functions one by one, and the
+input type permission table of ``Input`` against validating the input type
+of each attribute one by one.
+"""
+
+import timeit
+
+from korona.html.tags import Input, anchor, input
+from korona.lib.utils import (
+    validate_attribute_values,
+    validate_boolean_attribute,
+    validate_number_attribute,
+    validate_string_attribute,
+    validate_url
+)
+
+NUMBER = 50000
+REPEAT = 5
+
+ANCHOR = {'download': 'www.google.com/file.txt',
+          'href': 'www.google.com',
+          'rel': 'nofollow',
+          'rev': 'nofollow',
+          'shape': 'rect'}
+
+INPUT = {'autocomplete': 'on',
+         'autofocus': True,
+         'required': True,
+         'size': 4,
+         'type': 'text'}
+
+
+def validate_anchor(download, href, rel, rev, shape):
+    """Validates the anchor attributes with the generic functions."""
+    validate_url(attribute_name='download', url=download)
+    validate_url(attribute_name='href', url=href)
+    for name, value in (('rel', rel), ('rev', rev), ('shape', shape)):
+        validate_string_attribute(tag='a',
+                                  attribute_name=name,
+                                  attribute_value=value)
+        validate_attribute_values(
+            tag='a',
+            attribute_name=name,
+            attribute_value=value,
+            default_values=anchor.ATTRIBUTES[name]['values'])
+
+
+def validate_input(autocomplete, autofocus, required, size, type):
+    """Validates the input attributes with the generic functions."""
+    for name, value in (('autocomplete', autocomplete), ('type', type)):
+        validate_attribute_values(
+            tag='input',
+            attribute_name=name,
+            attribute_value=value,
+            default_values=input.ATTRIBUTES[name]['values'])
+    for name, value in (('autofocus', autofocus), ('required', required)):
+        validate_boolean_attribute(tag='input',
+                                   attribute_name=name,
+                                   attribute_value=value)
+    for name, value in (('size', size),):
+        validate_number_attribute(tag='input',
+                                  attribute_name=name,
+                                  attribute_value=value)
+
+
+INPUT_TYPES = {'type': 'text',
+               'attributes': tuple(
+                   (name, dict(INPUT, placeholder='abcd').get(name))
+                   for name in sorted(input.INPUT_TYPES_FOR_ATTRIBUTES))}
+
+TAG = Input.trusted()
+
+
+def validate_input_types(type, attributes):
+    """Validates the input type of each attribute one by one."""
+    for name, value in attributes:
+        TAG.validate_input_attribute(type=type,
+                                     attribute_name=name,
+                                     attribute_value=value)
+
+
+WORKLOADS = [
+    ('a', validate_anchor, anchor.validate_attributes, ANCHOR),
+    ('input', validate_input, input.validate_attributes, INPUT),
+    ('input types', validate_input_types, TAG.validate_input_attributes,
+     INPUT_TYPES)
+]
+
+
+def timing(function):
+    """Returns the best time (in microseconds) for a call of the
+    function.
+    """
+    return min(timeit.repeat(function, number=NUMBER,
+                             repeat=REPEAT)) / NUMBER * 1e6
+
+
+def main():
+    print('{0:12} {1:>12} {2:>13} {3:>8}'
+          .format('tag', 'generic (us)', 'compiled (us)', 'speedup'))
+    for tag, generic, compiled, attributes in WORKLOADS:
+        generic_time = timing(lambda: generic(**attributes))
+        compiled_time = timing(lambda: compiled(**attributes))
+        print('{0:12} {1:12.2f} {2:13.2f} {3:7.2f}x'
+              .format(tag, generic_time, compiled_time,
+                      generic_time / compiled_time))
+
+
+if __name__ == '__main__':
+    main()
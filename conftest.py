@@ -0,0 +1,10 @@
+# -*- coding: utf-8 -*-
+
+import sys
+
+collect_ignore = []
+
+if sys.version_info < (3, 6):
+    # The asyncio rendering needs async generators.
+    collect_ignore += ['korona/html/root/asynchronous.py',
+                       'tests/test_asynchronous.py']
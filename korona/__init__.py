@@ -10,3 +10,11 @@ from .__pkg__ import (
     __email__,
     __license__
 )
+from .lib.lazy import lazy_attributes
+
+# Attributes of the package imported on first access, by module.
+MODULES = {
+    'component': 'html.root.component'
+}
+
+__getattr__, __dir__ = lazy_attributes(__name__, MODULES, globals())
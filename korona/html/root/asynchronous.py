@@ -0,0 +1,277 @@
+# -*- coding: utf-8 -*-
+"""Asyncio rendering of the html tags.
+
+The children of a tag can be awaitables (Ex. coroutines fetching data) or
+async iterators, along with the tags and strings accepted by
+:meth:`Element.construct`. All the awaitables found in the tree are started
+concurrently as soon as the rendering starts and the tree is rendered in
+document order, so a part of the document is yielded as soon as everything
+before it is resolved.
+
+This module needs python 3.6 or newer. It is imported by
+:meth:`Element.render_async` and :meth:`Element.iter_render_async`.
+"""
+
+import asyncio
+from collections.abc import Iterator
+from concurrent.futures import Future
+from inspect import isawaitable
+
+from .element import FLUSH, Element, _END, get_render_cache
+from .placeholder import Placeholder
+from .slot import Slot
+
+
+async def render_async(nodes):
+    """Renders the given tags, strings and awaitables.
+
+    Args:
+        nodes (iterable): Nodes to render (See :func:`iter_nodes_async`).
+
+    Returns:
+        str: The rendered nodes.
+
+    .. versionadded:: 0.4.3-dev
+    """
+    return ''.join([part async for part in iter_nodes_async(nodes)])
+
+
+async def iter_nodes_async(nodes, chunk_size=None, flush_after=None):
+    """Yields the rendered parts of the given nodes and of their children in
+    document order. The awaitables are resolved concurrently, but a part is
+    only yielded once all the parts before it are rendered.
+
+    Args:
+        nodes (iterable): Tags, strings, awaitables, async iterators, lists
+            (or iterators) of them and other values, which are rendered as
+            strings. ``None`` is skipped. An awaitable or an async iterator
+            can give any of these nodes.
+        chunk_size (int): If given, the rendered parts are buffered and
+            yielded in chunks of at least this many characters. The buffer is
+            also yielded before waiting for an awaitable or an async
+            iterator and at the flush points, so the parts which are ready
+            are never held back.
+        flush_after (set): Names of the tags after which the buffered chunk
+            is yielded (See :data:`korona.html.root.element.FLUSH`).
+
+    The fragments of the placeholders (See
+    :class:`korona.html.root.placeholder.Placeholder`) are resolved with the
+    other awaitables and written at the end, in the order they are ready.
+
+    .. versionadded:: 0.4.3-dev
+    """
+    tasks = {}
+    schedule(nodes, tasks)
+
+    buffer = []
+    size = 0
+    stack = [iter(nodes)]
+    pop = stack.pop
+    push = stack.append
+    placeholders = []
+    swapped = False
+
+    try:
+        while stack or placeholders:
+            if not stack:
+                if buffer:
+                    yield ''.join(buffer)
+                    buffer = []
+                    size = 0
+                placeholder, task = await pop_completed(placeholders)
+                push(iter(placeholder.get_swap(task.result(),
+                                               first=not swapped) + [FLUSH]))
+                swapped = True
+                continue
+
+            top = stack[-1]
+            if isinstance(top, AsyncChildren):
+                if buffer:
+                    yield ''.join(buffer)
+                    buffer = []
+                    size = 0
+                node = await top.next()
+            else:
+                node = next(top, _END)
+
+            if node is _END:
+                pop()
+                continue
+
+            if isinstance(node, Element):
+                children = get_children(node)
+                flush = flush_after and node.tag in flush_after
+                if children is None:
+                    part = render_leaf(node)
+                    if flush:
+                        push(iter((FLUSH,)))
+                else:
+                    part, closing = node.template.render_parts(node._values)
+                    push(iter((closing, FLUSH) if flush else (closing,)))
+                    push(iter(children))
+            elif node is FLUSH:
+                if buffer:
+                    yield ''.join(buffer)
+                    buffer = []
+                    size = 0
+                continue
+            elif isinstance(node, str):
+                part = node
+            elif isinstance(node, (list, tuple, Iterator)):
+                push(iter(node))
+                continue
+            elif isawaitable(node):
+                task = tasks.pop(id(node), None)
+                if task is None:
+                    task = asyncio.ensure_future(resolve(node, tasks))
+                if buffer and not task.done():
+                    yield ''.join(buffer)
+                    buffer = []
+                    size = 0
+                push(iter((await task,)))
+                continue
+            elif isinstance(node, Placeholder):
+                placeholders.append((node, get_task(node.fragment, tasks)))
+                push(iter((node.slot,)))
+                continue
+            elif isinstance(node, Slot):
+                push(iter((node.default,)))
+                continue
+            elif hasattr(node, '__aiter__'):
+                push(AsyncChildren(node))
+                continue
+            elif node is None:
+                continue
+            else:
+                part = str(node)
+
+            if not chunk_size:
+                yield part
+                continue
+
+            buffer.append(part)
+            size += len(part)
+            if size >= chunk_size:
+                yield ''.join(buffer)
+                buffer = []
+                size = 0
+
+        if buffer:
+            yield ''.join(buffer)
+    finally:
+        # The tasks which were not awaited (Ex. after an error) are
+        # cancelled, and the errors of the finished ones are discarded.
+        for task in list(tasks.values()) + [task for _, task in placeholders]:
+            if not task.cancel() and not task.cancelled():
+                task.exception()
+
+
+def get_task(fragment, tasks):
+    """Returns the future of the fragment of a placeholder."""
+    if isawaitable(fragment):
+        task = tasks.pop(id(fragment), None)
+        if task is None:
+            task = asyncio.ensure_future(resolve(fragment, tasks))
+        return task
+
+    if isinstance(fragment, Future):
+        return asyncio.wrap_future(fragment)
+
+    future = asyncio.get_event_loop().create_future()
+    future.set_result(fragment)
+    return future
+
+
+async def pop_completed(placeholders):
+    """Waits for one of the placeholders to be ready and removes it from the
+    list. The placeholders which are ready are taken in order.
+
+    Args:
+        placeholders (list): The pending placeholders and their futures.
+
+    Returns:
+        tuple: The placeholder which is ready and its future.
+    """
+    if not any(task.done() for _, task in placeholders):
+        await asyncio.wait([task for _, task in placeholders],
+                           return_when=asyncio.FIRST_COMPLETED)
+
+    for index, (_, task) in enumerate(placeholders):
+        if task.done():
+            return placeholders.pop(index)
+
+
+def get_children(node):
+    """Returns the children of a tag, including an awaitable or an async
+    iterator given as its text.
+    """
+    children = node.children
+    if children is None:
+        text = node._values.get('text')
+        if isawaitable(text) or hasattr(text, '__aiter__'):
+            return (text,)
+    return children
+
+
+def render_leaf(node):
+    """Renders a tag without child tags."""
+    cache = get_render_cache()
+    if cache is not None:
+        return cache.render(node.__class__, node._values,
+                            node.template.render)
+    return node.template.render(node._values)
+
+
+def schedule(nodes, tasks):
+    """Starts resolving the awaitables found in the given nodes and in the
+    children of their tags. The iterators and async iterators are not
+    scanned, as that would consume them.
+
+    Args:
+        nodes (iterable): Nodes to scan.
+        tasks (dict): Tasks of the awaitables by the id of the awaitable.
+    """
+    stack = [iter(nodes)]
+    while stack:
+        node = next(stack[-1], _END)
+
+        if node is _END:
+            stack.pop()
+        elif isinstance(node, Element):
+            text = node._values.get('text')
+            if text is not None and not isinstance(text, str):
+                stack.append(iter((text,)))
+        elif isinstance(node, (list, tuple)):
+            stack.append(iter(node))
+        elif isinstance(node, Placeholder):
+            stack.append(iter((node.fragment, node.slot)))
+        elif isawaitable(node) and id(node) not in tasks:
+            tasks[id(node)] = asyncio.ensure_future(resolve(node, tasks))
+
+
+async def resolve(awaitable, tasks):
+    """Awaits the awaitable and starts resolving the awaitables of the node
+    it gives.
+    """
+    node = await awaitable
+    schedule((node,), tasks)
+    return node
+
+
+class AsyncChildren(object):
+    """Async iterator over the children of a tag.
+
+    Args:
+        iterable: The async iterable.
+    """
+    def __init__(self, iterable):
+        self.iterator = iterable.__aiter__()
+
+    async def next(self):
+        """Returns the next child, or ``_END`` once there are no more
+        children.
+        """
+        try:
+            return await self.iterator.__anext__()
+        except StopAsyncIteration:
+            return _END
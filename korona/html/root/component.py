@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+"""Components: functions producing tags, memoized on their arguments."""
+
+import functools
+
+from ...lib.cache import RenderCache
+from .element import Element, iter_nodes
+
+# Default size limit of the cache of a component, in bytes.
+MAX_SIZE = 1024 * 1024
+
+
+def component(function=None, max_size=MAX_SIZE):
+    """Decorator turning a function which returns tags (Ex. a product card or
+    a navigation bar) into a :class:`Component`. The component returns the
+    constructed tags, which are cached under the arguments of the call, so
+    that the function is only called and its tags constructed once for the
+    same arguments.
+
+    Args:
+        function (function): The function returning a tag, or tags and
+            strings (As the text of a tag).
+        max_size (int): Size limit of the cached strings of the component, in
+            bytes.
+
+    Returns:
+        Component: The component.
+
+    Example::
+
+        @korona.component(max_size=64 * 1024)
+        def product_card(name, price):
+            return Div(text=[H1(text=name), Cite(text=price)])
+
+        Div(text=[product_card(name, price) for name, price in products])
+
+    .. versionadded:: 0.4.3-dev
+    """
+    if function is None:
+        return functools.partial(component, max_size=max_size)
+    return Component(function, max_size)
+
+
+class Component(object):
+    """Function returning tags, whose constructed tags are cached under the
+    arguments of the call in a least recently used cache (See
+    :class:`korona.lib.cache.RenderCache`). It is created by
+    :func:`component`.
+
+    The arguments are the props of the component: they should be immutable
+    values, as the constructed tags are not updated when they change. The
+    calls with arguments which are not hashable, or which are tags, are not
+    cached. The type of an argument is part of the cache key as equal values
+    of different types are rendered differently (Ex. ``1`` and ``True``).
+
+    Args:
+        function (function): The function returning tags.
+        max_size (int): Size limit of the cached strings in bytes.
+
+    .. versionadded:: 0.4.3-dev
+    """
+    def __init__(self, function, max_size=MAX_SIZE):
+        self.function = function
+        self.cache = RenderCache(max_size)
+        functools.update_wrapper(self, function)
+
+    def __call__(self, *args, **kwargs):
+        """Returns the constructed tags of the function called with the given
+        arguments, from the cache if they were already constructed.
+
+        Returns:
+            str: The constructed tags.
+        """
+        key = self.get_key(args, kwargs)
+        if key is None:
+            return self.render(*args, **kwargs)
+
+        value = self.cache.get(key)
+        if value is None:
+            value = self.render(*args, **kwargs)
+            self.cache.set(key, value)
+        return value
+
+    @staticmethod
+    def get_key(args, kwargs):
+        """Returns the cache key of the arguments of a call, or ``None`` if
+        the call cannot be cached.
+        """
+        values = args + tuple(kwargs.values())
+        if any(isinstance(value, Element) for value in values):
+            return None
+
+        try:
+            key = (tuple((value.__class__, value) for value in args),
+                   frozenset((name, value.__class__, value)
+                             for name, value in kwargs.items()))
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def render(self, *args, **kwargs):
+        """Returns the constructed tags of the function called with the given
+        arguments, without the cache.
+        """
+        return ''.join(iter_nodes((self.function(*args, **kwargs),)))
+
+    def invalidate(self, *args, **kwargs):
+        """Removes the cached tags of the call with the given arguments, or
+        all the cached tags of the component if no arguments are given. The
+        counters of the cache are kept.
+
+        Returns:
+            bool: Whether some tags were cached.
+        """
+        if not args and not kwargs:
+            cached = len(self.cache) > 0
+            self.cache.clear(reset_counters=False)
+            return cached
+
+        key = self.get_key(args, kwargs)
+        return key is not None and self.cache.remove(key)
+
+    def info(self):
+        """Returns the counters of the cache of the component.
+
+        Returns:
+            CacheInfo: The hits, misses, number of entries, size and size
+            limit of the cache (See :class:`korona.lib.cache.CacheInfo`).
+        """
+        return self.cache.info()
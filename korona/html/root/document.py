@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""Builder writing html documents directly to an output stream."""
+
+from contextlib import contextmanager
+import io
+
+from .element import CHUNK_SIZE, FLUSH, FLUSH_AFTER, Element, iter_nodes
+
+
+class Document(object):
+    """Builder for writing an html document to a file-like object without
+    building a tree of tags. The opening tag of a tag is written when its
+    ``with`` block is entered and the closing tag when the block is exited,
+    so the memory used is bounded by the output buffer whatever the size of
+    the document.
+
+    Args:
+        fp (file): File-like object with a ``write`` method. Defaults to an
+            in-memory text buffer (See :meth:`getvalue`).
+        chunk_size (int): Number of characters buffered before writing.
+        encoding (str): If given, the chunks are encoded before writing (Ex.
+            for files opened in binary mode).
+        flush_after (set): Names of the tags after which the buffered output
+            is written. Defaults to
+            :data:`korona.html.root.element.FLUSH_AFTER`.
+
+    Example::
+
+        with Document(fp) as doc:
+            with doc.tag(Html):
+                with doc.tag(Div, align='center'):
+                    for row in rows:
+                        doc.write(Div(text=row))
+
+    .. versionadded:: 0.4.3-dev
+    """
+    def __init__(self,
+                 fp=None,
+                 chunk_size=CHUNK_SIZE,
+                 encoding=None,
+                 flush_after=FLUSH_AFTER):
+        self.fp = io.StringIO() if fp is None else fp
+        self.chunk_size = chunk_size
+        self.encoding = encoding
+        self.flush_after = flush_after
+        self._buffer = []
+        self._size = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.flush()
+
+    @contextmanager
+    def tag(self, tag, **attributes):
+        """Writes a tag around the output of the ``with`` block. The text (or
+        children) of the tag is written right after its opening tag.
+
+        Args:
+            tag (type): The tag class (Ex. ``Div``) or a tag.
+            attributes (dict): The tag attributes (As in
+                ``Tag(**attributes)``) if a tag class is given.
+
+        Yields:
+            Element: The tag.
+        """
+        if isinstance(tag, Element):
+            if attributes:
+                raise TypeError('Attributes can only be given with a tag '
+                                'class')
+            element = tag
+        else:
+            element = tag(**attributes)
+
+        opening, closing = element.template.render_parts(element._values)
+        self._append(opening)
+        text = element._values.get('text')
+        if text:
+            self.write(text)
+
+        yield element
+
+        self._append(closing)
+        if self.flush_after and element.tag in self.flush_after:
+            self.flush()
+
+    def write(self, *nodes):
+        """Writes the given tags and strings (See
+        :func:`korona.html.root.element.iter_nodes`) to the document. The
+        buffered output is written at the flush points.
+        """
+        for part in iter_nodes(nodes, self.flush_after):
+            self._append(part)
+
+    def _append(self, part):
+        """Adds a rendered part to the buffer, writing the buffer once it
+        holds at least ``chunk_size`` characters or at a flush point.
+        """
+        if part is FLUSH:
+            self.flush()
+            return
+
+        if not part:
+            return
+
+        self._buffer.append(part)
+        self._size += len(part)
+        if self._size >= self.chunk_size:
+            self.flush()
+
+    def flush(self):
+        """Writes the buffered output to the file-like object."""
+        if not self._buffer:
+            return
+
+        chunk = ''.join(self._buffer)
+        self._buffer = []
+        self._size = 0
+        self.fp.write(chunk.encode(self.encoding) if self.encoding else chunk)
+
+    def getvalue(self):
+        """Returns the document written to the default in-memory buffer."""
+        self.flush()
+        return self.fp.getvalue()
@@ -0,0 +1,678 @@
+# -*- coding: utf-8 -*-
+"""Base class for the html tags."""
+
+try:
+    from collections.abc import Iterator, MutableMapping
+    from inspect import getfullargspec as getargspec
+except ImportError:  # pragma: no cover
+    from collections import Iterator, MutableMapping
+    from inspect import getargspec
+
+from ...exceptions import TagAttributeError
+from .global_attributes import (
+    GLOBAL_ATTRIBUTE_NAMES,
+    validate_global_attributes
+)
+from .placeholder import Placeholder, pop_completed
+from .slot import Slot
+
+# Number of characters buffered by :meth:`Element.render_to` before writing.
+CHUNK_SIZE = 16384
+
+# Tags after which the streamed output is flushed by default, so the browser
+# can start fetching the resources of the page (Ex. the stylesheets of the
+# head) while the rest of it is rendered.
+FLUSH_AFTER = frozenset(['head'])
+
+_END = object()
+
+# Render cache of the leaf tags (See :func:`set_render_cache`).
+_render_cache = None
+
+
+def get_render_cache():
+    """Returns the render cache used for constructing the tags, or ``None`` if
+    the tags are not cached.
+    """
+    return _render_cache
+
+
+def set_render_cache(cache):
+    """Sets the render cache used for constructing the tags in this process.
+    Only the tags without child tags are cached.
+
+    Args:
+        cache (RenderCache): The cache (See
+            :class:`korona.lib.cache.RenderCache`) or ``None`` for disabling
+            the caching.
+
+    .. versionadded:: 0.4.3-dev
+    """
+    global _render_cache
+
+    _render_cache = cache
+
+
+class FlushPoint(str):
+    """Empty string marking a point where the streamed output is flushed (See
+    :data:`FLUSH`).
+
+    .. versionadded:: 0.4.3-dev
+    """
+    __slots__ = ()
+
+
+# Flush point, which can be given as a child of a tag. When a tag is streamed
+# in chunks, the output buffered before a flush point is yielded as soon as
+# the flush point is reached. It is rendered as an empty string.
+FLUSH = FlushPoint()
+
+
+def iter_nodes(nodes, flush_after=None):
+    """Yields the rendered parts of the given tags and strings, and of their
+    children, in document order.
+
+    The slots of the placeholders (See
+    :class:`korona.html.root.placeholder.Placeholder`) are rendered in
+    document order and their fragments at the end, in the order they are
+    ready. :data:`FLUSH` is yielded before waiting for a fragment and after
+    every fragment. The slots (See :class:`korona.html.root.slot.Slot`) are
+    rendered as their defaults.
+
+    Args:
+        nodes (iterable): Tags, strings, placeholders, slots, lists (or
+            iterators) of them and other values, which are rendered as
+            strings. ``None`` is skipped.
+        flush_after (set): Names of the tags after which :data:`FLUSH` is
+            yielded.
+
+    .. versionadded:: 0.4.3-dev
+    """
+    # Stack of iterators over the nodes still to be rendered. The closing
+    # tag of an element is pushed below the iterator over its children.
+    stack = [iter(nodes)]
+    pop = stack.pop
+    push = stack.append
+    placeholders = []
+    swapped = False
+
+    while stack or placeholders:
+        if not stack:
+            if not any(placeholder.done() for placeholder in placeholders):
+                yield FLUSH
+            placeholder = pop_completed(placeholders)
+            push(iter(placeholder.get_swap(placeholder.result(),
+                                           first=not swapped) + [FLUSH]))
+            swapped = True
+            continue
+
+        node = next(stack[-1], _END)
+
+        if node is _END:
+            pop()
+        elif isinstance(node, Element):
+            children = node.children
+            if children is None:
+                if _render_cache is not None:
+                    yield _render_cache.render(node.__class__, node._values,
+                                               node.template.render)
+                else:
+                    yield node.template.render(node._values)
+                if flush_after and node.tag in flush_after:
+                    yield FLUSH
+            else:
+                opening, closing = node.template.render_parts(node._values)
+                yield opening
+                if flush_after and node.tag in flush_after:
+                    push(iter((closing, FLUSH)))
+                else:
+                    push(iter((closing,)))
+                push(iter(children))
+        elif isinstance(node, str):
+            yield node
+        elif isinstance(node, (list, tuple, Iterator)):
+            push(iter(node))
+        elif isinstance(node, Placeholder):
+            placeholders.append(node)
+            push(iter((node.slot,)))
+        elif isinstance(node, Slot):
+            push(iter((node.default,)))
+        elif node is not None:
+            yield str(node)
+
+
+def iter_chunks(parts, chunk_size=None):
+    """Yields the rendered parts buffered in chunks of at least
+    ``chunk_size`` characters. The buffered chunk is also yielded at the
+    :data:`FLUSH` parts. If ``chunk_size`` is not given, the parts are yielded
+    as they are, without the flush points.
+
+    .. versionadded:: 0.4.3-dev
+    """
+    if not chunk_size:
+        for part in parts:
+            if part is not FLUSH:
+                yield part
+        return
+
+    buffer = []
+    size = 0
+    for part in parts:
+        if part is FLUSH:
+            if buffer:
+                yield ''.join(buffer)
+                buffer = []
+                size = 0
+            continue
+
+        buffer.append(part)
+        size += len(part)
+        if size >= chunk_size:
+            yield ''.join(buffer)
+            buffer = []
+            size = 0
+
+    if buffer:
+        yield ''.join(buffer)
+
+
+def restore_element(tag_class, values):
+    """Returns a tag of the given class with the given attribute values. It
+    is used for unpickling the tags.
+
+    .. versionadded:: 0.4.3-dev
+    """
+    tag = tag_class.__new__(tag_class)
+    tag.tag = tag_class.template.tag
+    tag._values = values
+    return tag
+
+
+class AttributeValues(MutableMapping):
+    """Values of all the attributes of a tag (See :attr:`Element.values`),
+    read from and written to the attributes which are set. The attributes
+    which are not set have their default values, and setting an attribute to
+    ``None`` or ``False`` unsets it. The values are not validated.
+
+    Args:
+        tag (Element): The tag.
+
+    .. versionadded:: 0.4.3-dev
+    """
+    __slots__ = ('_tag',)
+
+    def __init__(self, tag):
+        self._tag = tag
+
+    def __getitem__(self, name):
+        values = self._tag._values
+        if name in values:
+            return values[name]
+        return self._tag._get_defaults()[name]
+
+    def __setitem__(self, name, value):
+        if value is None or value is False:
+            self._tag._values.pop(name, None)
+        else:
+            self._tag._values[name] = value
+
+    def __delitem__(self, name):
+        if name not in self:
+            raise KeyError(name)
+        self._tag._values.pop(name, None)
+
+    def __iter__(self):
+        defaults = self._tag._get_defaults()
+        for name in defaults:
+            yield name
+        for name in self._tag._values:
+            if name not in defaults:
+                yield name
+
+    def __len__(self):
+        defaults = self._tag._get_defaults()
+        return len(defaults) + sum(1 for name in self._tag._values
+                                   if name not in defaults)
+
+    def __repr__(self):
+        return repr(dict(self))
+
+
+class Element(object):
+    """Base class for constructing html tags. Every tag class defines the
+    template used for rendering it and stores its attribute values in
+    ``values``.
+
+    The text of a tag can be a string, a child tag or a list (or an iterator)
+    of strings and child tags. A tag with child tags is constructed by walking
+    the tree once and writing every tag into a single buffer, so the cost of
+    constructing a page grows linearly with its size whatever its depth. The
+    same walk can stream the tag in chunks (See :meth:`iter_render` and
+    :meth:`render_to`).
+
+    Every tag also accepts the global attributes (Ex. ``id``, ``class_`` and
+    ``style``) as keyword arguments. They are validated once and rendered by
+    the template of the tag in the same pass as its other attributes.
+
+    Only the attributes which are set are stored in a tag (See
+    :attr:`values`), and the tags have no instance dictionary, so large trees
+    of tags can be held in memory before they are constructed.
+
+    .. versionadded:: 0.4.3-dev
+    """
+    __slots__ = ('tag', '_values')
+
+    template = None
+
+    def __reduce__(self):
+        # Compact pickled form of the tag: the class and the attributes which
+        # are set (See :func:`korona.html.root.parallel.render_parallel`).
+        return restore_element, (self.__class__, self._values)
+
+    @property
+    def values(self):
+        """Returns the values of all the attributes of the tag, as a mapping
+        of the attributes which are set (See :class:`AttributeValues`).
+        Changing a value of the mapping changes the tag.
+        """
+        return AttributeValues(self)
+
+    @values.setter
+    def values(self, values):
+        # The attributes which are not set are not rendered, so only the
+        # other ones are stored.
+        self._values = {name: value for name, value in values.items()
+                        if value is not None and value is not False}
+
+    def set_global_attributes(self, attributes):
+        """Validates the global attributes of the tag and adds them to its
+        values. The class attribute can be given as ``class_``.
+
+        Args:
+            attributes (dict): Values of the global attributes by attribute
+                name.
+
+        .. versionadded:: 0.4.3-dev
+        """
+        if not attributes:
+            return
+
+        values = self._get_global_values(attributes)
+        if values:
+            validate_global_attributes(self.tag, values)
+            self._values.update(values)
+
+    @classmethod
+    def _get_global_values(cls, attributes, function=None):
+        """Returns the values of the global attributes by attribute name,
+        leaving out the empty ones as they are not rendered. Raises the same
+        error as python for an unknown keyword argument of the function.
+        """
+        values = {}
+        for name, value in attributes.items():
+            if name == 'class_':
+                name = 'class'
+            elif name not in GLOBAL_ATTRIBUTE_NAMES:
+                raise TypeError('{0}() got an unexpected keyword argument '
+                                '{1!r}'.format(function or cls.__name__,
+                                               name))
+            if value is not None and value is not False:
+                values[name] = value
+        return values
+
+    @property
+    def children(self):
+        """Returns the child tags and strings of the tag, or ``None`` if the
+        tag only has a text.
+        """
+        return self._get_children(self._values.get('text'))
+
+    @staticmethod
+    def _get_children(text):
+        """Returns the child tags and strings of a tag from its text, or
+        ``None`` if it is only a text.
+        """
+        if text is None or isinstance(text, str):
+            return None
+
+        if isinstance(text, (Element, Placeholder, Slot)):
+            return [text]
+
+        if isinstance(text, (list, tuple, Iterator)):
+            return text
+
+        return None
+
+    def append(self, *children):
+        """Appends child tags or strings to the tag.
+
+        Returns:
+            Element: The tag itself.
+        """
+        if not self.template.text:
+            raise TagAttributeError('<{tag}>: tag cannot have children.'
+                                    .format(tag=self.tag))
+
+        text = self._values.get('text')
+
+        if isinstance(text, list):
+            nodes = text
+        elif text or isinstance(text, Iterator):
+            nodes = [text]
+        else:
+            nodes = []
+
+        nodes.extend(children)
+        self._values['text'] = nodes
+        return self
+
+    def construct(self):
+        """Returns the constructed tag."""
+        if self.children is None:
+            if _render_cache is not None:
+                return _render_cache.render(self.__class__, self._values,
+                                            self.template.render)
+            return self.template.render(self._values)
+        return ''.join(self._iter_render())
+
+    def iter_render(self, chunk_size=None, flush_after=FLUSH_AFTER):
+        """Constructs the tag as a stream of chunks. Every opening tag is
+        yielded as soon as it is rendered, before any of its children. The
+        children can be given as iterators (Ex. generators) which are only
+        consumed while the tag is rendered, so the whole document never has
+        to be held in memory.
+
+        The chunks are also yielded at the flush points: after the tags in
+        ``flush_after`` (Ex. ``<head>``) and at the :data:`FLUSH` children.
+
+        Args:
+            chunk_size (int): If given, the rendered parts are buffered and
+                yielded in chunks of at least this many characters.
+            flush_after (set): Names of the tags after which the buffered
+                chunk is yielded. Defaults to :data:`FLUSH_AFTER`.
+
+        Yields:
+            str: The chunks of the constructed tag.
+
+        .. versionadded:: 0.4.3-dev
+        """
+        if not chunk_size:
+            parts = self._iter_render()
+        else:
+            parts = iter_nodes((self,), flush_after)
+
+        for chunk in iter_chunks(parts, chunk_size):
+            yield chunk
+
+    def render_to(self,
+                  fp,
+                  chunk_size=CHUNK_SIZE,
+                  encoding=None,
+                  flush_after=FLUSH_AFTER):
+        """Constructs the tag and writes it to a file-like object in chunks.
+
+        Args:
+            fp (file): File-like object with a ``write`` method.
+            chunk_size (int): Number of characters buffered before writing.
+            encoding (str): If given, the chunks are encoded before writing
+                (Ex. for files opened in binary mode).
+            flush_after (set): Names of the tags after which the buffered
+                chunk is written (See :meth:`iter_render`).
+
+        .. versionadded:: 0.4.3-dev
+        """
+        write = fp.write
+        for chunk in self.iter_render(chunk_size=chunk_size,
+                                      flush_after=flush_after):
+            write(chunk.encode(encoding) if encoding else chunk)
+
+    def render_async(self):
+        """Constructs the tag with asyncio. The children of the tag can also
+        be awaitables (Ex. coroutines) or async iterators, which give child
+        tags and strings. The awaitables are resolved concurrently.
+
+        Requires python 3.6 or newer.
+
+        Returns:
+            coroutine: The coroutine returning the constructed tag.
+
+        .. versionadded:: 0.4.3-dev
+        """
+        from .asynchronous import render_async
+        return render_async((self,))
+
+    def iter_render_async(self, chunk_size=None, flush_after=FLUSH_AFTER):
+        """Constructs the tag with asyncio as an async iterator of chunks (See
+        :meth:`render_async`). A chunk is yielded as soon as all the parts of
+        the tag before it are rendered, while the awaitables after it are
+        still being resolved.
+
+        Requires python 3.6 or newer.
+
+        Args:
+            chunk_size (int): If given, the rendered parts are buffered and
+                yielded in chunks of at least this many characters, before
+                waiting for an awaitable or at a flush point.
+            flush_after (set): Names of the tags after which the buffered
+                chunk is yielded (See :meth:`iter_render`).
+
+        Returns:
+            async iterator: The chunks of the constructed tag.
+
+        .. versionadded:: 0.4.3-dev
+        """
+        from .asynchronous import iter_nodes_async
+        return iter_nodes_async((self,), chunk_size=chunk_size,
+                                flush_after=flush_after)
+
+    def _iter_render(self):
+        """Yields the rendered parts of the tag and of its children in
+        document order.
+        """
+        return iter_nodes((self,))
+
+    @classmethod
+    def trusted(cls, **attributes):
+        """Creates the tag without validating its attributes. It is meant for
+        attributes which are already validated (Ex. by the application
+        upstream), as invalid attributes are rendered as they are.
+
+        Args:
+            attributes (dict): The tag attributes (As in
+                ``Tag(**attributes)``).
+
+        Returns:
+            Element: The tag.
+
+        .. versionadded:: 0.4.3-dev
+        """
+        return cls._from_values(cls._get_trusted_values(
+            attributes, cls._get_defaults()))
+
+    @classmethod
+    def _from_values(cls, values):
+        """Creates the tag from attribute values which are not validated
+        again (Ex. the values of a trusted or an already validated tag).
+        """
+        tag = cls.__new__(cls)
+        tag.tag = cls.template.tag
+        tag._values = values
+        return tag
+
+    @classmethod
+    def _get_trusted_values(cls, attributes, defaults):
+        """Returns the values of the attributes which are set for a trusted
+        tag, without validating them.
+        """
+        values = defaults.copy()
+        values.update(attributes)
+
+        global_values = None
+        if len(values) != len(defaults):
+            global_values = cls._get_global_values(
+                dict((name, values.pop(name))
+                     for name in sorted(set(attributes) - set(defaults))),
+                function='{0}.trusted'.format(cls.__name__))
+
+        values = cls._format_values(values)
+        values = {name: value for name, value in values.items()
+                  if value is not None and value is not False}
+        if global_values:
+            values.update(global_values)
+        return values
+
+    @classmethod
+    def with_slots(cls, **attributes):
+        """Creates the tag with slots (See
+        :class:`korona.html.root.slot.Slot`) as some of its attribute
+        values, which are filled when the tag is rendered by a render plan or
+        a fragment function. The attributes are validated as in
+        ``Tag(**attributes)`` with the defaults of the slots in place of the
+        slots, so an attribute which other attributes depend on (Ex. the href
+        of a link with a rel) needs a default. The values filling the slots
+        are not validated.
+
+        Args:
+            attributes (dict): The tag attributes (As in
+                ``Tag(**attributes)``).
+
+        Returns:
+            Element: The tag.
+
+        Example::
+
+            A.with_slots(href=Slot('href', default='/'), text=Slot('title'))
+
+        .. versionadded:: 0.4.3-dev
+        """
+        slots = {}
+        values = {}
+        for name, value in attributes.items():
+            if isinstance(value, Slot):
+                slots['class' if name == 'class_' else name] = value
+                value = value.default
+            values[name] = value
+
+        tag = cls(**values)
+        tag._values.update(slots)
+        return tag
+
+    @classmethod
+    def prototype(cls, **attributes):
+        """Returns a prototype of the tag, from which variants differing in a
+        few attributes are created without validating and rendering the
+        shared attributes again (Ex. ``proto.with_(href=url, text=label)``).
+
+        Args:
+            attributes (dict): The attributes shared by the variants (As in
+                ``Tag(**attributes)``).
+
+        Returns:
+            Prototype: The prototype (See
+            :class:`korona.html.root.prototype.Prototype`).
+
+        .. versionadded:: 0.4.3-dev
+        """
+        from .prototype import Prototype
+        return Prototype(cls, attributes)
+
+    def _validate_variant(self, changes):
+        """Validates the attributes changed in a variant of a prototype, the
+        other values of the tag being already validated. Returns ``False`` if
+        the attributes cannot be validated on their own, in which case the
+        variant is validated in full. Only the text can be changed on its own
+        by default.
+
+        Args:
+            changes (dict): The changed attributes (Without the global
+                attributes).
+
+        Returns:
+            bool: Whether the changed attributes are validated.
+        """
+        return len(changes) == 1 and 'text' in changes
+
+    @classmethod
+    def _get_defaults(cls):
+        """Returns the default values of the tag attributes, taken from the
+        arguments of the tag class.
+        """
+        defaults = cls.__dict__.get('_defaults')
+        if defaults is None:
+            spec = getargspec(cls.__init__)
+            names = spec.args[1:]
+            values = list(spec.defaults or ())
+            values = [None] * (len(names) - len(values)) + values
+            defaults = dict(zip(names, values))
+            cls._defaults = defaults
+        return defaults
+
+    @classmethod
+    def _format_values(cls, values):
+        """Formats the values of a trusted tag the same way as the tag class
+        does after validating them.
+        """
+        return values
+
+    @classmethod
+    def construct_many(cls, rows, separator=None, trusted=False):
+        """Validates and constructs a tag for every dictionary of attributes
+        in the given rows. Every row is validated by the tag class and
+        rendered as in ``Tag(**row).construct()``, so constructing the tags
+        in bulk is a convenience rather than a faster path. The rows of
+        trusted tags are rendered from their attribute values, and only the
+        rows with child tags create a tag.
+
+        Args:
+            rows (iterable): Dictionaries of the tag attributes (As in
+                ``Tag(**row)``).
+            separator (str): If given, the constructed tags are joined with
+                the separator.
+            trusted (bool): If ``True``, the attributes are not validated
+                (See :meth:`trusted`).
+
+        Returns:
+            mixed: A generator of the constructed tags, or a string if the
+            separator is given.
+        """
+        tags = cls._construct_many(rows, trusted)
+        if separator is None:
+            return tags
+        return separator.join(tags)
+
+    @classmethod
+    def _construct_many(cls, rows, trusted=False):
+        """Yields the constructed tags for the given rows."""
+        render = cls.template.get_renderer()
+        cache = _render_cache
+        defaults = cls._get_defaults() if trusted else None
+        for row in rows:
+            if trusted:
+                values = cls._get_trusted_values(row, defaults)
+            else:
+                values = cls(**row)._values
+
+            if cls._get_children(values.get('text')) is None:
+                if cache is not None:
+                    yield cache.render(cls, values, render)
+                else:
+                    yield render(values)
+            else:
+                yield cls._from_values(values).construct()
+
+
+class TextElement(Element):
+    """Base class for the tags which only have a text or child tags (Ex.
+    <abbr>text</abbr>). The tag classes only define their template.
+
+    Args:
+        text (str): Text of the tag.
+
+    .. versionadded:: 0.4.3-dev
+    """
+    __slots__ = ()
+
+    def __init__(self, text=None, **global_attributes):
+        self.tag = self.template.tag
+        self.values = {'text': text}
+        self.set_global_attributes(global_attributes)
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+"""Compilation of trees of tags with slots into python functions."""
+
+import keyword
+import re
+
+try:
+    from html import escape
+except ImportError:  # pragma: no cover
+    from cgi import escape
+
+from .element import FLUSH, iter_nodes
+from .plan import AttributeSlot, compile_plan
+from .slot import Slot
+
+SLOT_NAME_PATTERN = re.compile('^[A-Za-z][A-Za-z0-9_]*$')
+
+
+def compile_fragment(tree, escape_values=False):
+    """Compiles a tree of tags with slots (See
+    :class:`korona.html.root.slot.Slot`) into a python function taking the
+    values of the slots as arguments. The tags of the tree are validated and
+    rendered once, when the fragment is compiled, and the function only joins
+    the rendered parts of the tree with the values of the slots, so it renders
+    the fragment at about the speed of string formatting.
+
+    The slots can be children of the tags or attribute values (See
+    :meth:`korona.html.root.element.Element.with_slots`). A slot without a
+    default is a required argument of the function. The values of the slots
+    are not validated: the strings are written as they are, or escaped if
+    ``escape_values`` is set, and the tags and lists of tags and strings
+    given to the child slots are rendered as html.
+
+    Args:
+        tree (Element): The tag.
+        escape_values (bool): Whether the string values of the slots are
+            html-escaped or not.
+
+    Returns:
+        function: The function rendering the fragment.
+
+    Example::
+
+        render_card = compile_fragment(
+            Div(text=A.with_slots(href=Slot('href'), text=Slot('title'))))
+        render_card(title='Home', href='/')
+
+    .. versionadded:: 0.4.3-dev
+    """
+    plan = compile_plan(tree, flush_after=())
+    namespace = {'_str': str,
+                 '_escape': escape,
+                 '_iter_nodes': iter_nodes}
+    required = []
+    optional = []
+    body = []
+    previous = None
+
+    for part in plan.parts:
+        if part is FLUSH:
+            continue
+
+        if isinstance(part, Slot) and part.name not in required and \
+                part.name not in optional:
+            check_slot_name(part.name)
+            if part.default is None:
+                required.append(part.name)
+            else:
+                optional.append(part.name)
+                namespace['_default_{0}'.format(part.name)] = part.default
+
+        if isinstance(part, AttributeSlot):
+            value = '_str({0})'.format(part.name)
+            if escape_values:
+                value = '_escape({0}, True)'.format(value)
+            if not part.separator:
+                body.extend([
+                    '    if {0}:'.format(part.name),
+                    "        _append({0!r} + {1} + '\" ')".format(
+                        part.attribute + '="', value)])
+            else:
+                # The space after the name of the tag is rendered by the
+                # first attribute slot which is filled (See
+                # :func:`korona.html.root.plan.split_attribute_slots`).
+                if not isinstance(previous, AttributeSlot):
+                    body.append('    _separator = {0!r}'.format(
+                        part.separator))
+                body.extend([
+                    '    if {0}:'.format(part.name),
+                    "        _append(_separator + {0!r} + {1} + '\" ')"
+                    .format(part.attribute + '="', value),
+                    "        _separator = ''"])
+        elif isinstance(part, Slot):
+            value = '_escape({0}, True)' if escape_values else '{0}'
+            body.extend([
+                '    if {0}.__class__ is _str:'.format(part.name),
+                '        _append({0})'.format(value.format(part.name)),
+                '    elif {0} is not None:'.format(part.name),
+                '        _out.extend(_iter_nodes(({0},)))'.format(part.name)])
+        elif isinstance(part, str):
+            body.append('    _append({0!r})'.format(part))
+        else:
+            raise TypeError('Fragments cannot contain placeholders or '
+                            'awaitables: {0!r}'.format(part))
+        previous = part
+
+    arguments = required + ['{0}=_default_{0}'.format(name)
+                            for name in optional]
+    lines = ['def render({0}):'.format(', '.join(arguments)),
+             '    _out = []',
+             '    _append = _out.append']
+    lines.extend(body)
+    lines.append("    return ''.join(_out)")
+
+    code = compile('\n'.join(lines), '<korona:fragment>', 'exec')
+    exec(code, namespace)
+    return namespace['render']
+
+
+def check_slot_name(name):
+    """Checks that the name of a slot can be the name of an argument of a
+    fragment function.
+    """
+    if not SLOT_NAME_PATTERN.match(name) or keyword.iskeyword(name):
+        raise ValueError('Slot name {0!r} should be a python identifier not '
+                         'starting with an underscore'.format(name))
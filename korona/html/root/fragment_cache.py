@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+"""Cache of the constructed sections of a page, with expiry times and
+dependency keys.
+"""
+
+from collections import namedtuple
+import time
+import uuid
+
+from ...lib.cache import MemoryStorage
+from .element import iter_nodes
+
+# Prefixes of the storage keys of the fragments and of the versions of the
+# dependency keys.
+FRAGMENT_PREFIX = 'korona:fragment:'
+DEPENDENCY_PREFIX = 'korona:dependency:'
+
+# Stored fragment: its constructed tags, its expiry time (or ``None``) and the
+# versions of its dependency keys when it was constructed.
+CachedFragment = namedtuple('CachedFragment', ['html', 'expires', 'versions'])
+
+
+class FragmentCache(object):
+    """Cache of the constructed sections of a page (Ex. a long form), under
+    keys chosen by the application. A section is only built and constructed
+    again when it expires or when one of its dependency keys is invalidated,
+    for example when the data it shows has changed.
+
+    Every dependency key has a version, stored along with the fragments. A
+    fragment keeps the versions of its dependency keys and invalidating a
+    dependency key changes its version, so the fragments depending on it are
+    stale without having to find them. The versions are read before the
+    section is built, so a fragment built from data which changed in the
+    meantime is stale as well. As they are read on every lookup, a fragment
+    should only depend on a few keys (Ex. ``'products'`` rather than a key
+    per product of a list).
+
+    Args:
+        storage: The storage of the fragments, with the ``get``, ``set``,
+            ``remove`` and ``clear`` methods of
+            :class:`korona.lib.cache.MemoryStorage` (the default, in process)
+            or :class:`korona.lib.cache.FileStorage` (shared by the processes
+            of a host).
+
+    .. versionadded:: 0.4.3-dev
+    """
+    def __init__(self, storage=None):
+        self.storage = MemoryStorage() if storage is None else storage
+
+    def cached(self, key, tree_factory, ttl=None, deps=()):
+        """Returns the constructed tags of the fragment of the key, building
+        and caching them if they are not cached or stale.
+
+        Args:
+            key (str): Key of the fragment.
+            tree_factory (function): Function returning the tags of the
+                fragment, or tags and strings (As the text of a tag).
+            ttl (float): Number of seconds after which the fragment expires.
+                If it is not given, the fragment does not expire.
+            deps (list): Dependency keys of the fragment (Ex.
+                ``'product:42'``).
+
+        Returns:
+            str: The constructed tags.
+        """
+        versions = tuple((dep, self.get_version(dep)) for dep in deps)
+        fragment = self.storage.get(FRAGMENT_PREFIX + key)
+        if fragment is not None and fragment.versions == versions and \
+                (fragment.expires is None or fragment.expires > time.time()):
+            return fragment.html
+
+        html = ''.join(iter_nodes((tree_factory(),)))
+        expires = None if ttl is None else time.time() + ttl
+        self.storage.set(FRAGMENT_PREFIX + key,
+                         CachedFragment(html, expires, versions))
+        return html
+
+    def get_version(self, dep):
+        """Returns the version of a dependency key, setting a new one if it
+        has none (Ex. if it was evicted from the storage).
+        """
+        version = self.storage.get(DEPENDENCY_PREFIX + dep)
+        if version is None:
+            version = uuid.uuid4().hex
+            self.storage.set(DEPENDENCY_PREFIX + dep, version)
+        return version
+
+    def invalidate(self, key=None, dep=None):
+        """Removes the fragment of the key, or makes stale all the fragments
+        depending on the dependency key.
+
+        Args:
+            key (str): Key of the fragment.
+            dep (str): Dependency key.
+        """
+        if key is None and dep is None:
+            raise ValueError('A key or a dependency key should be given.')
+
+        if key is not None:
+            self.storage.remove(FRAGMENT_PREFIX + key)
+        if dep is not None:
+            self.storage.set(DEPENDENCY_PREFIX + dep, uuid.uuid4().hex)
+
+    def clear(self):
+        """Removes all the fragments and the versions of the dependency
+        keys.
+        """
+        self.storage.clear()
+
+
+# Fragment cache used by :func:`cached` and :func:`invalidate`.
+_fragment_cache = FragmentCache()
+
+
+def get_fragment_cache():
+    """Returns the fragment cache used by :func:`cached` and
+    :func:`invalidate`.
+    """
+    return _fragment_cache
+
+
+def set_fragment_cache(cache):
+    """Sets the fragment cache used by :func:`cached` and :func:`invalidate`
+    in this process. By default, the fragments are cached in process.
+
+    Args:
+        cache (FragmentCache): The cache.
+
+    .. versionadded:: 0.4.3-dev
+    """
+    global _fragment_cache
+
+    _fragment_cache = cache
+
+
+def cached(key, tree_factory, ttl=None, deps=()):
+    """Returns the constructed tags of a fragment from the fragment cache
+    (See :meth:`FragmentCache.cached`).
+
+    Example::
+
+        Div(text=[header,
+                  cached('product:42:details',
+                         lambda: get_details(product),
+                         ttl=3600, deps=['product:42'])])
+
+        # After the product has changed.
+        invalidate(dep='product:42')
+
+    .. versionadded:: 0.4.3-dev
+    """
+    return _fragment_cache.cached(key, tree_factory, ttl=ttl, deps=deps)
+
+
+def invalidate(key=None, dep=None):
+    """Removes a fragment, or makes stale the fragments depending on a
+    dependency key, in the fragment cache (See
+    :meth:`FragmentCache.invalidate`).
+
+    .. versionadded:: 0.4.3-dev
+    """
+    _fragment_cache.invalidate(key=key, dep=dep)
@@ -1,12 +1,7 @@
 # -*- coding: utf-8 -*-
 
 from ...exceptions import AttributeValueError, TagAttributeError
-from ...lib.utils import (
-    validate_string_attribute,
-    validate_boolean_attribute,
-    validate_number_attribute,
-    validate_attribute_values
-)
+from ...lib.utils import compile_validator
 from ...templates.html.global_attributes import global_attributes
 
 GLOBAL_ATTRIBUTES = {
@@ -86,6 +81,85 @@ GLOBAL_ATTRIBUTES = {
     }
 }
 
+# Names of the global attributes which can be given to the tags.
+GLOBAL_ATTRIBUTE_NAMES = frozenset(name for name in GLOBAL_ATTRIBUTES
+                                   if name != 'data-*')
+
+VALIDATION_RULES = [('contenteditable', 'string', 'values'),
+                    ('dir', 'values'),
+                    ('draggable', 'string', 'values'),
+                    ('dropzone', 'values'),
+                    ('hidden', 'boolean'),
+                    ('spellcheck', 'string', 'values'),
+                    ('tabindex', 'number'),
+                    ('translate', 'values')]
+
+# Names of the global attributes checked by the compiled validator before
+# and after the id attribute. The global attributes are validated in
+# alphabetical order.
+VALIDATED_BEFORE_ID = frozenset(rule[0] for rule in VALIDATION_RULES
+                                if rule[0] < 'id')
+VALIDATED_AFTER_ID = frozenset(rule[0] for rule in VALIDATION_RULES
+                               if rule[0] > 'id')
+
+validate_attributes = compile_validator(tag=None,
+                                        attributes=GLOBAL_ATTRIBUTES,
+                                        rules=VALIDATION_RULES)
+
+
+def validate_class_attribute(classname):
+    """Validates whether the class attribute value starts with a letter or
+    not.
+    """
+    if not classname:
+        return
+
+    if not classname[0].isalpha():
+        raise AttributeValueError('class attribute value must begin with a'
+                                  ' letter A-Z or a-z')
+
+
+def validate_id_attribute(id):
+    """Validates that the id attribute value does not has a space character
+     and at least one of the character should be an alphabet.
+    """
+    if not id:
+        return
+
+    if ' ' in id:
+        raise AttributeValueError('id attribute value should not have any '
+                                  'spaces.')
+    if not id[0].isalpha() and not any(i.isalpha() for i in id):
+        raise AttributeValueError('id attribute value must contain at '
+                                  'least one character')
+
+
+def validate_global_attributes(tag, attributes):
+    """Validates the global attributes of a tag.
+
+    Args:
+        tag (str): Name of the html tag.
+        attributes (dict): Values of the global attributes by attribute name.
+            Only the given attributes are validated.
+
+    .. versionadded:: 0.4.3-dev
+    """
+    if 'class' in attributes:
+        validate_class_attribute(attributes['class'])
+
+    if not VALIDATED_BEFORE_ID.isdisjoint(attributes):
+        validate_attributes(tag, **dict(
+            (name, attributes[name])
+            for name in VALIDATED_BEFORE_ID.intersection(attributes)))
+
+    if 'id' in attributes:
+        validate_id_attribute(attributes['id'])
+
+    if not VALIDATED_AFTER_ID.isdisjoint(attributes):
+        validate_attributes(tag, **dict(
+            (name, attributes[name])
+            for name in VALIDATED_AFTER_ID.intersection(attributes)))
+
 
 class GlobalAttributes(object):
     """Class for constructing global attributes for HTML tags.
@@ -140,53 +214,7 @@ class GlobalAttributes(object):
 
         self.tag = kwargs.get('tag', None)
 
-        self.validate_class_attribute(class_)
-        validate_string_attribute(tag=self.tag,
-                                  attribute_name='contenteditable',
-                                  attribute_value=contenteditable)
-        validate_attribute_values(
-            tag=self.tag,
-            attribute_name='contenteditable',
-            attribute_value=contenteditable,
-            default_values=GLOBAL_ATTRIBUTES['contenteditable']['values'])
-        validate_attribute_values(
-            tag=self.tag,
-            attribute_name='dir',
-            attribute_value=dir,
-            default_values=GLOBAL_ATTRIBUTES['dir']['values'])
-        validate_string_attribute(tag=self.tag,
-                                  attribute_name='draggable',
-                                  attribute_value=draggable)
-        validate_attribute_values(
-            tag=self.tag,
-            attribute_name='draggable',
-            attribute_value=draggable,
-            default_values=GLOBAL_ATTRIBUTES['draggable']['values'])
-        validate_attribute_values(
-            tag=self.tag,
-            attribute_name='dropzone',
-            attribute_value=dropzone,
-            default_values=GLOBAL_ATTRIBUTES['dropzone']['values'])
-        validate_boolean_attribute(tag=self.tag,
-                                   attribute_name='hidden',
-                                   attribute_value=hidden)
-        self.validate_id_attribute(id=id)
-        validate_string_attribute(tag=self.tag,
-                                  attribute_name='spellcheck',
-                                  attribute_value=spellcheck)
-        validate_attribute_values(
-            tag=self.tag,
-            attribute_name='spellcheck',
-            attribute_value=spellcheck,
-            default_values=GLOBAL_ATTRIBUTES['spellcheck']['values'])
-        validate_number_attribute(tag=self.tag,
-                                  attribute_name='tabindex',
-                                  attribute_value=tabindex)
-        validate_attribute_values(
-            tag=self.tag,
-            attribute_name='translate',
-            attribute_value=translate,
-            default_values=GLOBAL_ATTRIBUTES['translate']['values'])
+        validate_global_attributes(self.tag, kwargs)
 
         self.values = {'accesskey': accesskey,
                        'class': class_,
@@ -212,23 +240,10 @@ class GlobalAttributes(object):
         """Validates whether the class attribute value starts with a letter or
         not.
         """
-        if not classname:
-            return
-
-        if not classname[0].isalpha():
-            raise AttributeValueError('class attribute value must begin with a'
-                                      ' letter A-Z or a-z')
+        validate_class_attribute(classname)
 
     def validate_id_attribute(self, id):
         """Validates that the id attribute value does not has a space character
          and at least one of the character should be an alphabet.
         """
-        if not id:
-            return
-
-        if any(i == ' ' for i in id):
-            raise AttributeValueError('id attribute value should not have any '
-                                      'spaces.')
-        if not any(i.isalpha() for i in id):
-            raise AttributeValueError('id attribute value must contain at '
-                                      'least one character')
+        validate_id_attribute(id)
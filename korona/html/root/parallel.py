@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+"""Rendering of large documents across a pool of processes."""
+
+from itertools import count, repeat
+import multiprocessing
+
+try:
+    from collections.abc import Iterator
+except ImportError:  # pragma: no cover
+    from collections import Iterator
+
+from ...templates.html.renderer import get_backend, set_backend
+from .element import Element, iter_nodes
+
+# Number of batches rendered by every worker, so that the batches of a slow
+# worker can be taken over by the others.
+BATCHES_PER_WORKER = 4
+
+# Batches inherited by the forked workers, by rendering.
+_batches = {}
+_ids = count()
+
+
+def render_parallel(tree, workers=None, executor=None):
+    """Constructs a large tag across a pool of processes. The tree is split
+    into subtrees (Ex. the rows of a table) which are rendered in batches by
+    the workers and joined in document order. The output is the same as
+    ``tree.construct()``.
+
+    The subtrees are sent to the workers in their compact pickled form (the
+    tag classes and the attributes which are set). When the pool is created
+    by this function with the ``fork`` start method, the workers inherit the
+    subtrees instead and only the indexes of the batches are sent to them.
+
+    The subtrees cannot contain placeholders and, unless they are inherited,
+    children given as iterators.
+
+    Args:
+        tree (Element): The tag.
+        workers (int): Number of worker processes. Defaults to the number of
+            cpus.
+        executor (concurrent.futures.Executor): Pool rendering the batches.
+            If it is not given, a ``ProcessPoolExecutor`` is created for the
+            rendering.
+
+    Returns:
+        str: The constructed tag.
+
+    .. versionadded:: 0.4.3-dev
+    """
+    workers = workers or multiprocessing.cpu_count()
+    if workers <= 1 and executor is None:
+        return ''.join(iter_nodes((tree,)))
+
+    batches = get_batches(partition(tree, workers * BATCHES_PER_WORKER),
+                          workers * BATCHES_PER_WORKER)
+    backend = get_backend()
+
+    if executor is not None:
+        return ''.join(executor.map(render_batch, batches, repeat(backend)))
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    # The start method can only be checked on python 3.4 or newer.
+    get_start_method = getattr(multiprocessing, 'get_start_method', None)
+    if get_start_method is None or get_start_method() != 'fork':
+        with ProcessPoolExecutor(workers) as pool:
+            return ''.join(pool.map(render_batch, batches, repeat(backend)))
+
+    # The workers are forked when the batches are submitted, so they inherit
+    # the batches.
+    key = next(_ids)
+    _batches[key] = batches
+    try:
+        with ProcessPoolExecutor(workers) as pool:
+            return ''.join(pool.map(render_inherited_batch,
+                                    repeat(key),
+                                    range(len(batches)),
+                                    repeat(backend)))
+    finally:
+        del _batches[key]
+
+
+def partition(tree, size):
+    """Splits the tree into pieces in document order, until there are at
+    least ``size`` subtrees. A tag is split into its opening tag, its
+    children and its closing tag. The tree is split level by level, so the
+    subtrees are of similar depths.
+
+    Args:
+        tree (Element): The tag.
+        size (int): Number of subtrees wanted.
+
+    Returns:
+        list: The rendered opening and closing tags and the subtrees.
+    """
+    pieces = [tree]
+    while sum(1 for piece in pieces if isinstance(piece, Element)) < size:
+        split = []
+        for piece in pieces:
+            if isinstance(piece, Element) and piece.children is not None:
+                opening, closing = piece.template.render_parts(piece._values)
+                split.append(opening)
+                split.extend(piece.children)
+                split.append(closing)
+            elif isinstance(piece, (list, tuple, Iterator)):
+                split.extend(piece)
+            else:
+                split.append(piece)
+
+        if len(split) == len(pieces) and \
+                not any(isinstance(piece, (list, tuple, Iterator))
+                        for piece in pieces):
+            # There is no tag left to split.
+            break
+        pieces = split
+
+    return pieces
+
+
+def get_batches(pieces, size):
+    """Returns the pieces in ``size`` batches of consecutive pieces."""
+    length = -(-len(pieces) // size)
+    return [pieces[index:index + length]
+            for index in range(0, len(pieces), length)]
+
+
+def render_batch(batch, backend):
+    """Renders a batch of pieces in a worker with the given backend."""
+    if get_backend() != backend:
+        set_backend(backend)
+    return ''.join(iter_nodes(batch))
+
+
+def render_inherited_batch(key, index, backend):
+    """Renders a batch of pieces inherited by a forked worker."""
+    return render_batch(_batches[key][index], backend)
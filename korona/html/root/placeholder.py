@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+"""Placeholders for the slow fragments of a streamed page."""
+
+from itertools import count
+import json
+
+try:
+    from concurrent.futures import FIRST_COMPLETED, Future, wait
+except ImportError:  # pragma: no cover
+    Future = None
+
+# Script defining the function which moves a rendered fragment to its slot.
+# It is written once per page, before the first fragment.
+SWAP_FUNCTION = 'koronaSwap'
+SWAP_SCRIPT = ('<script>function koronaSwap(id){'
+               'var slot=document.getElementById(id),'
+               'fragment=document.getElementById(id+"-content");'
+               'slot.parentNode.replaceChild(fragment.content,slot);'
+               'fragment.parentNode.removeChild(fragment)}</script>')
+
+_ids = count()
+
+
+class Placeholder(object):
+    """Placeholder for a slow fragment of a page. When the page is streamed,
+    the placeholder renders a slot (Ex. with a loading message) in document
+    order without waiting for the fragment. The fragment is written at the
+    end of the stream as soon as it is ready, with an inline script moving it
+    to its slot, so a slow fragment does not hold back the rest of the page.
+    The fragments are written in the order they are ready.
+
+    Args:
+        fragment: The fragment. It is either a ``concurrent.futures.Future``
+            (Ex. a query submitted to an executor) giving tags and strings,
+            an awaitable (only with :meth:`Element.render_async` and
+            :meth:`Element.iter_render_async`) or tags and strings which are
+            already available.
+        fallback: Text (or children) of the slot until the fragment is
+            rendered.
+        id (str): Id of the slot. Defaults to a unique id.
+        tag (type): Tag class of the slot. Defaults to ``Div``.
+
+    .. versionadded:: 0.4.3-dev
+    """
+    __slots__ = ('fragment', 'id', 'slot')
+
+    def __init__(self, fragment, fallback=None, id=None, tag=None):
+        if tag is None:
+            from ..tags import Div as tag
+
+        self.fragment = fragment
+        self.id = id or 'korona-placeholder-{0}'.format(next(_ids))
+        self.slot = tag(text=fallback, id=self.id)
+
+    def done(self):
+        """Returns whether the fragment is ready or not."""
+        if Future is not None and isinstance(self.fragment, Future):
+            return self.fragment.done()
+        return True
+
+    def result(self):
+        """Returns the fragment, waiting for it if it is not ready."""
+        if Future is not None and isinstance(self.fragment, Future):
+            return self.fragment.result()
+
+        if hasattr(self.fragment, '__await__'):
+            raise TypeError('Placeholder fragments given as awaitables are '
+                            'rendered with render_async()')
+        return self.fragment
+
+    def get_swap(self, fragment, first=False):
+        """Returns the rendered fragment moved to the slot of the placeholder
+        by an inline script.
+
+        Args:
+            fragment: The fragment (tags and strings).
+            first (bool): Whether this is the first fragment of the page,
+                which also defines the swap function.
+
+        Returns:
+            list: The nodes to render.
+        """
+        # The id is escaped for the script (Ex. "</script>").
+        script = '<script>{0}({1})</script>'.format(
+            SWAP_FUNCTION, json.dumps(self.id).replace('</', '<\\/'))
+        return [SWAP_SCRIPT if first else None,
+                '<template id="{0}-content">'.format(self.id),
+                fragment,
+                '</template>',
+                script]
+
+
+def pop_completed(placeholders):
+    """Waits for one of the placeholders to be ready and removes it from the
+    list. The placeholders which are ready are taken in order.
+
+    Args:
+        placeholders (list): The pending placeholders.
+
+    Returns:
+        Placeholder: The placeholder which is ready.
+    """
+    for index, placeholder in enumerate(placeholders):
+        if placeholder.done():
+            return placeholders.pop(index)
+
+    wait([placeholder.fragment for placeholder in placeholders],
+         return_when=FIRST_COMPLETED)
+    return pop_completed(placeholders)
@@ -0,0 +1,297 @@
+# -*- coding: utf-8 -*-
+"""Render plans of mostly static pages."""
+
+import re
+
+try:
+    from collections.abc import Iterator
+except ImportError:  # pragma: no cover
+    from collections import Iterator
+
+from .element import (
+    FLUSH,
+    FLUSH_AFTER,
+    Element,
+    _END,
+    iter_chunks,
+    iter_nodes
+)
+from .placeholder import Placeholder
+from .slot import Slot
+
+# Value rendered in place of an attribute slot, for splitting the rendered
+# opening tag around the attribute.
+ATTRIBUTE_MARKER = '\x00korona-slot-{0}\x00'
+ATTRIBUTE_PATTERN = re.compile(r'([^\s="<>]+)="\x00korona-slot-(\d+)\x00" ')
+
+
+def compile_plan(tree, flush_after=FLUSH_AFTER):
+    """Compiles a tree of tags into a render plan. All the parts of the tree
+    which do not depend on a slot (See :class:`korona.html.root.slot.Slot`)
+    are rendered once into literal strings, so rendering the plan only
+    renders the values of the slots, whatever the size of the rest of the
+    tree. The slots can be children of the tags or attribute values (See
+    :meth:`korona.html.root.element.Element.with_slots`).
+
+    The placeholders (See :class:`korona.html.root.placeholder.Placeholder`)
+    and the awaitables of the tree are dynamic too and are rendered every
+    time the plan is rendered. The iterators of the tree are consumed by the
+    compilation.
+
+    Args:
+        tree (Element): The tag.
+        flush_after (set): Names of the tags after which the streamed output
+            is flushed (See :data:`korona.html.root.element.FLUSH_AFTER`).
+
+    Returns:
+        RenderPlan: The render plan.
+
+    Example::
+
+        plan = compile_plan(Html(text=[Head(), Div(text=Slot('content'))]))
+        plan.render(content=H1(text='Hello'))
+
+    .. versionadded:: 0.4.3-dev
+    """
+    parts = []
+    literal = []
+    for part in iter_static_parts(tree, flush_after):
+        if isinstance(part, str) and part is not FLUSH:
+            literal.append(part)
+            continue
+
+        if literal:
+            parts.append(''.join(literal))
+            literal = []
+        parts.append(part)
+
+    if literal:
+        parts.append(''.join(literal))
+
+    return RenderPlan(parts, flush_after)
+
+
+def iter_static_parts(tree, flush_after=None):
+    """Yields the rendered parts of the tree in document order, along with
+    the dynamic nodes of the tree, which are not rendered.
+    """
+    stack = [iter((tree,))]
+    pop = stack.pop
+    push = stack.append
+
+    while stack:
+        node = next(stack[-1], _END)
+
+        if node is _END:
+            pop()
+        elif isinstance(node, Element):
+            children = node.children
+            slots = get_attribute_slots(node)
+            if children is None and not slots:
+                for part in iter_nodes((node,), flush_after):
+                    yield part
+                continue
+
+            values = node._values
+            empty = None
+            if slots:
+                names = set(name for name, _ in slots)
+                empty = render_opening(node, dict(
+                    (name, value) for name, value in values.items()
+                    if name not in names))[0]
+                values = dict(values)
+                for index, (name, _) in enumerate(slots):
+                    values[name] = ATTRIBUTE_MARKER.format(index)
+
+            opening, closing = render_opening(node, values)
+            for part in split_attribute_slots(opening, slots, empty):
+                yield part
+            if flush_after and node.tag in flush_after:
+                push(iter((closing, FLUSH)))
+            else:
+                push(iter((closing,)))
+            if children is not None:
+                push(iter(children))
+        elif isinstance(node, (list, tuple, Iterator)):
+            push(iter(node))
+        elif is_dynamic(node):
+            yield node
+        else:
+            for part in iter_nodes((node,), flush_after):
+                yield part
+
+
+def get_attribute_slots(node):
+    """Returns the names and the slots of the attributes of a tag which are
+    slots.
+    """
+    slots = [(name, value) for name, value in node._values.items()
+             if isinstance(value, Slot) and name != 'text']
+    for name, _ in slots:
+        if name in node.template.boolean_attributes:
+            raise TypeError('<{0}>: boolean attribute {1!r} cannot be a slot'
+                            .format(node.tag, name))
+    return slots
+
+
+def render_opening(node, values):
+    """Returns the opening and the closing tag of a tag rendered with the
+    given values. The opening tag of a tag without children is the whole
+    rendered tag.
+    """
+    if node.children is None:
+        return node.template.render(values), ''
+    return node.template.render_parts(values)
+
+
+def split_attribute_slots(rendered, slots, empty=None):
+    """Splits a rendered tag rendered with markers in place of its attribute
+    slots into the rendered strings and the attribute slots. ``empty`` is the
+    tag rendered without its attribute slots, which the rendered strings
+    should join into.
+    """
+    if not slots:
+        return [rendered]
+
+    pieces = ATTRIBUTE_PATTERN.split(rendered)
+    separator = ''
+    if empty is not None and ''.join(pieces[::3]) != empty:
+        # The space after the name of the tag is only rendered along with
+        # some attributes (Ex. ``<b>``), so it is rendered by the first
+        # attribute slot which is filled.
+        pieces[0] = pieces[0][:-1]
+        separator = ' '
+
+    parts = [pieces[0]]
+    for index in range(1, len(pieces), 3):
+        name, slot = slots[int(pieces[index + 1])]
+        parts.append(AttributeSlot(slot.name, slot.default, name, separator))
+        if pieces[index + 2]:
+            parts.append(pieces[index + 2])
+    return parts
+
+
+def is_dynamic(node):
+    """Returns whether the node is rendered every time the plan is
+    rendered.
+    """
+    return (isinstance(node, (Slot, Placeholder)) or
+            hasattr(node, '__await__') or hasattr(node, '__aiter__'))
+
+
+class AttributeSlot(Slot):
+    """Slot of an attribute value in a render plan. The attribute is rendered
+    only if the value of the slot is not empty, like the other attributes.
+
+    Args:
+        name (str): Name of the slot.
+        default: Value of the attribute when the slot is not filled.
+        attribute (str): Name of the attribute.
+        separator (str): Rendered before the attribute if it is the first
+            attribute slot of the tag which is filled, when the tag has no
+            other attributes.
+    """
+    __slots__ = ('attribute', 'separator')
+
+    def __init__(self, name, default, attribute, separator=''):
+        super(AttributeSlot, self).__init__(name, default)
+        self.attribute = attribute
+        self.separator = separator
+
+
+class RenderPlan(object):
+    """Render plan of a tree of tags, made of the rendered static parts of
+    the tree and its dynamic nodes. It is created by :func:`compile_plan` and
+    can be rendered any number of times, from many threads.
+
+    Args:
+        parts (list): Rendered strings, :data:`FLUSH` and dynamic nodes, in
+            document order.
+        flush_after (set): Names of the tags in the slot values after which
+            the streamed output is flushed.
+
+    .. versionadded:: 0.4.3-dev
+    """
+    def __init__(self, parts, flush_after=FLUSH_AFTER):
+        self.parts = tuple(parts)
+        self.flush_after = flush_after
+        self.slots = {}
+        for part in self.parts:
+            if isinstance(part, Slot):
+                self.slots.setdefault(part.name, part)
+
+    def get_nodes(self, slots=None, **kwargs):
+        """Returns the nodes to render for the given slot values, which can
+        be rendered with :func:`korona.html.root.element.iter_nodes` (or
+        :func:`korona.html.root.asynchronous.iter_nodes_async`).
+
+        Args:
+            slots (dict): Tags and strings by slot name.
+            kwargs (dict): More slot values by slot name.
+
+        Returns:
+            list: The nodes.
+        """
+        values = dict(slots, **kwargs) if slots else kwargs
+        for name in values:
+            if name not in self.slots:
+                raise TypeError('render() got an unexpected slot {0!r}'
+                                .format(name))
+
+        nodes = []
+        append = nodes.append
+        # Whether an attribute slot was rendered since the last other part.
+        separated = False
+        for part in self.parts:
+            kind = part.__class__
+            if kind is not AttributeSlot:
+                separated = False
+            if kind is not Slot and kind is not AttributeSlot:
+                append(part)
+                continue
+
+            if part.name in values:
+                value = values[part.name]
+            elif part.default is not None:
+                value = part.default
+            else:
+                raise TypeError('render() missing slot {0!r}'
+                                .format(part.name))
+
+            if kind is AttributeSlot:
+                if not value:
+                    continue
+                value = '{0}{1}="{2}" '.format(
+                    '' if separated else part.separator, part.attribute,
+                    value)
+                separated = True
+            append(value)
+        return nodes
+
+    def render(self, slots=None, **kwargs):
+        """Renders the plan with the given slot values.
+
+        Args:
+            slots (dict): Tags and strings by slot name.
+            kwargs (dict): More slot values by slot name.
+
+        Returns:
+            str: The rendered page.
+        """
+        nodes = self.get_nodes(slots, **kwargs)
+        return ''.join(iter_nodes(nodes))
+
+    def iter_render(self, slots=None, chunk_size=None, **kwargs):
+        """Yields the rendered page in parts, like
+        :meth:`korona.html.root.element.Element.iter_render`.
+
+        Args:
+            slots (dict): Tags and strings by slot name.
+            chunk_size (int): If given, the parts are buffered and yielded in
+                chunks of at least this many characters. The buffered chunk
+                is also yielded at the flush points.
+            kwargs (dict): More slot values by slot name.
+        """
+        parts = iter_nodes(self.get_nodes(slots, **kwargs), self.flush_after)
+        for chunk in iter_chunks(parts, chunk_size):
+            yield chunk
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+"""Prototypes of tags for creating many variants of a tag cheaply."""
+
+from .element import restore_element
+from .global_attributes import validate_global_attributes
+
+
+class Prototype(object):
+    """Prototype of a tag, from which variants differing in a few attributes
+    are created (Ex. links which only differ in their href and text). It is
+    created by :meth:`korona.html.root.element.Element.prototype`.
+
+    As some attributes depend on others (Ex. the rel attribute of a link can
+    only be used with href), the attributes of the prototype are validated
+    along with the attributes of its first variant. The first variant setting
+    a set of attributes is validated in full. The next variants setting the
+    same attributes share its validated values and only the changed
+    attributes are validated, when the tag class can validate them on their
+    own (See :meth:`korona.html.root.element.Element._validate_variant`).
+    Otherwise they are validated in full as well.
+
+    The variants are rendered by a copy of the tag template in which the
+    attributes of the prototype are rendered ahead of time (with the
+    ``compiled`` renderer backend).
+
+    Args:
+        tag_class (type): The tag class.
+        attributes (dict): The attributes shared by the variants (As in
+            ``Tag(**attributes)``).
+
+    Example::
+
+        link = A.prototype(rel='nofollow', target='_blank')
+        links = [link.with_(href=url, text=label) for url, label in rows]
+
+    .. versionadded:: 0.4.3-dev
+    """
+    def __init__(self, tag_class, attributes):
+        self.tag_class = tag_class
+        self.attributes = attributes
+        self.variant_class = None
+        # Validated values of a variant, by the names of the attributes set
+        # by the variant.
+        self._references = {}
+
+    def with_(self, **attributes):
+        """Returns a variant of the prototype with the given attributes.
+
+        Args:
+            attributes (dict): The attributes of the variant (As in
+                ``Tag(**attributes)``), which are added to the attributes of
+                the prototype or replace them.
+
+        Returns:
+            Element: The tag.
+        """
+        reference = self._references.get(frozenset(attributes))
+        if reference is not None:
+            variant = self._derive(reference, attributes)
+            if variant is not None:
+                return variant
+
+        tag = self.tag_class(**dict(self.attributes, **attributes))
+        if self.variant_class is None:
+            self.variant_class = self._create_variant_class(tag._values)
+        self._references[frozenset(attributes)] = tag._values
+        return restore_element(self.variant_class, dict(tag._values))
+
+    def _derive(self, reference, attributes):
+        """Returns the variant with the given attributes derived from the
+        validated values of another variant setting the same attributes, or
+        ``None`` if the attributes have to be validated in full.
+        """
+        defaults = self.tag_class._get_defaults()
+        values = reference.copy()
+        changes = {}
+        global_values = {}
+        for name, value in attributes.items():
+            if name in defaults:
+                changes[name] = value
+            else:
+                if name == 'class_':
+                    name = 'class'
+                if value is not None and value is not False:
+                    global_values[name] = value
+
+            if value is None or value is False:
+                values.pop(name, None)
+            else:
+                values[name] = value
+
+        variant = restore_element(self.variant_class, values)
+        if changes and not variant._validate_variant(changes):
+            return None
+
+        if global_values:
+            validate_global_attributes(variant.tag, global_values)
+        return variant
+
+    def _create_variant_class(self, values):
+        """Returns the class of the variants, a subclass of the tag class
+        rendered by a template in which the attributes of the prototype are
+        rendered ahead of time.
+        """
+        names = set('class' if name == 'class_' else name
+                    for name in self.attributes)
+        constants = {name: value for name, value in values.items()
+                     if name in names}
+        return type(self.tag_class.__name__, (self.tag_class,),
+                    {'__slots__': (),
+                     '__module__': self.tag_class.__module__,
+                     '__doc__': self.tag_class.__doc__,
+                     '__reduce__': reduce_variant,
+                     'template': self.tag_class.template.specialize(
+                         constants)})
+
+
+def reduce_variant(variant):
+    """Returns the pickled form of a variant, which is unpickled as a tag of
+    the tag class of its prototype.
+    """
+    return restore_element, (variant.__class__.__bases__[0], variant._values)
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+"""Named slots for the dynamic parts of a tree of tags."""
+
+
+class Slot(object):
+    """Named slot of a tree of tags, filled when the tree is rendered. A slot
+    marks a dynamic part of a page which is otherwise static, so that the
+    rest of the page can be rendered once ahead of time (See
+    :func:`korona.html.root.plan.compile_plan`).
+
+    When a tree is rendered without a plan, the slot renders its default. A
+    slot given as an attribute value (See
+    :meth:`korona.html.root.element.Element.with_slots`) is rendered as its
+    default as well, and the attribute is not rendered if the default is
+    empty.
+
+    Args:
+        name (str): Name of the slot.
+        default: Tags and strings rendered when the slot is not filled. If it
+            is not given, the slot has to be filled.
+
+    Example::
+
+        page = Html(text=[Head(), Div(text=Slot('content'))])
+
+    .. versionadded:: 0.4.3-dev
+    """
+    __slots__ = ('name', 'default')
+
+    def __init__(self, name, default=None):
+        self.name = name
+        self.default = default
+
+    def __bool__(self):
+        return bool(self.default)
+
+    __nonzero__ = __bool__
+
+    def __str__(self):
+        return str(self.default)
@@ -1,44 +1,63 @@
 # -*- coding: utf-8 -*-
-
-from .anchor import A
-from .abbreviate import Abbr
-from .acronym import Acronym
-from .address import Address
-from .area import Area
-from .article import Article
-
-from .bold import B
-from .base import Base
-from .button import Button
-
-from .canvas import Canvas
-from .caption import Caption
-from .cite import Cite
-from .col import Col
-from .colgroup import ColGroup
-
-from .description import DD, DL, DT
-from .delete import Del
-from .details import Details
-from .dialog import Dialog
-from .div import Div
-
-from .embed import Embed
-
-from .fieldset import FieldSet
-from .figure import Figure
-from .footer import Footer
-from .form import Form
-from .frame import Frame
-from .frameset import FrameSet
-
-from .head import Head
-from .header import Header
-from .heading import H1, H2, H3, H4, H5, H6
-from .horizontal_rule import HR
-from .html import Html
-
-from .italics import I
-from .iframe import IFrame
-from .image import Img
-from .input import Input
+"""HTML tag classes. The tag modules are imported on first access, so that
+``from korona.html.tags import A`` only loads the anchor tag.
+"""
+
+from ...lib.lazy import lazy_attributes
+
+# Modules defining the tag classes.
+MODULES = {
+    'A': 'anchor',
+    'Abbr': 'abbreviate',
+    'Acronym': 'acronym',
+    'Address': 'address',
+    'Area': 'area',
+    'Article': 'article',
+
+    'B': 'bold',
+    'Base': 'base',
+    'Button': 'button',
+
+    'Canvas': 'canvas',
+    'Caption': 'caption',
+    'Cite': 'cite',
+    'Col': 'col',
+    'ColGroup': 'colgroup',
+
+    'DD': 'description',
+    'DL': 'description',
+    'DT': 'description',
+    'Del': 'delete',
+    'Details': 'details',
+    'Dialog': 'dialog',
+    'Div': 'div',
+
+    'Embed': 'embed',
+
+    'FieldSet': 'fieldset',
+    'Figure': 'figure',
+    'Footer': 'footer',
+    'Form': 'form',
+    'Frame': 'frame',
+    'FrameSet': 'frameset',
+
+    'Head': 'head',
+    'Header': 'header',
+    'H1': 'heading',
+    'H2': 'heading',
+    'H3': 'heading',
+    'H4': 'heading',
+    'H5': 'heading',
+    'H6': 'heading',
+    'HR': 'horizontal_rule',
+    'Html': 'html',
+
+    'I': 'italics',
+    'IFrame': 'iframe',
+    'Img': 'image',
+    'Input': 'input'
+}
+
+__all__ = sorted(MODULES)
+
+__getattr__, __dir__ = lazy_attributes(__name__, MODULES, globals())
@@ -3,10 +3,11 @@
 
 from __future__ import absolute_import
 
+from ..root.element import TextElement
 from ...templates.html.tags import abbr
 
 
-class Abbr(object):
+class Abbr(TextElement):
     """Class for constructing abbr tag.
 
     Args:
@@ -17,10 +18,5 @@ class Abbr(object):
     .. versionchanged:: 0.2.0
         Renamed :func:`construct_tag` to :func:`construct`.
     """
-    def __init__(self, text=None):
-        self.tag = 'abbr'
-        self.values = {'text': text}
-
-    def construct(self):
-        """Returns the constructed abbr tag <abbr></abbr>."""
-        return abbr.render(self.values)
+    template = abbr
+    __slots__ = ()
@@ -4,10 +4,11 @@
 
 from __future__ import absolute_import
 
+from ..root.element import TextElement
 from ...templates.html.tags import acronym
 
 
-class Acronym(object):
+class Acronym(TextElement):
     """Class for constructing acronym tag.
 
     Args:
@@ -18,10 +19,5 @@ class Acronym(object):
     .. versionchanged:: 0.2.0
         Renamed :func:`construct_tag` to :func:`construct`.
     """
-    def __init__(self, text=None):
-        self.tag = 'acronym'
-        self.values = {'text': text}
-
-    def construct(self):
-        """Returns the constructed acronym tag <acronym></acronym>."""
-        return acronym.render(self.values)
+    template = acronym
+    __slots__ = ()
@@ -4,10 +4,11 @@
 
 from __future__ import absolute_import
 
+from ..root.element import TextElement
 from ...templates.html.tags import address
 
 
-class Address(object):
+class Address(TextElement):
     """Class for constructing address tag.
 
     Args:
@@ -18,10 +19,5 @@ class Address(object):
     .. versionchanged:: 0.2.0
         Renamed the method construct_tag to construct.
     """
-    def __init__(self, text=None):
-        self.tag = 'address'
-        self.values = {'text': text}
-
-    def construct(self):
-        """Returns the constructed address tag <address></address>."""
-        return address.render(self.values)
+    template = address
+    __slots__ = ()
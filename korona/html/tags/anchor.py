@@ -6,18 +6,18 @@ from __future__ import absolute_import
 from ...warning import warn
 from ...exceptions import TagAttributeError, AttributeValueError
 
-from ..root.global_attributes import GlobalAttributes
-from ...lib.utils import (
-    validate_url,
-    validate_string_attribute,
-    validate_attribute_values
-)
+from ..root.element import Element
+from ...lib.utils import compile_validator, format_coords
 from ...templates.html.tags import anchor
 
 RECTANGLE_SHAPE_COORDINATES = 4
 CIRCLE_SHAPE_COORDINATES = 3
 CHARACTER_SETS = ['UTF-8', 'ISO-8859-1']
 
+# Attributes which can be changed in the variants of a prototype by only
+# validating their new value (See :meth:`A._validate_variant`).
+VARIANT_ATTRIBUTES = frozenset(['href', 'name', 'target', 'text'])
+
 ATTRIBUTES = {
     'charset': {
         'description': 'Specifies the character-set of a linked '
@@ -99,8 +99,16 @@ ATTRIBUTES = {
     }
 }
 
+validate_attributes = compile_validator(tag='a',
+                                        attributes=ATTRIBUTES,
+                                        rules=[('download', 'url'),
+                                               ('href', 'url'),
+                                               ('rel', 'string', 'values'),
+                                               ('rev', 'string', 'values'),
+                                               ('shape', 'string', 'values')])
+
 
-class A(object):
+class A(Element):
     """Class for constructing anchor tag.
 
     Args:
@@ -133,6 +141,9 @@ class A(object):
         Used custom exceptions for all the attributes. Removed the method
         :func:`validate_values`.
     """
+    template = anchor
+    __slots__ = ()
+
     def __init__(self,
                  charset=None,
                  coords=None,
@@ -145,40 +156,17 @@ class A(object):
                  shape=None,
                  target=None,
                  type=None,
-                 text=None):
+                 text=None,
+                 **global_attributes):
         self.tag = 'a'
 
         self.validate_charset(charset)
         coordinates = self.get_coords(shape=shape, coords=coords)
         self.pre_validate(href=href, attribute_name='download', value=download)
-        validate_url(attribute_name='download', url=download)
-        validate_url(attribute_name='href', url=href)
+        validate_attributes(download=download, href=href)
         self.pre_validate(href=href, attribute_name='hreflang', value=hreflang)
         self.pre_validate(href=href, attribute_name='rel', value=rel)
-        validate_string_attribute(tag=self.tag,
-                                  attribute_name='rel',
-                                  attribute_value=rel)
-        validate_attribute_values(
-            tag=self.tag,
-            attribute_name='rel',
-            attribute_value=rel,
-            default_values=ATTRIBUTES['rel']['values'])
-        validate_string_attribute(tag=self.tag,
-                                  attribute_name='rev',
-                                  attribute_value=rev)
-        validate_attribute_values(
-            tag=self.tag,
-            attribute_name='rev',
-            attribute_value=rev,
-            default_values=ATTRIBUTES['rev']['values'])
-        validate_string_attribute(tag=self.tag,
-                                  attribute_name='shape',
-                                  attribute_value=shape)
-        validate_attribute_values(
-            tag=self.tag,
-            attribute_name='shape',
-            attribute_value=shape,
-            default_values=ATTRIBUTES['shape']['values'])
+        validate_attributes(rel=rel, rev=rev, shape=shape)
         self.pre_validate(href=href, attribute_name='type', value=type)
 
         self.values = {'charset': charset,
@@ -193,10 +181,21 @@ class A(object):
                        'target': target,
                        'type': type,
                        'text': text}
+        self.set_global_attributes(global_attributes)
 
-    def construct(self):
-        """Returns the constructed anchor tag <a></a>."""
-        return anchor.render(self.values)
+    def _validate_variant(self, changes):
+        """Validates the attributes changed in a variant of a prototype. The
+        href can only be validated on its own as long as it is set, as some
+        attributes are only used when href is set.
+        """
+        if not VARIANT_ATTRIBUTES.issuperset(changes):
+            return False
+
+        if 'href' in changes:
+            if not changes['href']:
+                return False
+            validate_attributes(href=changes['href'])
+        return True
 
     def validate_charset(self, charset):
         """Validates charset attribute. Warn the user showing the common
@@ -214,6 +213,11 @@ class A(object):
             warn('Common character sets used are: {charsets}'
                  .format(charsets=','.join(CHARACTER_SETS)))
 
+    @classmethod
+    def _format_values(cls, values):
+        """Joins the coordinates of a trusted tag into a string."""
+        return format_coords(values)
+
     def get_coords(self, shape, coords):
         """Returns coordinates after a series of validations.
 
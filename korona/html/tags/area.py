@@ -3,7 +3,8 @@
 
 from __future__ import absolute_import
 
-from ...lib.utils import validate_url
+from ..root.element import Element
+from ...lib.utils import format_coords, validate_url
 from ...templates.html.tags import area
 
 RECTANGLE_SHAPE_COORDINATES = 4
@@ -72,7 +73,7 @@ ATTRIBUTES = {
 }
 
 
-class Area(object):
+class Area(Element):
     """Class for constructing area tag.
 
     Args:
@@ -100,6 +101,9 @@ class Area(object):
     .. versionchanged:: 0.3.1
         Added URL validation for href attribute.
     """
+    template = area
+    __slots__ = ()
+
     def __init__(self,
                  alt=None,
                  coords=None,
@@ -111,7 +115,8 @@ class Area(object):
                  rel=None,
                  shape=None,
                  target=None,
-                 type=None):
+                 type=None,
+                 **global_attributes):
         self.tag = 'area'
         self.validate_alt(href=href, attribute_name='alt', value=alt)
         coordinates = self.get_coords(shape=shape, coords=coords)
@@ -134,10 +139,7 @@ class Area(object):
                        'shape': shape,
                        'target': target,
                        'type': type}
-
-    def construct(self):
-        """Returns the constructed area tag <area></area>."""
-        return area.render(self.values)
+        self.set_global_attributes(global_attributes)
 
     def validate_alt(self, href, attribute_name, value):
         """Validates area's alt attribute."""
@@ -166,6 +168,11 @@ class Area(object):
         if not isinstance(value, str):
             raise ValueError('<area>: {0} should be a string'.format(value))
 
+    @classmethod
+    def _format_values(cls, values):
+        """Joins the coordinates of a trusted tag into a string."""
+        return format_coords(values)
+
     def get_coords(self, shape, coords):
         """Returns coordinates after a series of validations.
 
@@ -3,10 +3,11 @@
 
 from __future__ import absolute_import
 
+from ..root.element import TextElement
 from ...templates.html.tags import article
 
 
-class Article(object):
+class Article(TextElement):
     """Class for constructing article tag.
 
     Args:
@@ -17,10 +18,5 @@ class Article(object):
     .. versionchanged:: 0.2.0
         Renamed the method construct_tag to construct.
     """
-    def __init__(self, text=None):
-        self.tag = 'article'
-        self.values = {'text': text}
-
-    def construct(self):
-        """Returns the constructed article tag <article></article>."""
-        return article.render(self.values)
+    template = article
+    __slots__ = ()
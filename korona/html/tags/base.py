@@ -3,6 +3,7 @@
 
 from __future__ import absolute_import
 
+from ..root.element import Element
 from ...lib.utils import validate_url
 from ...templates.html.tags import base
 
@@ -20,7 +21,7 @@ ATTRIBUTES = {
 }
 
 
-class Base(object):
+class Base(Element):
     """Class for constructing base tag.
 
     Args:
@@ -36,17 +37,17 @@ class Base(object):
     .. versionchanged:: 0.3.1
         Added URL validation for href attribute.
     """
-    def __init__(self, href=None, target=None):
+    template = base
+    __slots__ = ()
+
+    def __init__(self, href=None, target=None, **global_attributes):
         # TODO: Add in the main api method where it can check that there
         # should be only one base tag in the whole html document.
         self.tag = 'base'
         validate_url(attribute_name='href', url=href)
         self.validate_values(href=href, target=target)
         self.values = {'href': href, 'target': target}
-
-    def construct(self):
-        """Returns the constructed base tag <base>."""
-        return base.render(self.values)
+        self.set_global_attributes(global_attributes)
 
     def validate_values(self, href, target):
         """Validates the following:
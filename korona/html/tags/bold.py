@@ -3,10 +3,11 @@
 
 from __future__ import absolute_import
 
+from ..root.element import TextElement
 from ...templates.html.tags import bold
 
 
-class B(object):
+class B(TextElement):
     """Class for constructing bold tag.
 
     Args:
@@ -17,10 +18,5 @@ class B(object):
     .. versionchanged:: 0.2.0
         Renamed the method construct_tag to construct.
     """
-    def __init__(self, text=None):
-        self.tag = 'b'
-        self.values = {'text': text}
-
-    def construct(self):
-        """Returns the constructed bold tag <b></b>."""
-        return bold.render(self.values)
+    template = bold
+    __slots__ = ()
@@ -3,7 +3,8 @@
 
 from __future__ import absolute_import
 
-from ...lib.utils import validate_attribute_values
+from ..root.element import Element
+from ...lib.utils import compile_validator
 from ...templates.html.tags import button
 
 ATTRIBUTES = {
@@ -64,8 +65,14 @@ ATTRIBUTES = {
     }
 }
 
+validate_attributes = compile_validator(tag='button',
+                                        attributes=ATTRIBUTES,
+                                        rules=[('formenctype', 'values'),
+                                               ('formmethod', 'values'),
+                                               ('type', 'values')])
 
-class Button(object):
+
+class Button(Element):
     """Class for constructing button tag.
 
     Args:
@@ -95,6 +102,9 @@ class Button(object):
     .. versionchanged:: 0.4.3-dev
         Removed :func:`validate_values` method.
     """
+    template = button
+    __slots__ = ()
+
     def __init__(self,
                  autofocus=False,
                  disabled=False,
@@ -107,7 +117,8 @@ class Button(object):
                  name=None,
                  type=None,
                  value=None,
-                 text=None):
+                 text=None,
+                 **global_attributes):
         self.tag = 'button'
         self.validate_type(value=type)
         self.pre_validate(type=type,
@@ -116,29 +127,18 @@ class Button(object):
         self.pre_validate(type=type,
                           attribute_name='formenctype',
                           value=formenctype)
-        validate_attribute_values(
-            tag=self.tag,
-            attribute_name='formenctype',
-            attribute_value=formenctype,
-            default_values=ATTRIBUTES['formenctype']['values'])
         self.pre_validate(type=type,
                           attribute_name='formmethod',
                           value=formmethod)
-        validate_attribute_values(
-            tag=self.tag,
-            attribute_name='formmethod',
-            attribute_value=formmethod,
-            default_values=ATTRIBUTES['formmethod']['values'])
         self.pre_validate(type=type,
                           attribute_name='formnovalidate',
                           value=formnovalidate)
         self.pre_validate(type=type,
                           attribute_name='formtarget',
                           value=formtarget)
-        validate_attribute_values(tag=self.tag,
-                                  attribute_name='type',
-                                  attribute_value=type,
-                                  default_values=ATTRIBUTES['type']['values'])
+        validate_attributes(formenctype=formenctype,
+                            formmethod=formmethod,
+                            type=type)
 
         self.values = {'autofocus': autofocus,
                        'disabled': disabled,
@@ -152,10 +152,7 @@ class Button(object):
                        'type': type,
                        'value': value,
                        'text': text}
-
-    def construct(self):
-        """Returns the constructed base tag <button>."""
-        return button.render(self.values)
+        self.set_global_attributes(global_attributes)
 
     def validate_type(self, value):
         """Validate the type attribute for a <button> element. Different
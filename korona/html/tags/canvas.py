@@ -3,11 +3,12 @@
 
 from __future__ import absolute_import
 
+from ..root.element import Element
 from ...lib.utils import validate_string_attribute
 from ...templates.html.tags import canvas
 
 
-class Canvas(object):
+class Canvas(Element):
     """Class for constructing canvas tag.
 
     Args:
@@ -19,7 +20,10 @@ class Canvas(object):
     .. versionchanged:: 0.2.0
         Renamed the method construct_tag to construct.
     """
-    def __init__(self, height=None, width=None):
+    template = canvas
+    __slots__ = ()
+
+    def __init__(self, height=None, width=None, **global_attributes):
         # TODO: Possible add the canvas text attribute.
         self.tag = 'canvas'
         validate_string_attribute(tag=self.tag,
@@ -29,7 +33,4 @@ class Canvas(object):
                                   attribute_name='width',
                                   attribute_value=width)
         self.values = {'height': height, 'width': width}
-
-    def construct(self):
-        """Returns the constructed canvas tag <canvas>."""
-        return canvas.render(self.values)
+        self.set_global_attributes(global_attributes)
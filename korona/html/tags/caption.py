@@ -3,7 +3,8 @@
 
 from __future__ import absolute_import
 
-from ...lib.utils import validate_attribute_values
+from ..root.element import Element
+from ...lib.utils import compile_validator
 from ...templates.html.tags import caption
 
 ATTRIBUTES = {
@@ -13,8 +14,12 @@ ATTRIBUTES = {
     }
 }
 
+validate_attributes = compile_validator(tag='caption',
+                                        attributes=ATTRIBUTES,
+                                        rules=[('align', 'values')])
 
-class Caption(object):
+
+class Caption(Element):
     """Class for constructing caption tag.
 
     Args:
@@ -26,14 +31,11 @@ class Caption(object):
     .. versionchanged:: 0.2.0
         Renamed the method construct_tag to construct.
     """
-    def __init__(self, align=None, text=None):
+    template = caption
+    __slots__ = ()
+
+    def __init__(self, align=None, text=None, **global_attributes):
         self.tag = 'caption'
-        validate_attribute_values(tag=self.tag,
-                                  attribute_name='align',
-                                  attribute_value=align,
-                                  default_values=ATTRIBUTES['align']['values'])
+        validate_attributes(align=align)
         self.values = {'align': align, 'text': text}
-
-    def construct(self):
-        """Returns the constructed caption tag <caption>."""
-        return caption.render(self.values)
+        self.set_global_attributes(global_attributes)
@@ -3,10 +3,11 @@
 
 from __future__ import absolute_import
 
+from ..root.element import Element
 from ...templates.html.tags import cite
 
 
-class Cite(object):
+class Cite(Element):
     """Class for constructing cite tag.
 
     Args:
@@ -17,10 +18,10 @@ class Cite(object):
     .. versionchanged:: 0.2.0
         Renamed the method construct_tag to construct.
     """
-    def __init__(self, text):
+    template = cite
+    __slots__ = ()
+
+    def __init__(self, text, **global_attributes):
         self.tag = 'cite'
         self.values = {'text': text}
-
-    def construct(self):
-        """Returns the constructed cite tag <cite>."""
-        return cite.render(self.values)
+        self.set_global_attributes(global_attributes)
@@ -3,7 +3,8 @@
 
 from __future__ import absolute_import
 
-from ...lib.utils import validate_attribute_values
+from ..root.element import Element
+from ...lib.utils import compile_validator
 from ...templates.html.tags import col
 
 ATTRIBUTES = {
@@ -39,8 +40,13 @@ ATTRIBUTES = {
     }
 }
 
+validate_attributes = compile_validator(tag='col',
+                                        attributes=ATTRIBUTES,
+                                        rules=[('align', 'values'),
+                                               ('valign', 'values')])
 
-class Col(object):
+
+class Col(Element):
     """Class for constructing col tag.
 
     Args:
@@ -58,36 +64,29 @@ class Col(object):
 
     .. versionadded:: 0.2.0
     """
+    template = col
+    __slots__ = ()
+
     def __init__(self,
                  align=None,
                  char=None,
                  charoff=None,
                  span=None,
                  valign=None,
-                 width=None):
+                 width=None,
+                 **global_attributes):
         self.tag = 'col'
-        validate_attribute_values(
-            tag=self.tag,
-            attribute_name='align',
-            attribute_value=align,
-            default_values=ATTRIBUTES['align']['values'])
+        validate_attributes(align=align)
         self.validate_char_attribute(align=align, value=char)
         self.validate_charoff_attribute(align=align, char=char, value=charoff)
-        validate_attribute_values(
-            tag=self.tag,
-            attribute_name='valign',
-            attribute_value=valign,
-            default_values=ATTRIBUTES['valign']['values'])
+        validate_attributes(valign=valign)
         self.values = {'align': align,
                        'char': char,
                        'charoff': charoff,
                        'span': span,
                        'valign': valign,
                        'width': width}
-
-    def construct(self):
-        """Returns the constructed col tag <col>."""
-        return col.render(self.values)
+        self.set_global_attributes(global_attributes)
 
     def validate_char_attribute(self, align, value):
         """Validates char attribute. The char attribute can only be used if
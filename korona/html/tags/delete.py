@@ -3,10 +3,11 @@
 
 from __future__ import absolute_import
 
+from ..root.element import Element
 from ...templates.html.tags import delete
 
 
-class Del(object):
+class Del(Element):
     """Class for constructing del tag.
 
     Args:
@@ -17,11 +18,12 @@ class Del(object):
 
     .. versionadded:: 0.2.0
     """
-    def __init__(self, cite=None, datetime=None, text=None):
+    template = delete
+    __slots__ = ()
+
+    def __init__(self, cite=None, datetime=None, text=None,
+                 **global_attributes):
         self.tag = 'del'
         # TODO: If possible, add validation for attribute cite
         self.values = {'cite': cite, 'datetime': datetime, 'text': text}
-
-    def construct(self):
-        """Returns the constructed del tag <del>."""
-        return delete.render(self.values)
+        self.set_global_attributes(global_attributes)
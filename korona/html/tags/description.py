@@ -3,10 +3,11 @@
 
 from __future__ import absolute_import
 
+from ..root.element import TextElement
 from ...templates.html.tags import dd, dl, dt
 
 
-class DD(object):
+class DD(TextElement):
     """Class for constructing dd tag.
 
     Args:
@@ -14,16 +15,11 @@ class DD(object):
 
     .. versionadded:: 0.2.0
     """
-    def __init__(self, text=None):
-        self.tag = 'dd'
-        self.values = {'text': text}
+    template = dd
+    __slots__ = ()
 
-    def construct(self):
-        """Returns the constructed dd tag <dd></dd>."""
-        return dd.render(self.values)
 
-
-class DL(object):
+class DL(TextElement):
     """Class for constructing dl tag.
 
     Args:
@@ -31,16 +27,11 @@ class DL(object):
 
     .. versionadded:: 0.2.0
     """
-    def __init__(self, text=None):
-        self.tag = 'dl'
-        self.values = {'text': text}
-
-    def construct(self):
-        """Returns the constructed dl tag <dl></dl>."""
-        return dl.render(self.values)
+    template = dl
+    __slots__ = ()
 
 
-class DT(object):
+class DT(TextElement):
     """Class for constructing dt tag.
 
     Args:
@@ -48,10 +39,5 @@ class DT(object):
 
     .. versionadded:: 0.2.0
     """
-    def __init__(self, text=None):
-        self.tag = 'dt'
-        self.values = {'text': text}
-
-    def construct(self):
-        """Returns the constructed dt tag <dt></dt>."""
-        return dt.render(self.values)
+    template = dt
+    __slots__ = ()
@@ -3,10 +3,11 @@
 
 from __future__ import absolute_import
 
+from ..root.element import Element
 from ...templates.html.tags import details
 
 
-class Details(object):
+class Details(Element):
     """Class for constructing details tag.
 
     Args:
@@ -17,10 +18,10 @@ class Details(object):
 
     .. versionadded:: 0.2.0
     """
-    def __init__(self, open=False, text=None):
+    template = details
+    __slots__ = ()
+
+    def __init__(self, open=False, text=None, **global_attributes):
         self.tag = 'details'
         self.values = {'open': open, 'text': text}
-
-    def construct(self):
-        """Returns the constructed details tag <details></details>."""
-        return details.render(self.values)
+        self.set_global_attributes(global_attributes)
@@ -3,10 +3,11 @@
 
 from __future__ import absolute_import
 
+from ..root.element import Element
 from ...templates.html.tags import dialog
 
 
-class Dialog(object):
+class Dialog(Element):
     """Class for constructing dialog tag.
 
     Args:
@@ -17,10 +18,10 @@ class Dialog(object):
 
     .. versionadded:: 0.2.0
     """
-    def __init__(self, open=False, text=None):
+    template = dialog
+    __slots__ = ()
+
+    def __init__(self, open=False, text=None, **global_attributes):
         self.tag = 'dialog'
         self.values = {'open': open, 'text': text}
-
-    def construct(self):
-        """Returns the constructed dialog tag <dialog></dialog>."""
-        return dialog.render(self.values)
+        self.set_global_attributes(global_attributes)
@@ -3,7 +3,8 @@
 
 from __future__ import absolute_import
 
-from ...lib.utils import validate_attribute_values
+from ..root.element import Element
+from ...lib.utils import compile_validator
 from ...templates.html.tags import div
 
 ATTRIBUTES = {
@@ -14,8 +15,12 @@ ATTRIBUTES = {
     }
 }
 
+validate_attributes = compile_validator(tag='div',
+                                        attributes=ATTRIBUTES,
+                                        rules=[('align', 'values')])
 
-class Div(object):
+
+class Div(Element):
     """Class for constructing div tag.
 
     Args:
@@ -25,14 +30,11 @@ class Div(object):
 
     .. versionadded:: 0.2.0
     """
-    def __init__(self, align=None, text=None):
+    template = div
+    __slots__ = ()
+
+    def __init__(self, align=None, text=None, **global_attributes):
         self.tag = 'div'
-        validate_attribute_values(tag=self.tag,
-                                  attribute_name='align',
-                                  attribute_value=align,
-                                  default_values=ATTRIBUTES['align']['values'])
+        validate_attributes(align=align)
         self.values = {'align': align, 'text': text}
-
-    def construct(self):
-        """Returns the constructed div tag <div></div>."""
-        return div.render(self.values)
+        self.set_global_attributes(global_attributes)
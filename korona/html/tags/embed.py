@@ -3,10 +3,11 @@
 
 from __future__ import absolute_import
 
+from ..root.element import Element
 from ...templates.html.tags import embed
 
 
-class Embed(object):
+class Embed(Element):
     """Class for constructing embed tag.
 
     Args:
@@ -17,13 +18,14 @@ class Embed(object):
 
     .. versionadded:: 0.2.0
     """
-    def __init__(self, height=None, width=None, src=None, type=None):
+    template = embed
+    __slots__ = ()
+
+    def __init__(self, height=None, width=None, src=None, type=None,
+                 **global_attributes):
         self.tag = 'embed'
         self.values = {'height': height,
                        'width': width,
                        'src': src,
                        'type': type}
-
-    def construct(self):
-        """Returns the constructed embed tag <embed>."""
-        return embed.render(self.values)
+        self.set_global_attributes(global_attributes)
@@ -3,10 +3,11 @@
 
 from __future__ import absolute_import
 
+from ..root.element import Element
 from ...templates.html.tags import fieldset
 
 
-class FieldSet(object):
+class FieldSet(Element):
     """Class for constructing fieldset tag.
 
     Args:
@@ -17,11 +18,12 @@ class FieldSet(object):
 
     .. versionadded:: 0.2.0
     """
-    def __init__(self, disabled=False, form=None, name=None):
+    template = fieldset
+    __slots__ = ()
+
+    def __init__(self, disabled=False, form=None, name=None,
+                 **global_attributes):
         # TODO: Add support for inner tags.
         self.tag = 'fieldset'
         self.values = {'disabled': disabled, 'form': form, 'name': name}
-
-    def construct(self):
-        """Returns the constructed fieldset tag <fieldset></fieldset>."""
-        return fieldset.render(self.values)
+        self.set_global_attributes(global_attributes)
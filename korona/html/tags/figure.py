@@ -3,10 +3,11 @@
 
 from __future__ import absolute_import
 
+from ..root.element import TextElement
 from ...templates.html.tags import figure
 
 
-class Figure(object):
+class Figure(TextElement):
     """Class for constructing figure tag.
 
     Args:
@@ -14,11 +15,5 @@ class Figure(object):
 
     .. versionadded:: 0.2.0
     """
-    def __init__(self, text=None):
-        # TODO: Add support for inner tags.
-        self.tag = 'figure'
-        self.values = {'text': text}
-
-    def construct(self):
-        """Returns the constructed figure tag <figure></figure>."""
-        return figure.render(self.values)
+    template = figure
+    __slots__ = ()
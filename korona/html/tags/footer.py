@@ -3,10 +3,11 @@
 
 from __future__ import absolute_import
 
+from ..root.element import TextElement
 from ...templates.html.tags import footer
 
 
-class Footer(object):
+class Footer(TextElement):
     """Class for constructing the footer tag.
 
     Args:
@@ -14,11 +15,5 @@ class Footer(object):
 
     .. versionadded:: 0.2.0
     """
-    def __init__(self, text=None):
-        # TODO: Add support for inner tags.
-        self.tag = 'footer'
-        self.values = {'text': text}
-
-    def construct(self):
-        """Returns the constructed footer tag <footer></footer>."""
-        return footer.render(self.values)
+    template = footer
+    __slots__ = ()
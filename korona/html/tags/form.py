@@ -3,7 +3,8 @@
 
 from __future__ import absolute_import
 
-from ...lib.utils import validate_attribute_values
+from ..root.element import Element
+from ...lib.utils import compile_validator
 from ...templates.html.tags import form
 
 ATTRIBUTES = {
@@ -27,8 +28,14 @@ ATTRIBUTES = {
     }
 }
 
+validate_attributes = compile_validator(tag='form',
+                                        attributes=ATTRIBUTES,
+                                        rules=[('autocomplete', 'values'),
+                                               ('enctype', 'values'),
+                                               ('method', 'values')])
 
-class Form(object):
+
+class Form(Element):
     """Class for constructing <form> tag.
 
     Args:
@@ -50,6 +57,9 @@ class Form(object):
 
     .. versionadded:: 0.2.0
     """
+    template = form
+    __slots__ = ()
+
     def __init__(self,
                  accept=None,
                  action=None,
@@ -59,24 +69,12 @@ class Form(object):
                  name=None,
                  novalidate=False,
                  target=None,
-                 text=None):
+                 text=None,
+                 **global_attributes):
         self.tag = 'form'
-        validate_attribute_values(
-            tag=self.tag,
-            attribute_name='autocomplete',
-            attribute_value=autocomplete,
-            default_values=ATTRIBUTES['autocomplete']['values'])
+        validate_attributes(autocomplete=autocomplete)
         self.validate_enctype_attribute(method=method, enctype=enctype)
-        validate_attribute_values(
-            tag=self.tag,
-            attribute_name='enctype',
-            attribute_value=enctype,
-            default_values=ATTRIBUTES['enctype']['values'])
-        validate_attribute_values(
-            tag=self.tag,
-            attribute_name='method',
-            attribute_value=method,
-            default_values=ATTRIBUTES['method']['values'])
+        validate_attributes(enctype=enctype, method=method)
         self.values = {'accept': accept,
                        'action': action,
                        'autocomplete': autocomplete,
@@ -86,10 +84,7 @@ class Form(object):
                        'novalidate': novalidate,
                        'target': target,
                        'text': text}
-
-    def construct(self):
-        """Returns the constructed form tag <form></form>."""
-        return form.render(self.values)
+        self.set_global_attributes(global_attributes)
 
     def validate_enctype_attribute(self, method, enctype):
         """Validates enctype attribute. The enctype attribute can be used only
@@ -3,7 +3,8 @@
 
 from __future__ import absolute_import
 
-from ...lib.utils import validate_attribute_values, validate_url
+from ..root.element import Element
+from ...lib.utils import compile_validator
 from ...templates.html.tags import frame
 
 ATTRIBUTES = {
@@ -47,8 +48,15 @@ ATTRIBUTES = {
     }
 }
 
+validate_attributes = compile_validator(tag='frame',
+                                        attributes=ATTRIBUTES,
+                                        rules=[('frameborder', 'values'),
+                                               ('noresize', 'values'),
+                                               ('scrolling', 'values'),
+                                               ('src', 'url')])
 
-class Frame(object):
+
+class Frame(Element):
     """Class for constructing <frame> tag.
 
     Args:
@@ -69,6 +77,9 @@ class Frame(object):
     .. versionchanged:: 0.3.1
         Added URL validation for src attribute.
     """
+    template = frame
+    __slots__ = ()
+
     def __init__(self,
                  frameborder=None,
                  longdesc=None,
@@ -77,24 +88,13 @@ class Frame(object):
                  name=None,
                  noresize=None,
                  scrolling=None,
-                 src=None):
+                 src=None,
+                 **global_attributes):
         self.tag = 'frame'
-        validate_attribute_values(
-            tag=self.tag,
-            attribute_name='frameborder',
-            attribute_value=frameborder,
-            default_values=ATTRIBUTES['frameborder']['values'])
-        validate_attribute_values(
-            tag=self.tag,
-            attribute_name='noresize',
-            attribute_value=noresize,
-            default_values=ATTRIBUTES['noresize']['values'])
-        validate_attribute_values(
-            tag=self.tag,
-            attribute_name='scrolling',
-            attribute_value=scrolling,
-            default_values=ATTRIBUTES['scrolling']['values'])
-        validate_url(attribute_name='src', url=src)
+        validate_attributes(frameborder=frameborder,
+                            noresize=noresize,
+                            scrolling=scrolling,
+                            src=src)
         self.values = {'frameborder': frameborder,
                        'longdesc': longdesc,
                        'marginheight': marginheight,
@@ -103,7 +103,4 @@ class Frame(object):
                        'noresize': noresize,
                        'scrolling': scrolling,
                        'src': src}
-
-    def construct(self):
-        """Returns the constructed tag <frame>."""
-        return frame.render(self.values)
+        self.set_global_attributes(global_attributes)
@@ -3,10 +3,11 @@
 
 from __future__ import absolute_import
 
+from ..root.element import Element
 from ...templates.html.tags import frameset
 
 
-class FrameSet(object):
+class FrameSet(Element):
     """Class for constructing <frameset> tag.
 
     Args:
@@ -15,10 +16,10 @@ class FrameSet(object):
 
     .. versionadded:: 0.2.0
     """
-    def __init__(self, cols=None, rows=None):
+    template = frameset
+    __slots__ = ()
+
+    def __init__(self, cols=None, rows=None, **global_attributes):
         self.tag = 'frameset'
         self.values = {'cols': cols, 'rows': rows}
-
-    def construct(self):
-        """Returns the constructed tag <frameset>."""
-        return frameset.render(self.values)
+        self.set_global_attributes(global_attributes)
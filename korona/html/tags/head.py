@@ -3,10 +3,11 @@
 
 from __future__ import absolute_import
 
+from ..root.element import Element
 from ...templates.html.tags import head
 
 
-class Head(object):
+class Head(Element):
     """Class for constructing <head> tag.
 
     Args:
@@ -14,12 +15,12 @@ class Head(object):
 
     .. versionadded:: 0.3.0
     """
-    def __init__(self, text=None):
+    template = head
+    __slots__ = ()
+
+    def __init__(self, text=None, **global_attributes):
         # TODO: Add the ability to validate which inner tags can go into the
         # <head> tag.
         self.tag = 'head'
         self.values = {'text': text}
-
-    def construct(self):
-        """Returns the constructed tag <head>."""
-        return head.render(self.values)
+        self.set_global_attributes(global_attributes)
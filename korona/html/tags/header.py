@@ -3,10 +3,11 @@
 
 from __future__ import absolute_import
 
+from ..root.element import TextElement
 from ...templates.html.tags import header
 
 
-class Header(object):
+class Header(TextElement):
     """Class for constructing the header tag.
 
     Args:
@@ -14,11 +15,5 @@ class Header(object):
 
     .. versionadded:: 0.3.0
     """
-    def __init__(self, text=None):
-        # TODO: Add support for inner tags.
-        self.tag = 'header'
-        self.values = {'text': text}
-
-    def construct(self):
-        """Returns the constructed header tag <header></header>."""
-        return header.render(self.values)
+    template = header
+    __slots__ = ()
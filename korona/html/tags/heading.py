@@ -3,7 +3,8 @@
 
 from __future__ import absolute_import
 
-from ...lib.utils import validate_attribute_values
+from ..root.element import Element
+from ...lib.utils import compile_validator
 from ...templates.html.tags import h1, h2, h3, h4, h5, h6
 
 H1_ATTRIBUTES = {
@@ -48,8 +49,33 @@ H6_ATTRIBUTES = {
     }
 }
 
+# The headings have the same attributes, validated by a single function
+# taking the name of the heading as its first argument.
+validate_heading_attributes = compile_validator(tag=None,
+                                                attributes=H1_ATTRIBUTES,
+                                                rules=[('align', 'values')])
 
-class H1(object):
+
+class Heading(Element):
+    """Base class for the heading tags. The heading classes only define their
+    template.
+
+    Args:
+        align (str): Specifies the alignment of a heading.
+        text (str): Specifies the heading text.
+
+    .. versionadded:: 0.4.3-dev
+    """
+    __slots__ = ()
+
+    def __init__(self, align=None, text=None, **global_attributes):
+        self.tag = self.template.tag
+        validate_heading_attributes(self.tag, align=align)
+        self.values = {'align': align, 'text': text}
+        self.set_global_attributes(global_attributes)
+
+
+class H1(Heading):
     """Class for constructing <h1> tag.
 
     Args:
@@ -58,21 +84,11 @@ class H1(object):
 
     .. versionadded:: 0.3.0
     """
-    def __init__(self, align=None, text=None):
-        self.tag = 'h1'
-        validate_attribute_values(
-            tag=self.tag,
-            attribute_name='align',
-            attribute_value=align,
-            default_values=H1_ATTRIBUTES['align']['values'])
-        self.values = {'align': align, 'text': text}
+    template = h1
+    __slots__ = ()
 
-    def construct(self):
-        """Returns the constructed tag <h1>."""
-        return h1.render(self.values)
 
-
-class H2(object):
+class H2(Heading):
     """Class for constructing <h2> tag.
 
     Args:
@@ -81,21 +97,11 @@ class H2(object):
 
     .. versionadded:: 0.3.0
     """
-    def __init__(self, align=None, text=None):
-        self.tag = 'h2'
-        validate_attribute_values(
-            tag=self.tag,
-            attribute_name='align',
-            attribute_value=align,
-            default_values=H2_ATTRIBUTES['align']['values'])
-        self.values = {'align': align, 'text': text}
-
-    def construct(self):
-        """Returns the constructed tag <h2>."""
-        return h2.render(self.values)
+    template = h2
+    __slots__ = ()
 
 
-class H3(object):
+class H3(Heading):
     """Class for constructing <h3> tag.
 
     Args:
@@ -104,21 +110,11 @@ class H3(object):
 
     .. versionadded:: 0.3.0
     """
-    def __init__(self, align=None, text=None):
-        self.tag = 'h3'
-        validate_attribute_values(
-            tag=self.tag,
-            attribute_name='align',
-            attribute_value=align,
-            default_values=H3_ATTRIBUTES['align']['values'])
-        self.values = {'align': align, 'text': text}
-
-    def construct(self):
-        """Returns the constructed tag <h3>."""
-        return h3.render(self.values)
+    template = h3
+    __slots__ = ()
 
 
-class H4(object):
+class H4(Heading):
     """Class for constructing <h4> tag.
 
     Args:
@@ -127,21 +123,11 @@ class H4(object):
 
     .. versionadded:: 0.3.0
     """
-    def __init__(self, align=None, text=None):
-        self.tag = 'h4'
-        validate_attribute_values(
-            tag=self.tag,
-            attribute_name='align',
-            attribute_value=align,
-            default_values=H4_ATTRIBUTES['align']['values'])
-        self.values = {'align': align, 'text': text}
+    template = h4
+    __slots__ = ()
 
-    def construct(self):
-        """Returns the constructed tag <h4>."""
-        return h4.render(self.values)
 
-
-class H5(object):
+class H5(Heading):
     """Class for constructing <h5> tag.
 
     Args:
@@ -150,21 +136,11 @@ class H5(object):
 
     .. versionadded:: 0.3.0
     """
-    def __init__(self, align=None, text=None):
-        self.tag = 'h5'
-        validate_attribute_values(
-            tag=self.tag,
-            attribute_name='align',
-            attribute_value=align,
-            default_values=H5_ATTRIBUTES['align']['values'])
-        self.values = {'align': align, 'text': text}
-
-    def construct(self):
-        """Returns the constructed tag <h5>."""
-        return h5.render(self.values)
+    template = h5
+    __slots__ = ()
 
 
-class H6(object):
+class H6(Heading):
     """Class for constructing <h6> tag.
 
     Args:
@@ -173,15 +149,5 @@ class H6(object):
 
     .. versionadded:: 0.3.0
     """
-    def __init__(self, align=None, text=None):
-        self.tag = 'h6'
-        validate_attribute_values(
-            tag=self.tag,
-            attribute_name='align',
-            attribute_value=align,
-            default_values=H6_ATTRIBUTES['align']['values'])
-        self.values = {'align': align, 'text': text}
-
-    def construct(self):
-        """Returns the constructed tag <h6>."""
-        return h6.render(self.values)
+    template = h6
+    __slots__ = ()
@@ -3,7 +3,8 @@
 
 from __future__ import absolute_import
 
-from ...lib.utils import validate_attribute_values
+from ..root.element import Element
+from ...lib.utils import compile_validator
 from ...templates.html.tags import hr
 
 ATTRIBUTES = {
@@ -27,8 +28,12 @@ ATTRIBUTES = {
     }
 }
 
+validate_attributes = compile_validator(tag='hr',
+                                        attributes=ATTRIBUTES,
+                                        rules=[('align', 'values')])
 
-class HR(object):
+
+class HR(Element):
     """Class for constructing hr tag.
 
     Args:
@@ -40,17 +45,15 @@ class HR(object):
 
     .. versionadded:: 0.3.0
     """
-    def __init__(self, align=None, noshade=False, size=None, width=None):
+    template = hr
+    __slots__ = ()
+
+    def __init__(self, align=None, noshade=False, size=None, width=None,
+                 **global_attributes):
         self.tag = 'hr'
-        validate_attribute_values(tag=self.tag,
-                                  attribute_name='align',
-                                  attribute_value=align,
-                                  default_values=ATTRIBUTES['align']['values'])
+        validate_attributes(align=align)
         self.values = {'align': align,
                        'noshade': noshade,
                        'size': size,
                        'width': width}
-
-    def construct(self):
-        """Returns the constructed hr tag <hr>."""
-        return hr.render(self.values)
+        self.set_global_attributes(global_attributes)
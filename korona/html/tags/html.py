@@ -3,11 +3,12 @@
 
 from __future__ import absolute_import
 
+from ..root.element import Element
 from ...lib.utils import validate_url
 from ...templates.html.tags import html
 
 
-class Html(object):
+class Html(Element):
     """Class for constructing html tag.
 
     Args:
@@ -15,18 +16,22 @@ class Html(object):
             (for offline browsing)
         xmlns (str): Specifies the XML namespace attribute (If you need your
             content to conform to XHTML)
-        text (str): Specifies the html text. (As in <html>{text}</html>)
+        text (mixed): Specifies the html text. (As in <html>{text}</html>)
+            It can also be a child tag or a list of child tags and strings.
 
     .. versionadded:: 0.4.0
+
+    .. versionchanged:: 0.4.3-dev
+        Added support for inner tags.
     """
-    def __init__(self, manifest=None, xmlns=None, text=None):
-        # TODO: Add support for inner tags.
+    template = html
+    __slots__ = ()
+
+    def __init__(self, manifest=None, xmlns=None, text=None,
+                 **global_attributes):
         self.tag = 'html'
         validate_url(attribute_name='manifest', url=manifest)
         self.values = {'manifest': manifest,
                        'xmlns': xmlns,
                        'text': text}
-
-    def construct(self):
-        """Returns the constructed html tag <html>."""
-        return html.render(self.values)
+        self.set_global_attributes(global_attributes)
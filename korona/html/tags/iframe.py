@@ -4,7 +4,8 @@
 
 from __future__ import absolute_import
 
-from ...lib.utils import validate_attribute_values, validate_url
+from ..root.element import Element
+from ...lib.utils import compile_validator, validate_attribute_values
 from ...templates.html.tags import iframe
 
 ATTRIBUTES = {
@@ -73,8 +74,16 @@ ATTRIBUTES = {
     }
 }
 
+validate_attributes = compile_validator(tag='iframe',
+                                        attributes=ATTRIBUTES,
+                                        rules=[('align', 'values'),
+                                               ('frameborder', 'values'),
+                                               ('longdesc', 'url'),
+                                               ('scrolling', 'values'),
+                                               ('src', 'url')])
 
-class IFrame(object):
+
+class IFrame(Element):
     """Class for constructing <iframe> tag.
 
     Args:
@@ -102,6 +111,9 @@ class IFrame(object):
 
     .. versionadded:: 0.4.0
     """
+    template = iframe
+    __slots__ = ()
+
     def __init__(self,
                  align=None,
                  frameborder=None,
@@ -114,25 +126,14 @@ class IFrame(object):
                  scrolling=None,
                  src=None,
                  srcdoc=None,
-                 width=None):
+                 width=None,
+                 **global_attributes):
         self.tag = 'iframe'
-        validate_attribute_values(tag=self.tag,
-                                  attribute_name='align',
-                                  attribute_value=align,
-                                  default_values=ATTRIBUTES['align']['values'])
-        validate_attribute_values(
-            tag=self.tag,
-            attribute_name='frameborder',
-            attribute_value=frameborder,
-            default_values=ATTRIBUTES['frameborder']['values'])
-        validate_url(attribute_name='longdesc', url=longdesc)
+        validate_attributes(align=align,
+                            frameborder=frameborder,
+                            longdesc=longdesc)
         self.validate_sandbox(sandbox=sandbox)
-        validate_attribute_values(
-            tag=self.tag,
-            attribute_name='scrolling',
-            attribute_value=scrolling,
-            default_values=ATTRIBUTES['scrolling']['values'])
-        validate_url(attribute_name='src', url=src)
+        validate_attributes(scrolling=scrolling, src=src)
         self.values = {'align': align,
                        'frameborder': frameborder,
                        'height': height,
@@ -145,10 +146,7 @@ class IFrame(object):
                        'src': src,
                        'srcdoc': srcdoc,
                        'width': width}
-
-    def construct(self):
-        """Returns the constructed iframe tag <iframe>."""
-        return iframe.render(self.values)
+        self.set_global_attributes(global_attributes)
 
     def validate_sandbox(self, sandbox):
         """Validates sandbox attribute. The value of the sandbox attribute
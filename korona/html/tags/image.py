@@ -4,7 +4,8 @@
 
 from __future__ import absolute_import
 
-from ...lib.utils import validate_attribute_values, validate_url
+from ..root.element import Element
+from ...lib.utils import compile_validator
 from ...templates.html.tags import img
 
 ATTRIBUTES = {
@@ -64,8 +65,14 @@ ATTRIBUTES = {
     }
 }
 
+validate_attributes = compile_validator(tag='img',
+                                        attributes=ATTRIBUTES,
+                                        rules=[('align', 'values'),
+                                               ('longdesc', 'url'),
+                                               ('src', 'url')])
 
-class Img(object):
+
+class Img(Element):
     """Class for constructing <img> tag.
 
     Args:
@@ -87,6 +94,9 @@ class Img(object):
 
     .. versionadded:: 0.4.0
     """
+    template = img
+    __slots__ = ()
+
     def __init__(self,
                  align=None,
                  alt=None,
@@ -99,15 +109,11 @@ class Img(object):
                  src=None,
                  usemap=None,
                  vspace=None,
-                 width=None):
+                 width=None,
+                 **global_attributes):
         self.tag = 'img'
-        validate_attribute_values(tag=self.tag,
-                                  attribute_name='align',
-                                  attribute_value=align,
-                                  default_values=ATTRIBUTES['align']['values'])
         # TODO: Add validation for ismap attribute.
-        validate_url(attribute_name='longdesc', url=longdesc)
-        validate_url(attribute_name='src', url=src)
+        validate_attributes(align=align, longdesc=longdesc, src=src)
         # TODO: Add validation for usemap attribute.
         self.values = {'align': align,
                        'alt': alt,
@@ -121,7 +127,4 @@ class Img(object):
                        'usemap': usemap,
                        'vspace': vspace,
                        'width': width}
-
-    def construct(self):
-        """Returns the constructed image tag <img>."""
-        return img.render(self.values)
+        self.set_global_attributes(global_attributes)
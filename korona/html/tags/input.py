@@ -4,13 +4,12 @@
 
 from __future__ import absolute_import
 
+from ..root.element import Element
 from ...lib.utils import (
-    validate_attribute_values,
-    validate_boolean_attribute,
+    compile_validator,
     validate_date_attribute,
     validate_time_attribute,
-    validate_number_attribute,
-    validate_url,
+    validate_number_attribute
 )
 from ...templates.html.tags import input
 
@@ -340,8 +339,56 @@ ATTRIBUTES = {
     }
 }
 
+validate_attributes = compile_validator(tag='input',
+                                        attributes=ATTRIBUTES,
+                                        rules=[('align', 'values'),
+                                               ('autocomplete', 'values'),
+                                               ('autofocus', 'boolean'),
+                                               ('checked', 'boolean'),
+                                               ('disabled', 'boolean'),
+                                               ('formaction', 'url'),
+                                               ('formenctype', 'values'),
+                                               ('formmethod', 'values'),
+                                               ('formnovalidate', 'boolean'),
+                                               ('height', 'number'),
+                                               ('maxlength', 'number'),
+                                               ('readonly', 'boolean'),
+                                               ('required', 'boolean'),
+                                               ('size', 'number'),
+                                               ('src', 'url'),
+                                               ('step', 'number'),
+                                               ('type', 'values'),
+                                               ('width', 'number')])
+
+
+def get_attributes_for_input_types():
+    """Returns the attributes which can be used with each of the input types,
+    inverting ``INPUT_TYPES_FOR_ATTRIBUTES``.
+
+    Returns:
+        dict: Input types mapped to frozensets of attribute names.
+
+    .. versionadded:: 0.4.3-dev
+    """
+    attributes = {}
+    for name, attribute in INPUT_TYPES_FOR_ATTRIBUTES.items():
+        for input_type in attribute['types']:
+            attributes.setdefault(input_type, set()).add(name)
+
+    return dict((input_type, frozenset(names))
+                for input_type, names in attributes.items())
+
+
+NO_ATTRIBUTES = frozenset()
+ATTRIBUTES_FOR_INPUT_TYPES = get_attributes_for_input_types()
+
+# Attributes which can be changed in the variants of a prototype by only
+# validating their new value (See :meth:`Input._validate_variant`).
+VARIANT_ATTRIBUTES = frozenset(['form', 'list', 'name', 'placeholder',
+                                'value'])
 
-class Input(object):
+
+class Input(Element):
     """Class for constructing <input> tag.
 
     Args:
@@ -407,6 +454,9 @@ class Input(object):
         Renamed the method :func:`validate_value` to
         :func:`validate_value_attribute`.
     """
+    template = input
+    __slots__ = ()
+
     def __init__(self,
                  accept=None,
                  align=None,
@@ -438,191 +488,70 @@ class Input(object):
                  step=None,
                  type=None,
                  value=None,
-                 width=None):
+                 width=None,
+                 **global_attributes):
         self.tag = 'input'
 
-        # Series of validation methods for all the input tag's attributes.
-        # Validation method for 'accept' attribute.
-        self.validate_input_attribute(type=type,
-                                      attribute_name='accept',
-                                      attribute_value=accept)
-
-        # Validation method for 'align' attribute.
-        validate_attribute_values(
-            tag=self.tag,
-            attribute_name='align',
-            attribute_value=align,
-            default_values=ATTRIBUTES['align']['values'])
-        self.validate_input_attribute(type=type,
-                                      attribute_name='align',
-                                      attribute_value=align)
-
-        # Validation method for 'alt' attribute.
-        self.validate_input_attribute(type=type,
-                                      attribute_name='alt',
-                                      attribute_value=alt)
-
-        # Validation methods for 'autocomplete' attribute.
-        self.validate_input_attribute(type=type,
-                                      attribute_name='autocomplete',
-                                      attribute_value=autocomplete)
-        validate_attribute_values(
-            tag=self.tag,
-            attribute_name='autocomplete',
-            attribute_value=autocomplete,
-            default_values=ATTRIBUTES['autocomplete']['values'])
-
-        # Validation method for 'autofocus' attribute.
-        validate_boolean_attribute(tag=self.tag,
-                                   attribute_name='autofocus',
-                                   attribute_value=autofocus)
-
-        # Validation method for 'checked' attribute.
-        self.validate_input_attribute(type=type,
-                                      attribute_name='checked',
-                                      attribute_value=checked)
-        validate_boolean_attribute(tag=self.tag,
-                                   attribute_name='checked',
-                                   attribute_value=checked)
+        # Validation of the attributes which can only be used with some of
+        # the input types.
+        self.validate_input_attributes(
+            type=type,
+            attributes=(('accept', accept),
+                        ('align', align),
+                        ('alt', alt),
+                        ('autocomplete', autocomplete),
+                        ('checked', checked),
+                        ('formaction', formaction),
+                        ('formenctype', formenctype),
+                        ('formmethod', formmethod),
+                        ('formnovalidate', formnovalidate),
+                        ('formtarget', formtarget),
+                        ('height', height),
+                        ('max', max),
+                        ('min', min),
+                        ('multiple', multiple),
+                        ('pattern', pattern),
+                        ('placeholder', placeholder),
+                        ('required', required),
+                        ('size', size),
+                        ('src', src),
+                        ('step', step),
+                        ('width', width)))
 
         # Validation method for 'dirname' attribute.
         self.validate_dirname(name=name, dirname=dirname)
 
-        # Validation method for 'disabled' attribute.
-        validate_boolean_attribute(tag=self.tag,
-                                   attribute_name='disabled',
-                                   attribute_value=disabled)
-
-        # Validation method for 'formaction' attribute.
-        self.validate_input_attribute(type=type,
-                                      attribute_name='formaction',
-                                      attribute_value=formaction)
-        validate_url(attribute_name='formaction', url=formaction)
-
-        # Validation method for 'formenctype' attribute.
-        validate_attribute_values(
-            tag=self.tag,
-            attribute_name='formenctype',
-            attribute_value=formenctype,
-            default_values=ATTRIBUTES['formenctype']['values'])
-        self.validate_input_attribute(type=type,
-                                      attribute_name='formenctype',
-                                      attribute_value=formenctype)
-
-        # Validation methods for 'formmethod' attribute.
-        validate_attribute_values(
-            tag=self.tag,
-            attribute_name='formmethod',
-            attribute_value=formmethod,
-            default_values=ATTRIBUTES['formmethod']['values'])
-        self.validate_input_attribute(type=type,
-                                      attribute_name='formmethod',
-                                      attribute_value=formmethod)
-
-        # Validation methods for 'formnovalidate' attribute.
-        self.validate_input_attribute(type=type,
-                                      attribute_name='formnovalidate',
-                                      attribute_value=formnovalidate)
-        validate_boolean_attribute(tag=self.tag,
-                                   attribute_name='formnovalidate',
-                                   attribute_value=formnovalidate)
-
-        # Validation method for 'formtarget' attribute.
-        self.validate_input_attribute(type=type,
-                                      attribute_name='formtarget',
-                                      attribute_value=formtarget)
-
-        # Validation methods for 'height' attribute.
-        self.validate_input_attribute(type=type,
-                                      attribute_name='height',
-                                      attribute_value=height)
-        validate_number_attribute(tag=self.tag,
-                                  attribute_name='height',
-                                  attribute_value=height)
-
-        # Validation method for 'max' attribute.
+        # Validation methods for 'max' and 'min' attributes.
         self.validate_max_min_attributes(type=type,
                                          attribute_name='max',
                                          attribute_value=max)
-
-        # Validation method for 'maxlength' attribute.
-        validate_number_attribute(tag=self.tag,
-                                  attribute_name='maxlength',
-                                  attribute_value=maxlength)
-
-        # Validation method for 'min' attribute.
         self.validate_max_min_attributes(type=type,
                                          attribute_name='min',
                                          attribute_value=min)
 
-        # Validation method for 'multiple' attribute.
-        self.validate_input_attribute(type=type,
-                                      attribute_name='multiple',
-                                      attribute_value=multiple)
-
-        # Validation method for 'pattern' attribute.
-        self.validate_input_attribute(type=type,
-                                      attribute_name='pattern',
-                                      attribute_value=pattern)
-
-        # Validation method for 'placeholder' attribute.
-        self.validate_input_attribute(type=type,
-                                      attribute_name='placeholder',
-                                      attribute_value=placeholder)
-
-        # Validation method for 'readonly' attribute.
-        validate_boolean_attribute(tag=self.tag,
-                                   attribute_name='readonly',
-                                   attribute_value=readonly)
-
-        # Validation method for 'required' attribute.
-        self.validate_input_attribute(type=type,
-                                      attribute_name='required',
-                                      attribute_value=required)
-        validate_boolean_attribute(tag=self.tag,
-                                   attribute_name='required',
-                                   attribute_value=required)
-
-        # Validation method for 'size' attribute.
-        self.validate_input_attribute(type=type,
-                                      attribute_name='size',
-                                      attribute_value=size)
-        validate_number_attribute(tag=self.tag,
-                                  attribute_name='size',
-                                  attribute_value=size)
-
-        # Validation method for 'src' attribute.
-        self.validate_input_attribute(type=type,
-                                      attribute_name='src',
-                                      attribute_value=src)
-        validate_url(attribute_name='src', url=src)
-
-        # Validation method for 'step' attribute.
-        self.validate_input_attribute(type=type,
-                                      attribute_name='step',
-                                      attribute_value=step)
-        validate_number_attribute(tag=self.tag,
-                                  attribute_name='step',
-                                  attribute_value=step)
-
-        # Validation method for 'type' attribute.
-        validate_attribute_values(
-            tag=self.tag,
-            attribute_name='type',
-            attribute_value=type,
-            default_values=ATTRIBUTES['type']['values'])
+        # Validation of the values of the attributes.
+        validate_attributes(align=align,
+                            autocomplete=autocomplete,
+                            autofocus=autofocus,
+                            checked=checked,
+                            disabled=disabled,
+                            formaction=formaction,
+                            formenctype=formenctype,
+                            formmethod=formmethod,
+                            formnovalidate=formnovalidate,
+                            height=height,
+                            maxlength=maxlength,
+                            readonly=readonly,
+                            required=required,
+                            size=size,
+                            src=src,
+                            step=step,
+                            type=type,
+                            width=width)
 
         # Validation method for 'value' attribute.
         self.validate_value_attribute(type=type, value=value)
 
-        # Validation method for 'width' attribute.
-        self.validate_input_attribute(type=type,
-                                      attribute_name='width',
-                                      attribute_value=width)
-        validate_number_attribute(tag=self.tag,
-                                  attribute_name='width',
-                                  attribute_value=width)
-
         self.values = {'accept': accept,
                        'align': align,
                        'alt': alt,
@@ -654,10 +583,53 @@ class Input(object):
                        'type': type,
                        'value': value,
                        'width': width}
+        self.set_global_attributes(global_attributes)
 
-    def construct(self):
-        """Constructs the <input> tag."""
-        return input.render(self.values)
+    def _validate_variant(self, changes):
+        """Validates the attributes changed in a variant of a prototype
+        against the input type of the prototype. The name can only be
+        validated on its own if there is no dirname, which depends on it.
+        """
+        if not VARIANT_ATTRIBUTES.issuperset(changes):
+            return False
+
+        if 'name' in changes and 'dirname' in self._values:
+            return False
+
+        type = self._values.get('type')
+        self.validate_input_attributes(
+            type=type,
+            attributes=(('placeholder', changes.get('placeholder')),))
+        self.validate_value_attribute(type=type, value=changes.get('value'))
+        return True
+
+    def validate_input_attributes(self, type, attributes):
+        """Validates all the attributes which depend on the input type in one
+        go. The attributes given with a value are compared against the
+        attributes permitted by the input type (see
+        ``ATTRIBUTES_FOR_INPUT_TYPES``). Only if some of them are not
+        permitted, the attributes are validated one by one for raising the
+        error of the first one.
+
+        Args:
+            type (str): Input type.
+            attributes (tuple): Pairs of attribute names and values.
+
+        .. versionadded:: 0.4.3-dev
+        """
+        try:
+            permitted = ATTRIBUTES_FOR_INPUT_TYPES.get(type, NO_ATTRIBUTES)
+        except TypeError:
+            permitted = NO_ATTRIBUTES
+
+        given = {name for name, value in attributes if value}
+        if given <= permitted:
+            return
+
+        for name, value in attributes:
+            self.validate_input_attribute(type=type,
+                                          attribute_name=name,
+                                          attribute_value=value)
 
     def validate_input_attribute(self, type, attribute_name, attribute_value):
         """Validates input tag attribute. Some of the input attributes depend
@@ -706,10 +678,6 @@ class Input(object):
         """Validates the max attribute whether it is an integer/float/datetime
         value.
         """
-        self.validate_input_attribute(type=type,
-                                      attribute_name=attribute_name,
-                                      attribute_value=attribute_value)
-
         # There are 3 cases to be considered as part of this method. max/min
         # attributes can be integer/float/date/time values.
         #
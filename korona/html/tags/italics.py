@@ -3,10 +3,11 @@
 
 from __future__ import absolute_import
 
+from ..root.element import TextElement
 from ...templates.html.tags import italics
 
 
-class I(object):
+class I(TextElement):
     """Class for constructing <i> tag.
 
     Args:
@@ -14,10 +15,5 @@ class I(object):
 
     .. versionadded:: 0.4.0
     """
-    def __init__(self, text=None):
-        self.tag = 'i'
-        self.values = {'text': text}
-
-    def construct(self):
-        """Returns the constructed italics tag <i>."""
-        return italics.render(self.values)
+    template = italics
+    __slots__ = ()
@@ -0,0 +1,286 @@
+# -*- coding: utf-8 -*-
+"""Caches for the constructed html."""
+
+from collections import OrderedDict, namedtuple
+from hashlib import sha1
+import glob
+import os
+import pickle
+import sys
+import tempfile
+import threading
+
+try:
+    from os import replace
+except ImportError:  # pragma: no cover
+    from os import rename as replace
+
+# Default size limit of a render cache, in bytes.
+MAX_SIZE = 16 * 1024 * 1024
+
+# Extension of the files of a file storage.
+FILE_SUFFIX = '.fragment'
+
+
+class CacheInfo(namedtuple('CacheInfo', ['hits', 'misses', 'entries', 'size',
+                                         'max_size'])):
+    """Counters of a cache (See :meth:`RenderCache.info`)."""
+    __slots__ = ()
+
+    @property
+    def hit_rate(self):
+        """Ratio of the lookups which were hits, or ``0.0`` before the first
+        lookup.
+
+        .. versionadded:: 0.4.3-dev
+        """
+        lookups = self.hits + self.misses
+        if not lookups:
+            return 0.0
+        return self.hits / float(lookups)
+
+
+class RenderCache(object):
+    """Least recently used cache of constructed tags. A tag is cached under
+    its class and a snapshot of its non-empty attribute values, so the same
+    tag created again is constructed with a dictionary lookup. The cache can
+    be shared between threads: the lookups do not take its lock, which is
+    only held while a tag is added or removed.
+
+    Building the key of a tag costs about as much as rendering the tag with
+    the ``compiled`` renderer backend, so the cache only pays off with the
+    ``jinja`` backend (or for whole groups of tags, See
+    :class:`korona.html.root.component.Component`).
+
+    Args:
+        max_size (int): Size limit of the cached strings in bytes. The least
+            recently used tags are evicted when the limit is exceeded.
+
+    .. versionadded:: 0.4.3-dev
+    """
+    def __init__(self, max_size=MAX_SIZE):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.size = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def get_key(tag_class, values):
+        """Returns the cache key of a tag, or ``None`` if some of its values
+        are not hashable. The type of a value is part of the key as equal
+        values of different types are rendered differently (Ex. ``1`` and
+        ``True``).
+        """
+        try:
+            return tag_class, frozenset((name, value.__class__, value)
+                                        for name, value in values.items()
+                                        if value)
+        except TypeError:
+            return None
+
+    @staticmethod
+    def get_size(value):
+        """Returns the size of a cached string in bytes."""
+        return sys.getsizeof(value)
+
+    def get(self, key):
+        """Returns the cached string of the key, or ``None`` if it is not
+        cached. The lookup does not take the lock, as reading the key and
+        marking it as the most recently used one are single dictionary
+        operations. A key evicted by another thread in between is still a
+        hit.
+        """
+        value = self._entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+
+        self._move_to_end(key)
+        self.hits += 1
+        return value
+
+    def _move_to_end(self, key):
+        """Marks the key as the most recently used one, if it is still
+        cached.
+        """
+        try:
+            self._entries.move_to_end(key)
+        except KeyError:
+            pass
+        except AttributeError:  # pragma: no cover
+            with self._lock:
+                if key in self._entries:
+                    self._entries[key] = self._entries.pop(key)
+
+    def set(self, key, value):
+        """Caches the string under the key, evicting the least recently used
+        strings if the cache gets larger than its size limit.
+        """
+        size = self.get_size(value)
+        if size > self.max_size:
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.size -= self.get_size(previous)
+
+            self._entries[key] = value
+            self.size += size
+
+            while self.size > self.max_size:
+                _, evicted = self._entries.popitem(last=False)
+                self.size -= self.get_size(evicted)
+
+    def render(self, tag_class, values, render):
+        """Returns the cached string of a tag, rendering and caching it if it
+        is not cached yet.
+
+        Args:
+            tag_class (type): Class of the tag.
+            values (dict): Attribute values of the tag.
+            render (function): Function rendering the values.
+
+        Returns:
+            str: The constructed tag.
+        """
+        key = self.get_key(tag_class, values)
+        if key is None:
+            return render(values)
+
+        value = self.get(key)
+        if value is None:
+            value = render(values)
+            self.set(key, value)
+        return value
+
+    def remove(self, key):
+        """Removes the cached string of the key, if it is cached.
+
+        Returns:
+            bool: Whether the key was cached.
+        """
+        with self._lock:
+            value = self._entries.pop(key, None)
+            if value is None:
+                return False
+
+            self.size -= self.get_size(value)
+            return True
+
+    def clear(self, reset_counters=True):
+        """Removes all the cached strings and resets the counters, unless
+        ``reset_counters`` is ``False``.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+            if reset_counters:
+                self.hits = 0
+                self.misses = 0
+
+    def info(self):
+        """Returns the counters of the cache.
+
+        Returns:
+            CacheInfo: The hits, misses, number of entries, size and size
+            limit of the cache.
+        """
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, len(self._entries),
+                             self.size, self.max_size)
+
+
+class MemoryStorage(RenderCache):
+    """In-process storage of a fragment cache (See
+    :class:`korona.html.root.fragment_cache.FragmentCache`), keeping the least
+    recently used values up to a size limit in bytes. The size of a tuple
+    value is the size of its items.
+
+    Args:
+        max_size (int): Size limit of the stored values in bytes.
+
+    .. versionadded:: 0.4.3-dev
+    """
+    @staticmethod
+    def get_size(value):
+        """Returns the size of a stored value in bytes."""
+        size = sys.getsizeof(value)
+        if isinstance(value, tuple):
+            size += sum(sys.getsizeof(item) for item in value)
+        return size
+
+
+class FileStorage(object):
+    """Storage of a fragment cache (See
+    :class:`korona.html.root.fragment_cache.FragmentCache`) in the files of a
+    directory, so that the values are shared by the processes of a host and
+    kept across restarts. The values are pickled, one file per key, and
+    written atomically. The storage has no size limit.
+
+    The directory should only be writable by the application, as the values
+    are unpickled when they are read.
+
+    Args:
+        directory (str): Directory of the files. It is created if it does
+            not exist.
+
+    .. versionadded:: 0.4.3-dev
+    """
+    def __init__(self, directory):
+        self.directory = directory
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+    def get_path(self, key):
+        """Returns the path of the file of the key."""
+        digest = sha1(key.encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, digest + FILE_SUFFIX)
+
+    def get(self, key):
+        """Returns the stored value of the key, or ``None`` if it is not
+        stored (or its file cannot be read).
+        """
+        try:
+            with open(self.get_path(key), 'rb') as stream:
+                return pickle.load(stream)
+        except (EnvironmentError, EOFError, pickle.UnpicklingError):
+            return None
+
+    def set(self, key, value):
+        """Stores the value under the key."""
+        descriptor, path = tempfile.mkstemp(dir=self.directory,
+                                            suffix='.tmp')
+        try:
+            with os.fdopen(descriptor, 'wb') as stream:
+                pickle.dump(value, stream, pickle.HIGHEST_PROTOCOL)
+            replace(path, self.get_path(key))
+        except BaseException:
+            os.remove(path)
+            raise
+
+    def remove(self, key):
+        """Removes the stored value of the key, if it is stored.
+
+        Returns:
+            bool: Whether the key was stored.
+        """
+        try:
+            os.remove(self.get_path(key))
+        except EnvironmentError:
+            return False
+        return True
+
+    def clear(self):
+        """Removes all the stored values."""
+        pattern = os.path.join(self.directory, '*' + FILE_SUFFIX)
+        for path in glob.glob(pattern):
+            try:
+                os.remove(path)
+            except EnvironmentError:
+                pass
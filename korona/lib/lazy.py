@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+"""Lazy attributes of packages, imported from their modules on first
+access.
+"""
+
+import importlib
+import sys
+
+
+def lazy_attributes(package, modules, namespace):
+    """Returns the module level ``__getattr__`` and ``__dir__`` functions
+    (PEP 562) of a package whose attributes are imported from its modules the
+    first time they are accessed. Module level ``__getattr__`` is only
+    supported by python 3.7 or newer, so all the attributes are imported
+    right away on the older versions.
+
+    Args:
+        package (str): Name of the package.
+        modules (dict): Names of the modules (relative to the package)
+            defining the attributes, by attribute name.
+        namespace (dict): Globals of the package, in which the imported
+            attributes are set.
+
+    Returns:
+        tuple: The ``__getattr__`` and ``__dir__`` functions.
+
+    Example::
+
+        __getattr__, __dir__ = lazy_attributes(__name__, MODULES, globals())
+
+    .. versionadded:: 0.4.3-dev
+    """
+    def __getattr__(name):
+        """Imports the attribute the first time it is accessed."""
+        if name not in modules:
+            raise AttributeError('module {0!r} has no attribute {1!r}'
+                                 .format(package, name))
+
+        module = importlib.import_module('.' + modules[name], package)
+        value = getattr(module, name)
+        namespace[name] = value
+        return value
+
+    def __dir__():
+        return sorted(set(namespace) | set(modules))
+
+    if sys.version_info < (3, 7):
+        for name in modules:
+            __getattr__(name)
+
+    return __getattr__, __dir__
@@ -2,6 +2,7 @@
 
 from future.moves.urllib.parse import urlparse
 import datetime
+import keyword
 
 from ..exceptions import AttributeValueError, TagAttributeError
 from ..html.root.tags import TAGS
@@ -139,3 +140,119 @@ def validate_url(attribute_name, url):
         raise ValueError('{attribute_name}: The given string {url} is not a '
                          'valid url.'
                          .format(attribute_name=attribute_name, url=url))
+
+
+def format_coords(values):
+    """Joins the coordinates in the attribute values of a trusted tag (Ex.
+    ``<a>`` or ``<area>``) into a comma separated string.
+
+    Args:
+        values (dict): Attribute values of the tag.
+
+    Returns:
+        dict: The attribute values.
+
+    .. versionadded:: 0.4.3-dev
+    """
+    coords = values['coords']
+    if coords and not isinstance(coords, str):
+        values['coords'] = ','.join(str(coord) for coord in coords)
+    return values
+
+
+VALIDATION_RULES = ('string', 'values', 'boolean', 'number', 'date', 'time',
+                    'url')
+
+
+def compile_validator(tag, attributes, rules):
+    """Compiles the validations of a tag's attributes into a single python
+    function. The confined values of the attributes are read from the
+    attributes schema once and kept in frozensets, and the common cases are
+    checked inline. Only when a check fails, the validation function above is
+    called for raising the same error with the same message.
+
+    Args:
+        tag (str): Name of the html tag. If it is ``None``, the function takes
+            the name of the tag as its first argument (Ex. global
+            attributes).
+        attributes (dict): Attributes schema of the tag (Ex. ``ATTRIBUTES``
+            in ``html/tags/anchor.py``).
+        rules (list): Tuples of an attribute name followed by the validations
+            of the attribute in the order they are run. The validations can
+            be: ``'string'``, ``'values'``, ``'boolean'``, ``'number'``,
+            ``'date'``, ``'time'`` and ``'url'``.
+
+    Returns:
+        function: A function taking the attribute values as keyword arguments
+        (with a trailing underscore for python keywords, Ex. ``class_``).
+
+    .. versionadded:: 0.4.3-dev
+    """
+    namespace = {'_tag': tag,
+                 '_str': str,
+                 '_bool': bool,
+                 '_numbers': (int, float),
+                 '_dates': (datetime.datetime, datetime.date),
+                 '_time': datetime.time,
+                 '_validate_string': validate_string_attribute,
+                 '_validate_values': validate_attribute_values,
+                 '_validate_boolean': validate_boolean_attribute,
+                 '_validate_number': validate_number_attribute,
+                 '_validate_date': validate_date_attribute,
+                 '_validate_time': validate_time_attribute,
+                 '_validate_url': validate_url}
+    types = {'string': '_str',
+             'boolean': '_bool',
+             'number': '_numbers',
+             'date': '_dates',
+             'time': '_time'}
+
+    arguments = []
+    body = []
+    for index, rule in enumerate(rules):
+        name, checks = rule[0], rule[1:]
+        argument = name + '_' if keyword.iskeyword(name) else name
+        if argument not in arguments:
+            arguments.append(argument)
+
+        body.append('    if {0}:'.format(argument))
+        for check in checks:
+            if check not in VALIDATION_RULES:
+                raise ValueError('Validation rule should be one of these: '
+                                 '{0}'.format(','.join(VALIDATION_RULES)))
+
+            if check == 'values':
+                values = attributes[name]['values']
+                namespace['_values_{0}'.format(index)] = frozenset(values)
+                namespace['_list_{0}'.format(index)] = values
+                body.extend([
+                    '        try:',
+                    '            valid = {0} in _values_{1}'
+                    .format(argument, index),
+                    '        except TypeError:',
+                    '            valid = False',
+                    '        if not valid:',
+                    '            _validate_values(_tag, {0!r}, {1}, _list_{2})'
+                    .format(name, argument, index)])
+            elif check == 'url':
+                body.append('        _validate_url({0!r}, {1})'
+                            .format(name, argument))
+            else:
+                body.extend([
+                    '        if not isinstance({0}, {1}):'
+                    .format(argument, types[check]),
+                    '            _validate_{0}(_tag, {1!r}, {2})'
+                    .format(check, name, argument)])
+
+    arguments = ['{0}=None'.format(argument) for argument in arguments]
+    if tag is None:
+        arguments.insert(0, '_tag')
+        del namespace['_tag']
+
+    lines = ['def validate({0}):'.format(', '.join(arguments))]
+    lines.extend(body or ['    pass'])
+
+    code = compile('\n'.join(lines), '<korona:validate {0}>'.format(tag),
+                   'exec')
+    exec(code, namespace)
+    return namespace['validate']
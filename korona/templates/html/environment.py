@@ -1,5 +1,144 @@
 # -*- coding: utf-8 -*-
+"""Jinja environment for the html templates.
 
-from jinja2 import Environment
+The templates are loaded from (in this order):
 
-env = Environment()
+  - The template modules precompiled ahead of time with
+    :func:`compile_templates`. They contain the python code generated by
+    jinja, so loading them never parses any template text.
+  - The template sources registered in :data:`SOURCES`. The code compiled
+    from them is stored in an on-disk bytecode cache keyed by the korona and
+    jinja versions, so the sources are only parsed by the first process.
+
+The environment is shared by all the threads. The jinja templates are loaded
+once (See :class:`korona.templates.html.renderer.Template`) and are safe to
+render from many threads, as every rendering has its own context.
+"""
+
+from hashlib import sha1
+import glob
+import os
+
+import jinja2
+from jinja2 import (
+    ChoiceLoader,
+    DictLoader,
+    Environment,
+    FileSystemBytecodeCache,
+    ModuleLoader,
+    TemplateNotFound
+)
+
+from ...__pkg__ import __version__
+
+# Template sources registered by name (See :func:`register_source` and
+# :class:`renderer.Template`).
+SOURCES = {}
+
+PRECOMPILED_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                'precompiled',
+                                'jinja2-{0}'.format(jinja2.__version__))
+
+BYTECODE_CACHE_PATTERN = ('__korona-{0}-jinja2-{1}-%s.cache'
+                          .format(__version__, jinja2.__version__))
+
+
+class PrecompiledLoader(ModuleLoader):
+    """Loader for the precompiled template modules. A module is keyed by the
+    name and the source of its template, so a module compiled from an older
+    source is never loaded.
+
+    Args:
+        path (str): Directory of the precompiled template modules.
+        sources (dict): Template sources registered by name.
+
+    .. versionadded:: 0.4.3-dev
+    """
+    def __init__(self, path, sources):
+        super(PrecompiledLoader, self).__init__(path)
+        self.sources = sources
+
+    def get_template_key(self, name):
+        """Returns the module name of the precompiled template."""
+        if name not in self.sources:
+            raise TemplateNotFound(name)
+
+        key = u'{0}\n{1}'.format(name, self.sources[name]).encode('utf-8')
+        return 'tmpl_{0}'.format(sha1(key).hexdigest())
+
+
+def register_source(name, source):
+    """Registers the source of a template under its name. The precompiled
+    modules and the bytecode cache are keyed by the registered sources, so a
+    name can not be registered again with a different source.
+
+    Args:
+        name (str): Name of the template (Ex. ``'a.html'``).
+        source (str): Jinja source of the template.
+
+    Raises:
+        ValueError: If another source is registered under the name.
+
+    .. versionadded:: 0.4.3-dev
+    """
+    registered = SOURCES.setdefault(name, source)
+    if registered != source:
+        raise ValueError('A different template source is already registered '
+                         'as {0!r}. Give the template another name.'
+                         .format(name))
+
+
+def get_bytecode_cache():
+    """Returns the on-disk bytecode cache for the templates. The cache
+    directory can be set with the ``KORONA_CACHE_DIR`` environment variable.
+    If there is no usable cache directory, the templates are compiled without
+    a cache.
+    """
+    try:
+        return FileSystemBytecodeCache(
+            directory=os.environ.get('KORONA_CACHE_DIR') or None,
+            pattern=BYTECODE_CACHE_PATTERN)
+    except (OSError, RuntimeError):
+        return None
+
+
+def compile_templates(target=PRECOMPILED_PATH):
+    """Compiles all the html templates to python modules ahead of time, in
+    the same way as jinja's ``Environment.compile_templates``.
+
+    Args:
+        target (str): Directory in which the modules are written.
+
+    Returns:
+        list: Paths of the written modules.
+
+    .. versionadded:: 0.4.3-dev
+    """
+    # Importing the templates registers all their sources.
+    from . import global_attributes, tags
+    for name in tags.__all__:
+        getattr(tags, name)
+
+    if not os.path.isdir(target):
+        os.makedirs(target)
+
+    for path in glob.glob(os.path.join(target, 'tmpl_*.py')):
+        os.remove(path)
+
+    loader = PrecompiledLoader(target, SOURCES)
+    paths = []
+    for name, source in sorted(SOURCES.items()):
+        code = env.compile(source, name, name, raw=True, defer_init=True)
+        path = os.path.join(target,
+                            '{0}.py'.format(loader.get_template_key(name)))
+        with open(path, 'w') as module:
+            module.write(code)
+        paths.append(path)
+
+    return paths
+
+
+env = Environment(loader=ChoiceLoader([PrecompiledLoader(PRECOMPILED_PATH,
+                                                         SOURCES),
+                                       DictLoader(SOURCES)]),
+                  bytecode_cache=get_bytecode_cache())
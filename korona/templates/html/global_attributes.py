@@ -1,9 +1,16 @@
 # -*- coding: utf-8 -*-
 """Template for constructing global attributes."""
 
-from .environment import env
+from .renderer import Template
 
-global_attributes = env.from_string("""\
+global_attributes = Template(
+    name='global_attributes.html',
+    attributes=['accesskey', 'class', 'contenteditable', 'contextmenu', 'dir',
+                'draggable', 'dropzone', 'hidden', 'id', 'lang', 'spellcheck',
+                'style', 'tabindex', 'title', 'translate'],
+    boolean_attributes=['hidden'],
+    text=False,
+    source="""\
 {% if accesskey -%} accesskey="{{ accesskey }}" {% endif -%}
 {% if class -%} class="{{ class }}" {% endif -%}
 {% if contenteditable -%} contenteditable="{{ contenteditable }}" {% endif -%}
@@ -0,0 +1,455 @@
+# -*- coding: utf-8 -*-
+"""Rendering backends for the html templates.
+
+All the html templates in korona have the same shape: an opening tag, a
+series of optional attributes (rendered only when they have a value), an
+optional text and an optional closing tag. Instead of going through the
+jinja runtime for every tag, the ``compiled`` backend turns that shape into
+a specialized python function which only does string joins. Both backends
+produce the same output.
+
+The backend is selected per process either with the ``KORONA_RENDERER``
+environment variable or with :func:`set_backend`.
+
+The templates can be rendered from many threads at the same time. A template
+is built (its jinja template loaded or its render functions compiled) only
+once, by the first thread rendering it. The rendered parts are joined in
+buffers local to every call, so no state is shared while rendering. The
+backend should be set before the threads start rendering.
+"""
+
+import copy
+import os
+import threading
+
+from .environment import env, register_source
+
+JINJA = 'jinja'
+COMPILED = 'compiled'
+BACKENDS = (JINJA, COMPILED)
+
+_backend = os.environ.get('KORONA_RENDERER', JINJA)
+
+# Global attributes rendered by all the html tags, after the attributes of
+# the tag.
+GLOBAL_ATTRIBUTES = ('accesskey', 'class', 'contenteditable', 'contextmenu',
+                     'dir', 'draggable', 'dropzone', 'hidden', 'id', 'lang',
+                     'spellcheck', 'style', 'tabindex', 'title', 'translate')
+GLOBAL_BOOLEAN_ATTRIBUTES = ('hidden',)
+
+# Jinja template shared by all the element templates. The tag and its
+# attributes are given by the element being rendered.
+ELEMENT_SOURCE = """\
+<{{ element.tag }}{% if element.tag_attributes %} {% endif -%}
+{%- for name in element.attributes if values[name] -%}
+    {%- if loop.first and not element.tag_attributes %} {% endif -%}
+    {%- if name in element.boolean_attributes -%}
+        {{ name }} {% else -%}
+        {{ name }}="{{ values[name] }}" {% endif -%}
+{%- endfor -%}
+>
+{%- if element.text and values['text'] -%} {{ values['text'] }} {%- endif -%}
+{%- if element.closing -%} </{{ element.tag }}> {%- endif %}
+"""
+
+# Text rendered in place of the children of a tag for splitting the output of
+# a jinja template into the opening and the closing tag.
+CHILDREN_MARKER = '\x00korona-children\x00'
+
+# Lock held while building a template for its first rendering, so that the
+# threads rendering a template for the first time at the same time build it
+# only once. It is not taken once the template is built.
+_build_lock = threading.Lock()
+
+
+def get_backend():
+    """Returns the name of the backend used for rendering the templates."""
+    return _backend
+
+
+def set_backend(backend):
+    """Sets the backend used for rendering the templates in this process.
+
+    Args:
+        backend (str): Either ``'jinja'`` or ``'compiled'``.
+
+    .. versionadded:: 0.4.3-dev
+    """
+    global _backend
+
+    if backend not in BACKENDS:
+        raise ValueError('Renderer backend should be one of these: {0}'
+                         .format(','.join(BACKENDS)))
+
+    _backend = backend
+
+
+def compile_renderer(tag=None,
+                     attributes=(),
+                     boolean_attributes=(),
+                     text=True,
+                     closing=True,
+                     global_attributes=(),
+                     constants=None):
+    """Returns a python function which renders the given tag from a
+    dictionary of values without using jinja.
+
+    Args:
+        tag (str): Name of the html tag. If it is not given, only the
+            attributes are rendered (Ex. global attributes).
+        attributes (list): Attribute names in the order they are rendered.
+        boolean_attributes (list): Attributes which are rendered without a
+            value (Ex. <input disabled>).
+        text (bool): Whether the tag renders its text or not.
+        closing (bool): Whether the tag has a closing tag or not.
+        global_attributes (list): Global attribute names rendered after the
+            attributes of the tag, in the same pass.
+        constants (dict): Values of attributes which are rendered ahead of
+            time. When a rendered value is the same object as its constant,
+            the pre-rendered attribute is written as it is.
+
+    .. versionchanged:: 0.4.3-dev
+        Added the global_attributes and constants arguments.
+
+    Returns:
+        function: A function taking the values dictionary and returning the
+        rendered string.
+    """
+    if tag:
+        opening = '<{0} '.format(tag) if attributes else '<{0}'.format(tag)
+    else:
+        opening = ''
+
+    lines = ['def render(values, _str=str):',
+             '    get = values.get',
+             '    out = [{0!r}]'.format(opening),
+             '    append = out.append']
+
+    namespace = {}
+    constants = constants or {}
+    for index, attribute in enumerate(tuple(attributes) +
+                                      tuple(global_attributes)):
+        lines.append('    value = get({0!r})'.format(attribute))
+        if attribute in constants:
+            constant = constants[attribute]
+            namespace['_constant_{0}'.format(index)] = constant
+            if attribute in boolean_attributes:
+                rendered = attribute + ' '
+            else:
+                rendered = '{0}="{1}" '.format(attribute, constant)
+            lines.append('    if value is _constant_{0}:'.format(index))
+            lines.append('        append({0!r})'.format(rendered))
+            lines.append('    elif value:')
+        else:
+            lines.append('    if value:')
+        if attribute in boolean_attributes:
+            lines.append('        append({0!r})'.format(attribute + ' '))
+        else:
+            lines.append('        append({0!r} + _str(value) + \'" \')'
+                         .format(attribute + '="'))
+
+    if tag and global_attributes and not attributes:
+        # The opening tag is followed by a space only if some of the global
+        # attributes are rendered.
+        lines.append('    if len(out) > 1:')
+        lines.append('        out[0] = {0!r}'.format('<{0} '.format(tag)))
+
+    if tag:
+        lines.append("    append('>')")
+
+    if text:
+        lines.append("    value = get('text')")
+        lines.append('    if value:')
+        lines.append('        append(_str(value))')
+
+    if tag and closing:
+        lines.append('    append({0!r})'.format('</{0}>'.format(tag)))
+
+    lines.append("    return ''.join(out)")
+
+    code = compile('\n'.join(lines), '<korona:{0}>'.format(tag), 'exec')
+    exec(code, namespace)
+    return namespace['render']
+
+
+def find_opening_tag_end(source):
+    """Returns the index of the ``>`` closing the opening tag in a jinja
+    template source. The jinja blocks, expressions and comments are skipped.
+    """
+    index = 0
+    while True:
+        end = source.index('>', index)
+        block = source.find('{', index, end)
+        if block == -1:
+            return end
+
+        closing = {'%': '%}', '{': '}}', '#': '#}'}.get(source[block + 1])
+        if closing:
+            index = source.index(closing, block + 2) + 2
+        else:
+            index = block + 1
+
+
+class Template(object):
+    """Html tag template which can be rendered either by jinja or by a
+    compiled python function. Neither of them is built until the template is
+    rendered for the first time.
+
+    The global attributes (See :data:`GLOBAL_ATTRIBUTES`) are part of every
+    html tag template. They are rendered after the attributes of the tag, in
+    the same pass.
+
+    Args:
+        source (str): Jinja template source.
+        tag (str): Name of the html tag.
+        attributes (list): Attribute names in the order the template renders
+            them.
+        boolean_attributes (list): Attributes which are rendered without a
+            value (Ex. <input disabled>).
+        text (bool): Whether the template renders the tag text or not.
+        closing (bool): Whether the tag has a closing tag or not.
+        name (str): Name under which the template is registered in the jinja
+            environment. Defaults to ``'{tag}.html'``. A template with a
+            different source than the one already registered under the name
+            raises a ``ValueError`` (See
+            :func:`korona.templates.html.environment.register_source`).
+
+    .. versionadded:: 0.4.3-dev
+    """
+    def __init__(self,
+                 source,
+                 tag=None,
+                 attributes=(),
+                 boolean_attributes=(),
+                 text=True,
+                 closing=True,
+                 name=None):
+        self.name = name or '{0}.html'.format(tag)
+        self.tag = tag
+        self.tag_attributes = tuple(attributes)
+        self.global_attributes = ()
+        if tag:
+            self.global_attributes = tuple(
+                attribute for attribute in GLOBAL_ATTRIBUTES
+                if attribute not in self.tag_attributes)
+            boolean_attributes = (tuple(boolean_attributes) +
+                                  GLOBAL_BOOLEAN_ATTRIBUTES)
+        self.attributes = self.tag_attributes + self.global_attributes
+        self.boolean_attributes = frozenset(boolean_attributes)
+        self.text = text
+        self.closing = closing
+        self.source = self.get_source(source)
+        self.constants = None
+        self._template = None
+        self._renderer = None
+        self._opening_renderer = None
+        register_source(self.name, self.source)
+
+    def get_source(self, source):
+        """Returns the jinja source of the template with the global attributes
+        rendered at the end of the opening tag.
+        """
+        if not self.global_attributes:
+            return source
+
+        markup = []
+        if not self.tag_attributes:
+            markup.append('{{% if {0} %}} {{% endif -%}}'.format(
+                ' or '.join(self.global_attributes)))
+
+        for attribute in self.global_attributes:
+            if attribute in self.boolean_attributes:
+                markup.append('{{% if {0} -%}} {0} {{% endif -%}}'
+                              .format(attribute))
+            else:
+                markup.append('{{% if {0} -%}} {0}="{{{{ {0} }}}}" '
+                              '{{% endif -%}}'.format(attribute))
+
+        index = find_opening_tag_end(source)
+        return source[:index] + ''.join(markup) + source[index:]
+
+    @property
+    def template(self):
+        """Returns the jinja template. The template is loaded only the first
+        time it is needed, so importing korona does not pay for loading
+        templates that are never rendered.
+        """
+        if self._template is None:
+            with _build_lock:
+                if self._template is None:
+                    self._template = env.get_template(self.name)
+        return self._template
+
+    @property
+    def renderer(self):
+        """Returns the compiled python render function of the template."""
+        if self._renderer is None:
+            with _build_lock:
+                if self._renderer is None:
+                    self._renderer = compile_renderer(
+                        tag=self.tag,
+                        attributes=self.tag_attributes,
+                        boolean_attributes=self.boolean_attributes,
+                        text=self.text,
+                        closing=self.closing,
+                        global_attributes=self.global_attributes,
+                        constants=self.constants)
+        return self._renderer
+
+    @property
+    def opening_renderer(self):
+        """Returns the compiled python function rendering only the opening
+        tag of the template.
+        """
+        if self._opening_renderer is None:
+            with _build_lock:
+                if self._opening_renderer is None:
+                    self._opening_renderer = compile_renderer(
+                        tag=self.tag,
+                        attributes=self.tag_attributes,
+                        boolean_attributes=self.boolean_attributes,
+                        text=False,
+                        closing=False,
+                        global_attributes=self.global_attributes,
+                        constants=self.constants)
+        return self._opening_renderer
+
+    def specialize(self, constants):
+        """Returns a copy of the template whose compiled render functions
+        have the given attribute values rendered ahead of time. The copy
+        renders any values like the template does, but the constant values
+        are written without being rendered again.
+
+        Args:
+            constants (dict): Values of the constant attributes by attribute
+                name. Only the values which are rendered are kept.
+
+        Returns:
+            Template: The specialized template.
+
+        .. versionadded:: 0.4.3-dev
+        """
+        template = copy.copy(self)
+        template.constants = {name: value for name, value in constants.items()
+                              if value and name in self.attributes}
+        template._renderer = None
+        template._opening_renderer = None
+        return template
+
+    def render_parts(self, values):
+        """Renders the template around its text and returns the opening and
+        the closing tag, so that the children of a tag can be written in
+        between them. The closing tag of a template without a closing tag
+        (Ex. ``<img>``) is empty.
+
+        Returns:
+            tuple: The rendered opening and closing tags.
+        """
+        if _backend == COMPILED:
+            closing = '</{0}>'.format(self.tag) if self.closing else ''
+            return self.opening_renderer(values), closing
+
+        if not self.closing:
+            return self.template.render(values), ''
+
+        if not self.text:
+            closing = '</{0}>'.format(self.tag)
+            opening, _, rest = self.template.render(values).rpartition(
+                closing)
+            return opening, closing + rest
+
+        values = dict(values, text=CHILDREN_MARKER)
+        opening, closing = self.template.render(values).split(
+            CHILDREN_MARKER, 1)
+        return opening, closing
+
+    def get_renderer(self):
+        """Returns the function rendering a dictionary of values with the
+        current backend.
+        """
+        if _backend == COMPILED:
+            return self.renderer
+        return self.template.render
+
+    def render(self, *args, **kwargs):
+        """Renders the template with the given values using the current
+        backend. Accepts the same arguments as jinja's ``Template.render``.
+        """
+        if _backend == COMPILED:
+            if kwargs or len(args) != 1:
+                return self.renderer(dict(*args, **kwargs))
+            return self.renderer(args[0])
+        return self.template.render(*args, **kwargs)
+
+
+class ElementTemplate(Template):
+    """Html tag template rendered by the generic element template which is
+    shared by all the element templates, so only the tag and its attributes
+    are defined per tag and a single jinja template is compiled for all of
+    them.
+
+    Args:
+        tag (str): Name of the html tag.
+        attributes (list): Attribute names in the order they are rendered.
+        boolean_attributes (list): Attributes which are rendered without a
+            value (Ex. <input disabled>).
+        text (bool): Whether the tag renders its text or not.
+        closing (bool): Whether the tag has a closing tag or not.
+
+    .. versionadded:: 0.4.3-dev
+    """
+    def __init__(self,
+                 tag,
+                 attributes=(),
+                 boolean_attributes=(),
+                 text=True,
+                 closing=True):
+        super(ElementTemplate, self).__init__(
+            source=ELEMENT_SOURCE,
+            tag=tag,
+            attributes=attributes,
+            boolean_attributes=boolean_attributes,
+            text=text,
+            closing=closing,
+            name='element.html')
+
+    def get_source(self, source):
+        """Returns the generic element template source, which renders the
+        global attributes by itself.
+        """
+        return source
+
+    @property
+    def template(self):
+        """Returns the generic element template bound to this tag."""
+        if self._template is None:
+            with _build_lock:
+                if self._template is None:
+                    self._template = BoundTemplate(
+                        env.get_template(self.name), self)
+        return self._template
+
+
+class BoundTemplate(object):
+    """The generic element template bound to an element template. It renders
+    the values of a tag like a jinja template of the tag would.
+
+    Args:
+        template (jinja2.Template): The generic element template.
+        element (ElementTemplate): The element template.
+
+    .. versionadded:: 0.4.3-dev
+    """
+    def __init__(self, template, element):
+        self.template = template
+        self.element = element
+
+    def render(self, *args, **kwargs):
+        """Renders the tag with the given values. Accepts the same arguments
+        as jinja's ``Template.render``.
+        """
+        if kwargs or len(args) != 1:
+            values = dict(*args, **kwargs)
+        else:
+            values = args[0]
+        return self.template.render(element=self.element, values=values)
@@ -1,44 +1,63 @@
 # -*- coding: utf-8 -*-
-
-from .anchor import anchor
-from .abbreviate import abbr
-from .acronym import acronym
-from .address import address
-from .area import area
-from .article import article
-
-from .bold import bold
-from .base import base
-from .button import button
-
-from .canvas import canvas
-from .caption import caption
-from .cite import cite
-from .col import col
-from .colgroup import colgroup
-
-from .delete import delete
-from .description import dd, dl, dt
-from .details import details
-from .dialog import dialog
-from .div import div
-
-from .embed import embed
-
-from .fieldset import fieldset
-from .figure import figure
-from .footer import footer
-from .form import form
-from .frame import frame
-from .frameset import frameset
-
-from .head import head
-from .header import header
-from .heading import h1, h2, h3, h4, h5, h6
-from .horizontal_rule import hr
-from .html import html
-
-from .iframe import iframe
-from .italics import italics
-from .image import img
-from .input import input
+"""HTML tag templates. The template modules are imported on first access, so
+that only the templates of the tags in use are loaded.
+"""
+
+from ....lib.lazy import lazy_attributes
+
+# Modules defining the templates.
+MODULES = {
+    'anchor': 'anchor',
+    'abbr': 'abbreviate',
+    'acronym': 'acronym',
+    'address': 'address',
+    'area': 'area',
+    'article': 'article',
+
+    'bold': 'bold',
+    'base': 'base',
+    'button': 'button',
+
+    'canvas': 'canvas',
+    'caption': 'caption',
+    'cite': 'cite',
+    'col': 'col',
+    'colgroup': 'colgroup',
+
+    'delete': 'delete',
+    'dd': 'description',
+    'dl': 'description',
+    'dt': 'description',
+    'details': 'details',
+    'dialog': 'dialog',
+    'div': 'div',
+
+    'embed': 'embed',
+
+    'fieldset': 'fieldset',
+    'figure': 'figure',
+    'footer': 'footer',
+    'form': 'form',
+    'frame': 'frame',
+    'frameset': 'frameset',
+
+    'head': 'head',
+    'header': 'header',
+    'h1': 'heading',
+    'h2': 'heading',
+    'h3': 'heading',
+    'h4': 'heading',
+    'h5': 'heading',
+    'h6': 'heading',
+    'hr': 'horizontal_rule',
+    'html': 'html',
+
+    'iframe': 'iframe',
+    'italics': 'italics',
+    'img': 'image',
+    'input': 'input'
+}
+
+__all__ = sorted(MODULES)
+
+__getattr__, __dir__ = lazy_attributes(__name__, MODULES, globals())
@@ -1,8 +1,6 @@
 # -*- coding: utf-8 -*-
 """<abbr> template"""
 
-from ..environment import env
+from ..renderer import ElementTemplate
 
-abbr = env.from_string("""\
-<abbr>{%- if text -%} {{ text }} {%- endif -%}</abbr>
-""")
+abbr = ElementTemplate(tag='abbr')
@@ -1,8 +1,6 @@
 # -*- coding: utf-8 -*-
 """<acronym> template"""
 
-from ..environment import env
+from ..renderer import ElementTemplate
 
-acronym = env.from_string("""\
-<acronym>{%- if text -%} {{ text }} {%- endif -%}</acronym>
-""")
+acronym = ElementTemplate(tag='acronym')
@@ -1,8 +1,6 @@
 # -*- coding: utf-8 -*-
 """<address> template"""
 
-from ..environment import env
+from ..renderer import ElementTemplate
 
-address = env.from_string("""\
-<address>{%- if text -%} {{ text }} {%- endif -%}</address>
-""")
+address = ElementTemplate(tag='address')
@@ -1,9 +1,13 @@
 # -*- coding: utf-8 -*-
 """<a> template"""
 
-from ..environment import env
+from ..renderer import Template
 
-anchor = env.from_string("""\
+anchor = Template(
+    tag='a',
+    attributes=['name', 'rel', 'rev', 'charset', 'href', 'type', 'hreflang',
+                'target', 'shape', 'coords', 'download'],
+    source="""\
 <a {% if name -%} name="{{ name }}" {% endif -%}
    {% if rel -%} rel="{{ rel }}" {% endif -%}
    {% if rev -%} rev="{{ rev }}" {% endif -%}
@@ -1,9 +1,16 @@
 # -*- coding: utf-8 -*-
 """<area> template"""
 
-from ..environment import env
+from ..renderer import Template
 
-area = env.from_string("""\
+area = Template(
+    tag='area',
+    attributes=['shape', 'coords', 'href', 'type', 'hreflang', 'alt', 'media',
+                'rel', 'nohref', 'download', 'target'],
+    boolean_attributes=['nohref'],
+    text=False,
+    closing=False,
+    source="""\
 <area {% if shape -%} shape="{{ shape }}" {% endif -%}
       {% if coords -%} coords="{{ coords }}" {% endif -%}
       {% if href -%} href="{{ href }}" {% endif -%}
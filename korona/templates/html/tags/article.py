@@ -1,8 +1,6 @@
 # -*- coding: utf-8 -*-
 """<article> template"""
 
-from ..environment import env
+from ..renderer import ElementTemplate
 
-article = env.from_string("""\
-<article>{%- if text -%} {{ text }} {%- endif -%}</article>
-""")
+article = ElementTemplate(tag='article')
@@ -1,9 +1,14 @@
 # -*- coding: utf-8 -*-
 """<base> template"""
 
-from ..environment import env
+from ..renderer import Template
 
-base = env.from_string("""\
+base = Template(
+    tag='base',
+    attributes=['href', 'target'],
+    text=False,
+    closing=False,
+    source="""\
 <base {% if href -%} href="{{ href }}" {% endif -%}
       {% if target -%} target="{{ target }}" {% endif -%}>
 """)
@@ -1,8 +1,6 @@
 # -*- coding: utf-8 -*-
 """<b> template"""
 
-from ..environment import env
+from ..renderer import ElementTemplate
 
-bold = env.from_string("""\
-<b>{%- if text -%} {{ text }} {%- endif -%}</b>
-""")
+bold = ElementTemplate(tag='b')
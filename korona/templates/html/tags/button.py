@@ -1,9 +1,15 @@
 # -*- coding: utf-8 -*-
 """<button> template"""
 
-from ..environment import env
+from ..renderer import Template
 
-button = env.from_string("""\
+button = Template(
+    tag='button',
+    attributes=['name', 'type', 'value', 'form', 'formaction', 'formenctype',
+                'formmethod', 'formtarget', 'formnovalidate', 'disabled',
+                'autofocus'],
+    boolean_attributes=['formnovalidate', 'disabled', 'autofocus'],
+    source="""\
 <button {% if name -%} name="{{ name }}" {% endif -%}
         {% if type -%} type="{{ type }}" {% endif -%}
         {% if value -%} value="{{ value }}" {% endif -%}
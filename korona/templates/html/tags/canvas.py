@@ -1,9 +1,13 @@
 # -*- coding: utf-8 -*-
 """<canvas> template"""
 
-from ..environment import env
+from ..renderer import Template
 
-canvas = env.from_string("""\
+canvas = Template(
+    tag='canvas',
+    attributes=['height', 'width'],
+    text=False,
+    source="""\
 <canvas {% if height -%} height="{{ height }}" {% endif -%}
         {% if width -%} width="{{ width }}" {% endif -%}></canvas>
 """)
@@ -1,9 +1,12 @@
 # -*- coding: utf-8 -*-
 """<caption> template"""
 
-from ..environment import env
+from ..renderer import Template
 
-caption = env.from_string("""\
+caption = Template(
+    tag='caption',
+    attributes=['align'],
+    source="""\
 <caption {% if align -%} align="{{ align }}" {% endif -%}>
          {%- if text -%} {{ text }} {%- endif -%}</caption>
 """)
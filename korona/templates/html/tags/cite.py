@@ -1,8 +1,6 @@
 # -*- coding: utf-8 -*-
 """<cite> template"""
 
-from ..environment import env
+from ..renderer import ElementTemplate
 
-cite = env.from_string("""\
-<cite>{%- if text -%} {{ text }} {%- endif -%}</cite>
-""")
+cite = ElementTemplate(tag='cite')
@@ -1,9 +1,14 @@
 # -*- coding: utf-8 -*-
 """<col> template"""
 
-from ..environment import env
+from ..renderer import Template
 
-col = env.from_string("""\
+col = Template(
+    tag='col',
+    attributes=['align', 'char', 'charoff', 'span', 'valign', 'width'],
+    text=False,
+    closing=False,
+    source="""\
 <col {% if align -%} align="{{ align }}" {% endif -%}
      {% if char -%} char="{{ char }}" {% endif -%}
      {% if charoff -%} charoff="{{ charoff }}" {% endif -%}
@@ -1,9 +1,13 @@
 # -*- coding: utf-8 -*-
 """<colgroup> template"""
 
-from ..environment import env
+from ..renderer import Template
 
-colgroup = env.from_string("""\
+colgroup = Template(
+    tag='colgroup',
+    attributes=['span', 'align', 'char', 'charoff', 'valign', 'width'],
+    text=False,
+    source="""\
 <colgroup {% if span -%} span="{{ span }}" {% endif -%}
           {% if align -%} align="{{ align }}" {% endif -%}
           {% if char -%} char="{{ char }}" {% endif -%}
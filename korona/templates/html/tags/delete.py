@@ -1,9 +1,12 @@
 # -*- coding: utf-8 -*-
 """<del> template"""
 
-from ..environment import env
+from ..renderer import Template
 
-delete = env.from_string("""\
+delete = Template(
+    tag='del',
+    attributes=['cite', 'datetime'],
+    source="""\
 <del {% if cite -%} cite="{{ cite }}" {% endif -%}
      {% if datetime -%} datetime="{{ datetime }}" {% endif -%}>
      {%- if text -%} {{ text }} {%- endif -%}</del>
@@ -1,16 +1,10 @@
 # -*- coding: utf-8 -*-
 """Templates for description tags <dd>, <dl> and <dt>"""
 
-from ..environment import env
+from ..renderer import ElementTemplate
 
-dd = env.from_string("""\
-<dd>{%- if text -%} {{ text }} {%- endif -%}</dd>
-""")
+dd = ElementTemplate(tag='dd')
 
-dl = env.from_string("""\
-<dl>{%- if text -%} {{ text }} {%- endif -%}</dl>
-""")
+dl = ElementTemplate(tag='dl')
 
-dt = env.from_string("""\
-<dt>{%- if text -%} {{ text }} {%- endif -%}</dt>
-""")
+dt = ElementTemplate(tag='dt')
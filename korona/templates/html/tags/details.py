@@ -1,9 +1,13 @@
 # -*- coding: utf-8 -*-
 """<details> template"""
 
-from ..environment import env
+from ..renderer import Template
 
-details = env.from_string("""\
+details = Template(
+    tag='details',
+    attributes=['open'],
+    boolean_attributes=['open'],
+    source="""\
 <details {% if open -%} open {% endif -%}>
          {%- if text -%} {{ text}} {%- endif -%}</details>
 """)
@@ -1,9 +1,13 @@
 # -*- coding: utf-8 -*-
 """<dialog> template"""
 
-from ..environment import env
+from ..renderer import Template
 
-dialog = env.from_string("""\
+dialog = Template(
+    tag='dialog',
+    attributes=['open'],
+    boolean_attributes=['open'],
+    source="""\
 <dialog {% if open -%} open {% endif -%}>
         {%- if text -%} {{ text }} {%- endif -%}</dialog>
 """)
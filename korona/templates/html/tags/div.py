@@ -1,9 +1,12 @@
 # -*- coding: utf-8 -*-
 """<div> template"""
 
-from ..environment import env
+from ..renderer import Template
 
-div = env.from_string("""\
+div = Template(
+    tag='div',
+    attributes=['align'],
+    source="""\
 <div {% if align -%} align="{{ align }}" {% endif -%}>
      {%- if text -%} {{ text }} {%- endif -%}</div>
 """)
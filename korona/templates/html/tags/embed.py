@@ -1,9 +1,14 @@
 # -*- coding: utf-8 -*-
 """<embed> template"""
 
-from ..environment import env
+from ..renderer import Template
 
-embed = env.from_string("""\
+embed = Template(
+    tag='embed',
+    attributes=['src', 'type', 'width', 'height'],
+    text=False,
+    closing=False,
+    source="""\
 <embed {% if src -%} src="{{ src }}" {% endif -%}
        {% if type -%} type="{{ type }}" {% endif -%}
        {% if width -%} width="{{ width }}" {% endif -%}
@@ -1,9 +1,14 @@
 # -*- coding: utf-8 -*-
 """<fieldset> template"""
 
-from ..environment import env
+from ..renderer import Template
 
-fieldset = env.from_string("""\
+fieldset = Template(
+    tag='fieldset',
+    attributes=['form', 'name', 'disabled'],
+    boolean_attributes=['disabled'],
+    text=False,
+    source="""\
 <fieldset {% if form -%} form="{{ form }}" {% endif -%}
           {% if name -%} name="{{ name }}" {% endif -%}
           {% if disabled -%} disabled {% endif -%}></fieldset>
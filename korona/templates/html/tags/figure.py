@@ -1,8 +1,6 @@
 # -*- coding: utf-8 -*-
 """<figure> template"""
 
-from ..environment import env
+from ..renderer import ElementTemplate
 
-figure = env.from_string("""\
-<figure>{%- if text -%} {{ text }} {%- endif -%}</figure>
-""")
+figure = ElementTemplate(tag='figure')
@@ -1,8 +1,6 @@
 # -*- coding: utf-8 -*-
 """<footer> template"""
 
-from ..environment import env
+from ..renderer import ElementTemplate
 
-footer = env.from_string("""\
-<footer>{%- if text -%} {{ text }} {%- endif -%}</footer>
-""")
+footer = ElementTemplate(tag='footer')
@@ -1,9 +1,14 @@
 # -*- coding: utf-8 -*-
 """<form> template"""
 
-from ..environment import env
+from ..renderer import Template
 
-form = env.from_string("""\
+form = Template(
+    tag='form',
+    attributes=['action', 'accept', 'method', 'name', 'autocomplete',
+                'target', 'enctype', 'novalidate'],
+    boolean_attributes=['novalidate'],
+    source="""\
 <form {% if action -%} action="{{ action }}" {% endif -%}
       {% if accept -%} accept="{{ accept }}" {% endif -%}
       {% if method -%} method="{{ method }}" {% endif -%}
@@ -1,9 +1,15 @@
 # -*- coding: utf-8 -*-
 """<frame> template"""
 
-from ..environment import env
+from ..renderer import Template
 
-frame = env.from_string("""\
+frame = Template(
+    tag='frame',
+    attributes=['src', 'frameborder', 'longdesc', 'marginheight',
+                'marginwidth', 'name', 'noresize', 'scrolling'],
+    text=False,
+    closing=False,
+    source="""\
 <frame {% if src -%} src="{{ src }}" {% endif -%}
        {% if frameborder -%} frameborder="{{ frameborder }}" {% endif -%}
        {% if longdesc -%} longdesc="{{ longdesc }}" {% endif -%}
@@ -1,9 +1,13 @@
 # -*- coding: utf-8 -*-
 """<frameset> template"""
 
-from ..environment import env
+from ..renderer import Template
 
-frameset = env.from_string("""\
+frameset = Template(
+    tag='frameset',
+    attributes=['cols', 'rows'],
+    text=False,
+    source="""\
 <frameset {% if cols -%} cols="{{ cols }}" {% endif -%}
           {% if rows -%} rows="{{ rows }}" {% endif -%}></frameset>
 """)
@@ -1,8 +1,6 @@
 # -*- coding: utf-8 -*-
 """<head> template"""
 
-from ..environment import env
+from ..renderer import ElementTemplate
 
-head = env.from_string("""\
-<head>{%- if text -%} {{ text }} {%- endif -%}</head>
-""")
+head = ElementTemplate(tag='head')
@@ -1,8 +1,6 @@
 # -*- coding: utf-8 -*-
 """<header> template"""
 
-from ..environment import env
+from ..renderer import ElementTemplate
 
-header = env.from_string("""\
-<header>{%- if text -%} {{ text }} {%- endif -%}</header>
-""")
+header = ElementTemplate(tag='header')
@@ -1,34 +1,16 @@
 # -*- coding: utf-8 -*-
 """Templates for heading tags <h1>, <h2>, <h3>, <h4>, <h5>, <h6>"""
 
-from ..environment import env
+from ..renderer import ElementTemplate
 
-h1 = env.from_string("""\
-<h1 {% if align -%} align="{{ align }}" {% endif -%}>
-    {%- if text -%} {{ text }} {%- endif -%}</h1>
-""")
+h1 = ElementTemplate(tag='h1', attributes=['align'])
 
-h2 = env.from_string("""\
-<h2 {% if align -%} align="{{ align }}" {% endif -%}>
-    {%- if text -%} {{ text }} {%- endif -%}</h2>
-""")
+h2 = ElementTemplate(tag='h2', attributes=['align'])
 
-h3 = env.from_string("""\
-<h3 {% if align -%} align="{{ align }}" {% endif -%}>
-    {%- if text -%} {{ text }} {%- endif -%}</h3>
-""")
+h3 = ElementTemplate(tag='h3', attributes=['align'])
 
-h4 = env.from_string("""\
-<h4 {% if align -%} align="{{ align }}" {% endif -%}>
-    {%- if text -%} {{ text }} {%- endif -%}</h4>
-""")
+h4 = ElementTemplate(tag='h4', attributes=['align'])
 
-h5 = env.from_string("""\
-<h5 {% if align -%} align="{{ align }}" {% endif -%}>
-    {%- if text -%} {{ text }} {%- endif -%}</h5>
-""")
+h5 = ElementTemplate(tag='h5', attributes=['align'])
 
-h6 = env.from_string("""\
-<h6 {% if align -%} align="{{ align }}" {% endif -%}>
-    {%- if text -%} {{ text }} {%- endif -%}</h6>
-""")
+h6 = ElementTemplate(tag='h6', attributes=['align'])
@@ -1,9 +1,15 @@
 # -*- coding: utf-8 -*-
 """<hr> template"""
 
-from ..environment import env
+from ..renderer import Template
 
-hr = env.from_string("""\
+hr = Template(
+    tag='hr',
+    attributes=['align', 'noshade', 'width', 'size'],
+    boolean_attributes=['noshade'],
+    text=False,
+    closing=False,
+    source="""\
 <hr {% if align -%} align="{{ align }}" {% endif -%}
     {% if noshade -%} noshade {% endif -%}
     {% if width -%} width="{{ width }}" {% endif -%}
@@ -1,9 +1,12 @@
 # -*- coding: utf-8 -*-
 """<html> template"""
 
-from ..environment import env
+from ..renderer import Template
 
-html = env.from_string("""\
+html = Template(
+    tag='html',
+    attributes=['manifest', 'xmlns'],
+    source="""\
 <html {% if manifest -%} manifest="{{ manifest }}" {% endif -%}
       {% if xmlns -%} xmlns="{{ xmlns }}" {% endif -%}>
       {%- if text -%} {{ text }} {%- endif -%}</html>
@@ -1,9 +1,15 @@
 # -*- coding: utf-8 -*-
 """<iframe> template"""
 
-from ..environment import env
+from ..renderer import Template
 
-iframe = env.from_string("""\
+iframe = Template(
+    tag='iframe',
+    attributes=['src', 'width', 'height', 'align', 'frameborder', 'longdesc',
+                'marginheight', 'marginwidth', 'name', 'sandbox', 'scrolling',
+                'srcdoc'],
+    text=False,
+    source="""\
 <iframe {% if src -%} src="{{ src }}" {% endif -%}
         {% if width -%} width="{{ width }}" {% endif -%}
         {% if height -%} height="{{ height }}" {% endif -%}
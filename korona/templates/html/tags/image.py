@@ -1,9 +1,16 @@
 # -*- coding: utf-8 -*-
 """<img> template"""
 
-from ..environment import env
+from ..renderer import Template
 
-img = env.from_string("""\
+img = Template(
+    tag='img',
+    attributes=['align', 'alt', 'border', 'crossorigin', 'height', 'hspace',
+                'ismap', 'longdesc', 'src', 'usemap', 'vspace', 'width'],
+    boolean_attributes=['ismap'],
+    text=False,
+    closing=False,
+    source="""\
 <img {% if align -%} align="{{ align }}" {% endif -%}
      {% if alt -%} alt="{{ alt }}" {% endif -%}
      {% if border -%} border="{{ border }}" {% endif -%}
@@ -1,9 +1,21 @@
 # -*- coding: utf-8 -*-
 """<input> template"""
 
-from ..environment import env
+from ..renderer import Template
 
-input = env.from_string("""\
+input = Template(
+    tag='input',
+    attributes=['type', 'name', 'value', 'min', 'max', 'maxlength', 'dirname',
+                'accept', 'src', 'alt', 'align', 'width', 'height', 'size',
+                'step', 'pattern', 'placeholder', 'form', 'formaction',
+                'formenctype', 'formmethod', 'formtarget', 'list',
+                'autocomplete', 'multiple', 'readonly', 'required',
+                'formnovalidate', 'disabled', 'checked', 'autofocus'],
+    boolean_attributes=['multiple', 'readonly', 'required', 'formnovalidate',
+                        'disabled', 'checked', 'autofocus'],
+    text=False,
+    closing=False,
+    source="""\
 <input {% if type -%} type="{{ type }}" {% endif -%}
        {% if name -%} name="{{ name }}" {% endif -%}
        {% if value -%} value="{{ value }}" {% endif -%}
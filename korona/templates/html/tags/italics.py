@@ -1,8 +1,6 @@
 # -*- coding: utf-8 -*-
 """<i> template"""
 
-from ..environment import env
+from ..renderer import ElementTemplate
 
-italics = env.from_string("""\
-<i>{%- if text -%} {{ text }} {%- endif -%}</i>
-""")
+italics = ElementTemplate(tag='i')
@@ -32,6 +32,7 @@ setup(
     description=pkg['__description__'],
     long_description=readme + '\n\n' + changelog,
     packages=find_packages(exclude=['tests', 'tasks']),
+    package_data={'korona': ['templates/html/precompiled/*/*.py']},
     install_requires=requirements,
     keywords='make html built html create html korona html maker html build',
     classifiers=[
@@ -18,6 +18,7 @@ PYLINT_IGNORE = ','.join([
 ])
 TEST_TARGETS = ' '.join([PACKAGE_NAME, 'tests'])
 COV_TARGET = PACKAGE_NAME
+BENCHMARKS = 'benchmarks'
 
 
 @task
@@ -58,6 +59,13 @@ def unit(ctx):
     run('py.test --cov {0} {1}'.format(COV_TARGET, TEST_TARGETS))
 
 
+@task
+def bench(ctx):
+    """Run benchmarks."""
+    run('for benchmark in {0}/bench_*.py; '
+        'do PYTHONPATH=. python $benchmark; done'.format(BENCHMARKS))
+
+
 @task(pre=[lint, unit])
 def test(ctx):
     """Run all tests."""
@@ -83,6 +91,13 @@ def docs(ctx, serve=False, port=8000):
 
 
 @task
+def precompile(ctx):
+    """Precompile the html templates to python modules."""
+    run('python -c "from korona.templates.html.environment import '
+        'compile_templates; compile_templates()"')
+
+
+@task(pre=[precompile])
 def build(ctx):
     """Build package distribution."""
     run('python setup.py sdist bdist_wheel')
@@ -2,4 +2,17 @@
 
 import pytest
 
+from korona.templates.html.renderer import BACKENDS, get_backend, set_backend
+
 parametrize = pytest.mark.parametrize
+
+
+@pytest.fixture(params=BACKENDS)
+def backend(request):
+    """Renders the templates with each of the renderer backends during a
+    test.
+    """
+    previous = get_backend()
+    set_backend(request.param)
+    yield request.param
+    set_backend(previous)
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import time
+
+import pytest
+
+from .fixtures import parametrize
+
+from korona.html.root.element import FLUSH
+from korona.html.root.placeholder import SWAP_SCRIPT, Placeholder
+from korona.html.tags import A, Div, H1, Head, Html
+
+
+def run(coroutine):
+    """Runs the coroutine in a new event loop."""
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+async def fetch(value, delay=0):
+    """Returns the value after the delay (in seconds)."""
+    await asyncio.sleep(delay)
+    return value
+
+
+async def rows(count):
+    """Yields the given number of rows."""
+    for index in range(count):
+        await asyncio.sleep(0)
+        yield Div(text=str(index))
+
+
+async def collect(tag, chunk_size=None):
+    """Returns the chunks of the tag with the time (in seconds) after which
+    every chunk is yielded.
+    """
+    start = time.time()
+    return [(time.time() - start, chunk)
+            async for chunk in tag.iter_render_async(chunk_size=chunk_size)]
+
+
+@parametrize('tag,expected', [
+    (Div(text='abcd'), '<div >abcd</div>'),
+    (Div(text=fetch('abcd')), '<div >abcd</div>'),
+    (Div(text=[fetch(A(href='www.google.com', text=fetch('google'))),
+               'efgh']),
+     '<div ><a href="www.google.com" >google</a>efgh</div>'),
+    (Div(text=[H1(text=fetch('abcd')), rows(2), fetch([None, 1])]),
+     '<div ><h1 >abcd</h1><div >0</div><div >1</div>1</div>'),
+    (Html(text=[Head(), Div(text=(fetch(str(index)) for index in range(3)))]),
+     '<html ><head></head><div >012</div></html>')
+])
+def test_render_async(tag, expected):
+    """Test for validating the tags constructed with asyncio."""
+    assert run(tag.render_async()) == expected
+
+
+def test_render_async_concurrently():
+    """Test for validating that the awaitables of a tag are resolved
+    concurrently and that the parts before them are yielded first.
+    """
+    tag = Html(text=[Head(),
+                     Div(text=fetch('abcd', delay=0.2)),
+                     Div(text=[H1(text=fetch('efgh', delay=0.2))])])
+    chunks = run(collect(tag, chunk_size=1024))
+
+    assert ''.join(chunk for _, chunk in chunks) == (
+        '<html ><head></head><div >abcd</div><div ><h1 >efgh</h1></div>'
+        '</html>')
+    assert chunks[0] == (pytest.approx(0, abs=0.1), '<html ><head></head>')
+    assert chunks[1] == (pytest.approx(0, abs=0.1), '<div >')
+    assert chunks[-1][0] < 0.3
+
+
+def test_render_async_flush_points():
+    """Test for validating that the chunks are yielded at the flush
+    points.
+    """
+    def page():
+        return Html(text=[Head(text='abcd'), Div(text='efgh'), FLUSH,
+                          Div(text=fetch('ijkl'))])
+
+    chunks = [chunk for _, chunk in run(collect(page(), chunk_size=1024))]
+    assert chunks == ['<html ><head>abcd</head>', '<div >efgh</div>',
+                      '<div >', 'ijkl</div></html>']
+
+    chunks = [chunk for _, chunk in run(collect(page()))]
+    assert '' not in chunks
+
+
+def test_render_async_error():
+    """Test for validating that an error of an awaitable is raised and that
+    the other awaitables are cancelled.
+    """
+    async def fail():
+        raise ValueError('abcd')
+
+    async def render():
+        pending = asyncio.ensure_future(fetch('efgh', delay=10))
+        with pytest.raises(ValueError):
+            await Div(text=[fail(), pending]).render_async()
+        await asyncio.sleep(0)
+        return pending.cancelled()
+
+    assert run(render())
+
+
+def test_render_async_placeholders():
+    """Test for validating that the fragments of the placeholders are
+    written at the end, in the order they are ready, after the rest of the
+    page.
+    """
+    tag = Html(text=[Head(),
+                     Placeholder(fetch(Div(text='abcd'), delay=0.2),
+                                 fallback='loading', id='slow'),
+                     Placeholder(fetch('efgh', delay=0.1), id='fast'),
+                     Div(text='ijkl')])
+    chunks = run(collect(tag, chunk_size=1024))
+
+    assert [chunk for _, chunk in chunks] == [
+        '<html ><head></head>',
+        '<div id="slow" >loading</div><div id="fast" ></div>'
+        '<div >ijkl</div></html>',
+        SWAP_SCRIPT + '<template id="fast-content">efgh</template>'
+        '<script>koronaSwap("fast")</script>',
+        '<template id="slow-content"><div >abcd</div></template>'
+        '<script>koronaSwap("slow")</script>']
+    assert chunks[1][0] < 0.1
+    assert chunks[-1][0] == pytest.approx(0.2, abs=0.08)
@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+
+import sys
+import threading
+
+import pytest
+
+from .fixtures import parametrize
+
+from korona.html.root.element import get_render_cache, set_render_cache
+from korona.html.tags import A, Div, HR, Img, Input
+from korona.lib.cache import MemoryStorage, RenderCache
+
+
+@pytest.fixture
+def render_cache():
+    """Caches the constructed tags during a test."""
+    previous = get_render_cache()
+    cache = RenderCache()
+    set_render_cache(cache)
+    yield cache
+    set_render_cache(previous)
+
+
+@parametrize('tag,attributes', [
+    (A, {'href': 'www.google.com', 'text': 'google'}),
+    (HR, {}),
+    (Img, {'src': 'www.google.com/logo.png', 'alt': 'logo'}),
+    (Input, {'type': 'checkbox', 'checked': True})
+])
+def test_render_cache(render_cache, tag, attributes):
+    """Test for validating that a cached tag is constructed the same as an
+    uncached tag.
+    """
+    set_render_cache(None)
+    expected = tag(**attributes).construct()
+    set_render_cache(render_cache)
+
+    assert tag(**attributes).construct() == expected
+    assert tag(**attributes).construct() == expected
+
+    info = render_cache.info()
+    assert (info.hits, info.misses, info.entries) == (1, 1, 1)
+
+
+def test_render_cache_keys(render_cache):
+    """Test for validating that equal values of different types and different
+    tag classes are cached separately.
+    """
+    assert Div(text=1).construct() == Div.template.render(text=1)
+    assert Div(text=1.0).construct() == Div.template.render(text=1.0)
+    assert Div(text=True).construct() == Div.template.render(text=True)
+    assert HR(size=1).construct() != Div(text=1).construct()
+
+    # Empty values are not rendered, so they share the cached tag.
+    assert Div(text='').construct() == Div().construct()
+    assert render_cache.info().entries == 5
+
+
+def test_render_cache_unhashable_values():
+    """Test for validating that the tags with unhashable values are rendered
+    without being cached.
+    """
+    cache = RenderCache()
+    assert cache.render(Div, {'align': {'a': 1}},
+                        lambda values: 'div') == 'div'
+    assert cache.info() == (0, 0, 0, 0, cache.max_size)
+
+
+def test_render_cache_nested_tags(render_cache):
+    """Test for validating that the child tags are cached while their parents
+    are not.
+    """
+    tag = Div(text=[A(href='www.google.com', text='google'), HR()])
+    expected = tag.construct()
+
+    assert Div(text=[A(href='www.google.com', text='google'),
+                     HR()]).construct() == expected
+    assert render_cache.info().entries == 2
+    assert render_cache.info().hits == 2
+
+
+def test_render_cache_construct_many(render_cache):
+    """Test for validating that the tags constructed in bulk are cached."""
+    rows = [{'href': 'www.google.com', 'text': 'google'}] * 10
+    assert len(set(A.construct_many(rows))) == 1
+    assert render_cache.info().hits == 9
+
+
+def test_render_cache_eviction():
+    """Test for validating that the least recently used tags are evicted when
+    the cache gets larger than its size limit.
+    """
+    size = sys.getsizeof('a')
+    cache = RenderCache(max_size=size * 2)
+    cache.set('a', 'a')
+    cache.set('b', 'b')
+    assert cache.get('a') == 'a'
+
+    cache.set('c', 'c')
+    assert cache.get('b') is None
+    assert cache.get('a') == 'a'
+    assert cache.get('c') == 'c'
+    assert len(cache) == 2
+    assert cache.size == size * 2
+
+    cache.set('large', 'a' * 100)
+    assert cache.get('large') is None
+
+    cache.clear()
+    assert cache.info() == (0, 0, 0, 0, size * 2)
+
+
+def test_render_cache_threads():
+    """Test for validating the render cache shared between threads."""
+    cache = RenderCache(max_size=sys.getsizeof('<div >0</div>') * 10)
+    errors = []
+
+    def construct(index):
+        for number in range(1000):
+            text = (index + number) % 20
+            value = cache.render(Div, {'text': text},
+                                 Div.template.render)
+            if value != Div.template.render(text=text):
+                errors.append(value)
+
+    threads = [threading.Thread(target=construct, args=(index,))
+               for index in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    info = cache.info()
+    assert not errors
+    assert info.hits + info.misses == 8000
+    assert info.size <= info.max_size
+    assert info.size == sum(sys.getsizeof(value)
+                            for value in cache._entries.values())
+
+
+def test_render_cache_lookup_without_lock():
+    """Test for validating that the cached strings are looked up without
+    taking the lock of the cache, keeping the least recently used order.
+    """
+    class Lock(object):
+        def __enter__(self):
+            raise AssertionError('lookup should not take the lock')
+
+    cache = RenderCache()
+    cache.set('a', 'a')
+    cache.set('b', 'b')
+    lock = cache._lock
+    cache._lock = Lock()
+
+    assert cache.get('a') == 'a'
+    assert cache.get('c') is None
+    assert list(cache._entries) == ['b', 'a']
+
+    cache._lock = lock
+    assert cache.info()[:3] == (1, 1, 2)
+
+
+def test_render_cache_remove():
+    """Test for validating that a cached string is removed by its key."""
+    cache = RenderCache()
+    cache.set('a', 'a')
+    cache.set('b', 'b')
+    assert cache.get('a') == 'a'
+
+    assert cache.remove('a')
+    assert not cache.remove('a')
+    assert cache.info() == (1, 0, 1, sys.getsizeof('b'), cache.max_size)
+
+    cache.clear(reset_counters=False)
+    assert cache.info() == (1, 0, 0, 0, cache.max_size)
+
+
+def test_cache_info_hit_rate():
+    """Test for validating the hit rate of the counters of a cache."""
+    cache = RenderCache()
+    assert cache.info().hit_rate == 0.0
+
+    cache.set('a', 'a')
+    for key in ['a', 'a', 'a', 'b']:
+        cache.get(key)
+    assert cache.info().hit_rate == 0.75
+
+
+def test_memory_storage_size():
+    """Test for validating that the size of a stored tuple is the size of its
+    items.
+    """
+    storage = MemoryStorage()
+    storage.set('a', ('abcd', None))
+
+    assert storage.size == sys.getsizeof(('abcd', None)) + \
+        sys.getsizeof('abcd') + sys.getsizeof(None)
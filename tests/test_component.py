@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+
+import subprocess
+import sys
+
+import pytest
+
+import korona
+from korona.html.root.component import Component, component
+from korona.html.tags import A, Cite, Div, H1
+
+
+def get_card(name, price=None):
+    """Returns a card with the given name and price."""
+    return Div(text=[H1(text=name), Cite(text=price)])
+
+
+def test_component():
+    """Test for validating that a component returns the constructed tags of
+    its function and only calls it once for the same arguments.
+    """
+    calls = []
+
+    @korona.component
+    def card(name, price=None):
+        calls.append((name, price))
+        return get_card(name, price)
+
+    assert isinstance(card, Component)
+    assert card.__name__ == 'card'
+
+    for _ in range(3):
+        assert card('abcd', price=1) == get_card('abcd', 1).construct()
+    assert card('efgh') == get_card('efgh').construct()
+
+    assert calls == [('abcd', 1), ('efgh', None)]
+    info = card.info()
+    assert (info.hits, info.misses, info.entries) == (2, 2, 2)
+    assert info.hit_rate == 0.5
+
+
+def test_component_children():
+    """Test for validating that a component can return a list of tags and be
+    used as a child of a tag.
+    """
+    @component
+    def links(*urls):
+        return [A(href=url, text=url) for url in urls]
+
+    expected = Div(text=[A(href='www.google.com', text='www.google.com'),
+                         A(href='www.yahoo.com', text='www.yahoo.com')])
+
+    assert Div(text=links('www.google.com', 'www.yahoo.com')).construct() \
+        == expected.construct()
+
+
+@pytest.mark.parametrize('args, kwargs', [
+    ((['abcd'],), {}),
+    (('abcd',), {'price': {'value': 1}}),
+    ((H1(text='abcd'),), {}),
+])
+def test_component_uncached_arguments(args, kwargs):
+    """Test for validating that the calls with unhashable arguments or tags
+    are constructed without being cached.
+    """
+    card = component(get_card)
+
+    assert card(*args, **kwargs) == get_card(*args, **kwargs).construct()
+    assert card.info() == (0, 0, 0, 0, card.cache.max_size)
+
+
+def test_component_keys():
+    """Test for validating that equal arguments of different types are cached
+    separately.
+    """
+    card = component(get_card)
+
+    assert card('abcd', 1) == get_card('abcd', 1).construct()
+    assert card('abcd', True) == get_card('abcd', True).construct()
+    assert card('abcd', 1.0) == get_card('abcd', 1.0).construct()
+    assert card.info().entries == 3
+
+
+def test_component_max_size():
+    """Test for validating that the least recently used tags of a component
+    are evicted when its cache gets larger than its size limit.
+    """
+    size = sys.getsizeof(get_card('a').construct())
+    card = component(max_size=size * 2)(get_card)
+
+    card('a')
+    card('b')
+    card('a')
+    card('c')
+
+    assert card.info().entries == 2
+    assert card.info().size <= size * 2
+    assert not card.invalidate('b')
+    assert card.invalidate('a')
+
+
+def test_component_invalidate():
+    """Test for validating that the cached tags of a component are removed
+    by its arguments or all at once, keeping the counters.
+    """
+    card = component(get_card)
+    other = component(get_card)
+    for name in ['a', 'b', 'c']:
+        card(name)
+        other(name)
+
+    assert card.invalidate('a')
+    assert not card.invalidate('a')
+    assert card.info().entries == 2
+
+    assert card.invalidate()
+    assert not card.invalidate()
+    assert card.info() == (0, 3, 0, 0, card.cache.max_size)
+    assert other.info().entries == 3
+
+
+def test_korona_component_attribute():
+    """Test for validating that the component decorator is an attribute of
+    the korona package, which is imported on first access (or right away
+    before python 3.7).
+    """
+    assert korona.component is component
+    assert 'component' in dir(korona)
+
+    code = ('import sys\n'
+            'sys.version_info = (3, 6, 0)\n'
+            'import korona\n'
+            'print("component" in vars(korona))')
+    output = subprocess.check_output([sys.executable, '-c', code])
+    assert output.decode().strip() == 'True'
+
+    with pytest.raises(AttributeError):
+        korona.unknown
@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+
+import io
+
+import pytest
+
+from .fixtures import backend, parametrize
+
+from korona.exceptions import TagAttributeError
+from korona.html.root.document import Document
+from korona.html.root.element import FLUSH
+from korona.html.tags import (
+    A,
+    Base,
+    Canvas,
+    ColGroup,
+    Div,
+    FieldSet,
+    Form,
+    FrameSet,
+    H1,
+    Head,
+    HR,
+    Html,
+    Img,
+    Input
+)
+
+
+def build(doc):
+    """Builds the same document as :func:`build_tree`."""
+    with doc.tag(Html):
+        doc.write(Head())
+        with doc.tag(Div, align='center', text='intro'):
+            doc.write(H1(text='abcd'), 'efgh', [HR(), 1], None)
+            with doc.tag(Form(action='www.google.com')):
+                doc.write(Input(type='text', name='q'))
+
+
+def build_tree():
+    """Builds a document as a tree of tags."""
+    form = Form(action='www.google.com',
+                text=Input(type='text', name='q'))
+    return Html(text=[Head(),
+                      Div(align='center',
+                          text=['intro', H1(text='abcd'), 'efgh', HR(), 1,
+                                form])])
+
+
+def test_document(backend):
+    """Test for validating that a document written with the builder is the
+    same as the document constructed from a tree of tags.
+    """
+    with Document() as doc:
+        build(doc)
+
+    assert doc.getvalue() == build_tree().construct()
+
+
+@parametrize('tag, attributes', [
+    (Img, {'src': 'a.png', 'alt': 'x'}),
+    (HR, {'align': 'center'}),
+    (Input, {'type': 'text', 'name': 'q'}),
+])
+def test_document_void_tags(tag, attributes, backend):
+    """Test for validating that the tags without children are written by
+    both the renderer backends.
+    """
+    with Document() as doc:
+        with doc.tag(tag, **attributes):
+            pass
+
+    assert doc.getvalue() == tag(**attributes).construct()
+
+
+@parametrize('tag,attributes,expected', [
+    (FieldSet, {'name': 'abcd'}, '<fieldset name="abcd" >efgh</fieldset>'),
+    (Canvas, {'width': '10'}, '<canvas width="10" >efgh</canvas>'),
+    (ColGroup, {'span': 2}, '<colgroup span="2" >efgh</colgroup>'),
+    (FrameSet, {'rows': '50%'}, '<frameset rows="50%" >efgh</frameset>'),
+])
+def test_document_tags_without_text(tag, attributes, expected, backend):
+    """Test for validating that the children of a tag without a text are
+    written inside the tag by both the renderer backends.
+    """
+    with Document() as doc:
+        with doc.tag(tag, **attributes):
+            doc.write('efgh')
+
+    assert doc.getvalue() == expected
+
+
+@parametrize('chunk_size', [1, 10, 1000])
+def test_document_chunks(chunk_size):
+    """Test for validating that the document is written in chunks of at least
+    the chunk size.
+    """
+    chunks = []
+
+    class Stream(object):
+        def write(self, chunk):
+            chunks.append(chunk)
+
+    with Document(Stream(), chunk_size=chunk_size, flush_after=()) as doc:
+        build(doc)
+
+    assert ''.join(chunks) == build_tree().construct()
+    assert all(len(chunk) >= chunk_size for chunk in chunks[:-1])
+
+
+def test_document_is_written_while_it_is_built():
+    """Test for validating that the opening tags are written when the with
+    block is entered, before the closing tags.
+    """
+    stream = io.StringIO()
+    doc = Document(stream, chunk_size=1)
+
+    with doc.tag(Div):
+        assert stream.getvalue() == '<div >'
+        doc.write(A(href='www.google.com', text='google'))
+        assert stream.getvalue() == ('<div ><a href="www.google.com" >'
+                                     'google</a>')
+
+    assert stream.getvalue().endswith('</a></div>')
+
+
+def test_document_encoding():
+    """Test for validating the document written to a binary stream."""
+    stream = io.BytesIO()
+    with Document(stream, encoding='utf-8') as doc:
+        with doc.tag(Div, text=u'caf\xe9'):
+            pass
+
+    assert stream.getvalue() == u'<div >caf\xe9</div>'.encode('utf-8')
+
+
+def test_document_tag_errors():
+    """Test for validating the attributes of the tags written with the
+    builder.
+    """
+    doc = Document()
+    with pytest.raises(TagAttributeError):
+        with doc.tag(Div, align='abcd'):
+            pass
+
+    with pytest.raises(TypeError) as exc:
+        with doc.tag(Div(), align='center'):
+            pass
+
+    assert 'Attributes can only be given with a tag class' in str(exc)
+    assert doc.getvalue() == ''
+
+
+def test_document_flush_points():
+    """Test for validating that the document is written at the flush
+    points.
+    """
+    chunks = []
+
+    class Stream(object):
+        def write(self, chunk):
+            chunks.append(chunk)
+
+    with Document(Stream()) as doc:
+        with doc.tag(Html):
+            with doc.tag(Head):
+                doc.write(Base(href='www.google.com'))
+            assert chunks == ['<html ><head><base href="www.google.com" >'
+                              '</head>']
+            doc.write(Div(text='abcd'), FLUSH)
+            assert chunks[-1] == '<div >abcd</div>'
+            doc.write(Div(text='efgh'))
+
+    assert chunks[-1] == '<div >efgh</div></html>'
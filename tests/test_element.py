@@ -0,0 +1,298 @@
+# -*- coding: utf-8 -*-
+
+import io
+import types
+
+import pytest
+
+from .fixtures import backend, parametrize
+
+from korona.exceptions import TagAttributeError
+from korona.html.root.element import FLUSH
+from korona.html.tags import A, Abbr, Area, Div, H1, Head, Html, Img, Input
+
+
+@parametrize('tag,rows', [
+    (A, [{'href': 'www.google.com', 'text': 'google'},
+         {'href': 'www.yahoo.com', 'rel': 'nofollow', 'text': 'yahoo'}]),
+    (Div, [{'align': 'left', 'text': 'abcd'}, {}, {'text': 'efgh'}]),
+    (Img, [{'src': 'www.google.com/logo.png', 'alt': 'logo'},
+           {'src': 'www.google.com/icon.png', 'height': 10}]),
+    (Input, [{'type': 'text', 'name': 'abcd'},
+             {'type': 'checkbox', 'checked': True}])
+])
+def test_construct_many(tag, rows):
+    """Test for validating that the tags constructed in bulk are the same as
+    the tags constructed one by one.
+    """
+    expected = [tag(**row).construct() for row in rows]
+    tags = tag.construct_many(rows)
+
+    assert isinstance(tags, types.GeneratorType)
+    assert list(tags) == expected
+    assert tag.construct_many(iter(rows), separator='\n') == '\n'.join(
+        expected)
+
+
+def test_construct_many_error():
+    """Test for validating that every row is validated while constructing the
+    tags in bulk.
+    """
+    rows = [{'align': 'left'}, {'align': 'abcd'}]
+
+    with pytest.raises(TagAttributeError) as exc:
+        Div.construct_many(rows, separator='')
+
+    assert 'attribute values should be one of these' in str(exc)
+
+
+@parametrize('tag,expected', [
+    (Div(text=[H1(text='abcd'), 'efgh', A(href='www.google.com', text='x')]),
+     '<div ><h1 >abcd</h1>efgh<a href="www.google.com" >x</a></div>'),
+    (Html(text=Head(text='abcd')),
+     '<html ><head>abcd</head></html>'),
+    (Div(align='left', text=[]), '<div align="left" ></div>'),
+    (Div(text=('abcd', None, 1, Abbr(text='e'))),
+     '<div >abcd1<abbr>e</abbr></div>')
+])
+def test_construct_nested_tags(tag, expected):
+    """Test for validating the construction of tags with child tags."""
+    assert tag.construct() == expected
+
+
+def test_construct_nested_tags_with_backends(backend):
+    """Test for validating that both the renderer backends construct the same
+    nested tags.
+    """
+    page = Html(text=[Head(), Div(align='center', text=[H1(text='abcd')])])
+
+    assert page.construct() == ('<html ><head></head><div align="center" >'
+                                '<h1 >abcd</h1></div></html>')
+
+
+def test_construct_deeply_nested_tags():
+    """Test for validating that deeply nested tags are constructed without
+    recursion.
+    """
+    depth = 5000
+    tag = Div(text='abcd')
+    for _ in range(depth):
+        tag = Div(text=[tag])
+
+    assert tag.construct() == ('<div >' * (depth + 1) + 'abcd' +
+                               '</div>' * (depth + 1))
+
+
+def test_append_children():
+    """Test for validating the children appended to a tag."""
+    div = Div(text='abcd')
+    assert div.append(H1(text='efgh'), 'ijkl') is div
+    assert div.construct() == '<div >abcd<h1 >efgh</h1>ijkl</div>'
+
+
+def test_append_children_error():
+    """Test for validating that children cannot be appended to tags without
+    text.
+    """
+    with pytest.raises(TagAttributeError) as exc:
+        Img(src='www.google.com/logo.png').append(Div())
+
+    assert 'tag cannot have children' in str(exc)
+
+
+def test_iter_render():
+    """Test for validating that the chunks of a streamed tag are yielded in
+    document order.
+    """
+    page = Html(text=[Head(text='abcd'), Div(text=[H1(text='efgh'), 'ijkl'])])
+    chunks = list(page.iter_render())
+
+    assert chunks == ['<html >', '<head>abcd</head>', '<div >',
+                      '<h1 >efgh</h1>', 'ijkl', '</div>', '</html>']
+    assert ''.join(chunks) == page.construct()
+
+
+def test_iter_render_with_generator_children():
+    """Test for validating that the children given as a generator are only
+    consumed while the tag is streamed.
+    """
+    consumed = []
+
+    def rows():
+        for i in range(3):
+            consumed.append(i)
+            yield Div(text=str(i))
+
+    chunks = Html(text=rows()).iter_render()
+
+    assert next(chunks) == '<html >'
+    assert consumed == []
+    assert next(chunks) == '<div >0</div>'
+    assert consumed == [0]
+    assert ''.join(chunks) == '<div >1</div><div >2</div></html>'
+
+
+@parametrize('chunk_size', [1, 10, 25, 1000])
+def test_iter_render_chunk_size(chunk_size):
+    """Test for validating that the streamed parts are buffered up to the
+    given chunk size.
+    """
+    page = Div(text=[Div(text=str(i)) for i in range(20)])
+    chunks = list(page.iter_render(chunk_size=chunk_size))
+
+    assert ''.join(chunks) == page.construct()
+    assert all(len(chunk) >= chunk_size for chunk in chunks[:-1])
+
+
+@parametrize('flush_after,expected', [
+    (None, ['<html ><head>abcd</head>', '<div >efgh</div>',
+            '<div >ijkl</div></html>']),
+    ((), ['<html ><head>abcd</head><div >efgh</div>',
+          '<div >ijkl</div></html>']),
+    (['head', 'div'], ['<html ><head>abcd</head>', '<div >efgh</div>',
+                       '<div >ijkl</div>', '</html>'])
+])
+def test_iter_render_flush_points(flush_after, expected):
+    """Test for validating that the buffered chunks are yielded at the flush
+    points.
+    """
+    page = Html(text=[Head(text='abcd'), Div(text='efgh'), FLUSH,
+                      Div(text='ijkl')])
+    if flush_after is None:
+        chunks = list(page.iter_render(chunk_size=1024))
+    else:
+        chunks = list(page.iter_render(chunk_size=1024,
+                                       flush_after=flush_after))
+
+    assert chunks == expected
+    assert ''.join(chunks) == page.construct()
+    assert '' not in page.iter_render()
+
+
+@parametrize('stream,encoding', [
+    (io.StringIO(), None),
+    (io.BytesIO(), 'utf-8')
+])
+def test_render_to(stream, encoding):
+    """Test for validating that a tag is written to a file-like object."""
+    page = Html(text=(Div(text=str(i)) for i in range(100)))
+    expected = Html(text=[Div(text=str(i)) for i in range(100)]).construct()
+
+    page.render_to(stream, chunk_size=64, encoding=encoding)
+    value = stream.getvalue()
+
+    assert value == (expected.encode(encoding) if encoding else expected)
+
+
+@parametrize('tag,attributes', [
+    (A, {'href': 'www.google.com', 'rel': 'nofollow', 'text': 'google'}),
+    (A, {'shape': 'rect', 'coords': [1, 2, 3, 4]}),
+    (Area, {'shape': 'circle', 'coords': (1, 2, 3)}),
+    (Input, {'type': 'checkbox', 'checked': True, 'name': 'abcd'}),
+    (Div, {'align': 'left', 'text': [H1(text='abcd')]}),
+    (Img, {'src': 'www.google.com/logo.png', 'width': 10})
+])
+def test_trusted_tag(tag, attributes):
+    """Test for validating that the trusted tags are constructed the same way
+    as the validated tags.
+    """
+    trusted = tag.trusted(**attributes)
+
+    assert isinstance(trusted, tag)
+    assert trusted.tag == tag(**attributes).tag
+    assert trusted.values == tag(**attributes).values
+    assert trusted.construct() == tag(**attributes).construct()
+
+
+def test_trusted_tag_is_not_validated():
+    """Test for validating that the attributes of trusted tags are not
+    validated.
+    """
+    with pytest.raises(TagAttributeError):
+        Div(align='abcd')
+
+    assert Div.trusted(align='abcd').construct() == '<div align="abcd" ></div>'
+
+
+def test_trusted_tag_unknown_attribute():
+    """Test for validating the error for an unknown attribute of a trusted
+    tag.
+    """
+    with pytest.raises(TypeError) as exc:
+        Div.trusted(align='left', abcd='efgh')
+
+    assert "unexpected keyword argument 'abcd'" in str(exc)
+
+
+def test_construct_many_trusted():
+    """Test for validating that the trusted tags are constructed in bulk."""
+    rows = [{'href': 'www.google.com', 'text': 'google'},
+            {'href': 'www.yahoo.com', 'rel': 'abcd', 'text': 'yahoo'}]
+
+    assert A.construct_many(rows, separator='', trusted=True) == (
+        '<a href="www.google.com" >google</a>'
+        '<a rel="abcd" href="www.yahoo.com" >yahoo</a>')
+
+
+def test_construct_many_trusted_values(monkeypatch):
+    """Test for validating that the trusted rows are rendered from their
+    attribute values, only creating a tag for the rows with child tags.
+    """
+    rows = [{'coords': [0, 0, 82, 126], 'shape': 'rect', 'text': 'abcd',
+             'class_': 'efgh'},
+            {'href': 'www.google.com', 'text': [Abbr(text='ijkl'), 'mnop']},
+            {'text': 1}]
+    expected = [A.trusted(**row).construct() for row in rows]
+    created = []
+    from_values = A._from_values
+
+    def create(values):
+        created.append(values)
+        return from_values(values)
+
+    monkeypatch.setattr(A, '_from_values', create)
+
+    assert list(A.construct_many(rows, trusted=True)) == expected
+    assert len(created) == 1
+
+
+def test_sparse_values():
+    """Test for validating that a tag only stores the attributes which are set
+    while its values still have all the attributes.
+    """
+    tag = Input(type='text', name='abcd', required=True)
+
+    assert not hasattr(tag, '__dict__')
+    assert tag._values == {'type': 'text', 'name': 'abcd', 'required': True}
+    assert tag.values == dict(Input._get_defaults(), type='text',
+                              name='abcd', required=True)
+    assert len(tag.values) == len(Input._get_defaults())
+
+    tag.values = dict(tag.values, name='efgh', required=False)
+    assert tag._values == {'type': 'text', 'name': 'efgh'}
+    assert tag.construct() == Input(type='text', name='efgh').construct()
+
+
+def test_values_changes_the_tag():
+    """Test for validating that changing the values of a tag changes the
+    attributes which are set.
+    """
+    tag = A(href='www.google.com', text='google', id='link')
+    assert len(tag.values) == len(A._get_defaults()) + 1
+    assert tag.values['id'] == 'link'
+    assert tag.values['rel'] is None
+
+    tag.values['href'] = 'www.yahoo.com'
+    tag.values['rel'] = 'nofollow'
+    tag.values['text'] = None
+    del tag.values['id']
+
+    assert tag._values == {'href': 'www.yahoo.com', 'rel': 'nofollow'}
+    assert tag.construct() == A(href='www.yahoo.com',
+                                rel='nofollow').construct()
+
+    with pytest.raises(KeyError):
+        tag.values['unknown']
+
+    with pytest.raises(KeyError):
+        del tag.values['unknown']
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+
+import os
+
+import pytest
+
+from jinja2 import (
+    ChoiceLoader,
+    DictLoader,
+    Environment,
+    FileSystemBytecodeCache,
+    TemplateNotFound
+)
+
+from korona.templates.html import global_attributes, tags
+from korona.templates.html.environment import (
+    BYTECODE_CACHE_PATTERN,
+    SOURCES,
+    PrecompiledLoader,
+    compile_templates
+)
+
+
+def test_templates_are_registered():
+    """Test for validating that the html templates are registered by name."""
+    assert SOURCES['a.html'] == tags.anchor.source
+    assert SOURCES['input.html'] == tags.input.source
+    assert 'global_attributes.html' in SOURCES
+
+
+def test_compile_templates(tmpdir, monkeypatch):
+    """Test for validating that the precompiled templates are loaded without
+    parsing the template sources.
+    """
+    paths = compile_templates(target=str(tmpdir))
+    assert len(paths) == len(SOURCES)
+    assert all(os.path.exists(path) for path in paths)
+
+    env = Environment(loader=PrecompiledLoader(str(tmpdir), SOURCES))
+
+    def parse(*args, **kwargs):
+        raise AssertionError('template source should not be parsed')
+
+    monkeypatch.setattr(env, '_parse', parse)
+
+    values = {'href': 'www.google.com', 'text': 'google'}
+    assert (env.get_template('a.html').render(values) ==
+            tags.anchor.template.render(values))
+
+
+def test_precompiled_template_with_changed_source(tmpdir):
+    """Test for validating that a template precompiled from an older source is
+    not loaded.
+    """
+    sources = {'p.html': '<p>{{ text }}</p>'}
+    loader = PrecompiledLoader(str(tmpdir), sources)
+    env = Environment(loader=loader)
+    path = os.path.join(str(tmpdir), loader.get_template_key('p.html') + '.py')
+    with open(path, 'w') as module:
+        module.write(env.compile(sources['p.html'], 'p.html', raw=True,
+                                 defer_init=True))
+
+    assert env.get_template('p.html').render(text='abcd') == '<p>abcd</p>'
+
+    sources['p.html'] = '<p>{{ text }}!</p>'
+    env = Environment(loader=ChoiceLoader([loader, DictLoader(sources)]))
+    assert env.get_template('p.html').render(text='abcd') == '<p>abcd!</p>'
+
+    with pytest.raises(TemplateNotFound):
+        Environment(loader=loader).get_template('div.html')
+
+
+def test_bytecode_cache(tmpdir):
+    """Test for validating that the compiled templates are cached on disk with
+    the korona and jinja versions in the cache key.
+    """
+    cache = FileSystemBytecodeCache(str(tmpdir), BYTECODE_CACHE_PATTERN)
+    env = Environment(loader=DictLoader(SOURCES), bytecode_cache=cache)
+    env.get_template('a.html')
+
+    files = os.listdir(str(tmpdir))
+    assert len(files) == 1
+    assert files[0].startswith(BYTECODE_CACHE_PATTERN.split('%s')[0])
+    assert '-jinja2-' in files[0]
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+
+from .fixtures import backend
+
+from korona.html.root.fragment import compile_fragment
+from korona.html.root.placeholder import Placeholder
+from korona.html.root.slot import Slot
+from korona.html.tags import A, B, Div, H1, Input
+
+
+def get_card(title, href, kind=None):
+    """Returns a card with the given title and link."""
+    return Div(id='card',
+               text=[H1(text=title),
+                     A(rel='nofollow', href=href, class_=kind, text=title)])
+
+
+@pytest.fixture
+def render_card():
+    return compile_fragment(Div(
+        id='card',
+        text=[H1(text=Slot('title')),
+              A.with_slots(rel='nofollow',
+                           href=Slot('href', default='www.google.com'),
+                           class_=Slot('kind', default=''),
+                           text=Slot('title'))]))
+
+
+@pytest.mark.parametrize('slots, expected', [
+    ({'title': 'abcd', 'href': 'www.yahoo.com'},
+     get_card('abcd', 'www.yahoo.com')),
+    ({'title': 'abcd'}, get_card('abcd', 'www.google.com')),
+    ({'title': 'abcd', 'kind': 'efgh'},
+     get_card('abcd', 'www.google.com', 'efgh')),
+    ({'title': H1(text='abcd')}, get_card(H1(text='abcd'), 'www.google.com')),
+    ({'title': ['abcd', Div(text='efgh'), 1]},
+     get_card(['abcd', Div(text='efgh'), 1], 'www.google.com')),
+    ({'title': None}, get_card(None, 'www.google.com')),
+])
+def test_compile_fragment(render_card, slots, expected):
+    """Test for validating that a fragment function renders the same as the
+    tree with the slots filled.
+    """
+    assert render_card(**slots) == expected.construct()
+
+
+def test_compile_fragment_arguments(render_card):
+    """Test for validating that the slots without defaults are required
+    arguments of the fragment function.
+    """
+    assert render_card('abcd') == render_card(title='abcd')
+
+    with pytest.raises(TypeError):
+        render_card()
+
+    with pytest.raises(TypeError):
+        render_card(title='abcd', footer='efgh')
+
+
+def test_compile_fragment_escape():
+    """Test for validating that the string values of the slots are escaped
+    only if it is asked for.
+    """
+    tree = Div(text=[Input.with_slots(type='text', value=Slot('value')),
+                     Slot('text')])
+
+    render = compile_fragment(tree)
+    render_escaped = compile_fragment(tree, escape_values=True)
+
+    assert render(text='<b>', value='"a"') == \
+        '<div ><input type="text" value=""a"" ><b></div>'
+    assert render_escaped(text='<b>', value='"a"') == \
+        '<div ><input type="text" value="&quot;a&quot;" >&lt;b&gt;</div>'
+    assert render_escaped(text=H1(text='<b>'), value='') == \
+        '<div ><input type="text" ><h1 ><b></h1></div>'
+
+
+@pytest.mark.parametrize('slots, expected', [
+    ({}, B(text='abcd')),
+    ({'kind': 'efgh'}, B(class_='efgh', text='abcd')),
+    ({'name': 'ijkl'}, B(id='ijkl', text='abcd')),
+    ({'kind': 'efgh', 'name': 'ijkl'},
+     B(class_='efgh', id='ijkl', text='abcd')),
+])
+def test_compile_fragment_empty_attribute_slots(slots, expected, backend):
+    """Test for validating that the empty attribute slots are rendered the
+    same as the tag constructed without them, by both the renderer backends.
+    """
+    render = compile_fragment(B.with_slots(
+        class_=Slot('kind', default=''),
+        id=Slot('name', default=''),
+        text='abcd'))
+
+    assert render(**slots) == expected.construct()
+
+
+@pytest.mark.parametrize('tree, error', [
+    (Div(text=Slot('1a')), ValueError),
+    (Div(text=Slot('_out')), ValueError),
+    (Div(text=Slot('class')), ValueError),
+    (Div(text=Placeholder('abcd')), TypeError),
+])
+def test_compile_fragment_errors(tree, error):
+    """Test for validating the errors for the trees which cannot be compiled
+    into a function.
+    """
+    with pytest.raises(error):
+        compile_fragment(tree)
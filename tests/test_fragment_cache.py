@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+
+import os
+import time
+
+import pytest
+
+from korona.html.root import fragment_cache
+from korona.html.root.fragment_cache import (
+    FragmentCache,
+    cached,
+    get_fragment_cache,
+    invalidate,
+    set_fragment_cache
+)
+from korona.html.tags import DD, DL, DT
+from korona.lib.cache import FileStorage, MemoryStorage
+
+
+class Factory(object):
+    """Tree factory counting its calls."""
+    def __init__(self, text='abcd'):
+        self.text = text
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return DL(text=[DT(text=self.text), DD(text=str(self.calls))])
+
+
+@pytest.fixture(params=['memory', 'file'])
+def cache(request, tmpdir):
+    """Fragment cache with an in-process or a file storage."""
+    if request.param == 'memory':
+        return FragmentCache(MemoryStorage())
+    return FragmentCache(FileStorage(str(tmpdir.join('fragments'))))
+
+
+def test_fragment_cache(cache):
+    """Test for validating that a fragment is built once and returned from
+    the cache under its key.
+    """
+    factory = Factory()
+    expected = DL(text=[DT(text='abcd'), DD(text='1')]).construct()
+
+    assert cache.cached('a', factory) == expected
+    assert cache.cached('a', factory) == expected
+    assert factory.calls == 1
+
+    assert cache.cached('b', factory) != expected
+    assert factory.calls == 2
+
+
+def test_fragment_cache_ttl(cache, monkeypatch):
+    """Test for validating that a fragment is built again after it
+    expires.
+    """
+    now = time.time()
+    monkeypatch.setattr(fragment_cache.time, 'time', lambda: now)
+    factory = Factory()
+
+    cache.cached('a', factory, ttl=10)
+    cache.cached('b', factory)
+    monkeypatch.setattr(fragment_cache.time, 'time', lambda: now + 10)
+    cache.cached('a', factory, ttl=10)
+    cache.cached('b', factory)
+
+    assert factory.calls == 3
+
+
+def test_fragment_cache_invalidate(cache):
+    """Test for validating that the fragments are built again after their
+    key or one of their dependency keys is invalidated.
+    """
+    factories = [Factory() for _ in range(3)]
+
+    def build():
+        cache.cached('a', factories[0], deps=['product:1'])
+        cache.cached('b', factories[1], deps=['product:1', 'product:2'])
+        cache.cached('c', factories[2], deps=['product:2'])
+        return [factory.calls for factory in factories]
+
+    assert build() == [1, 1, 1]
+    assert build() == [1, 1, 1]
+
+    cache.invalidate(dep='product:1')
+    assert build() == [2, 2, 1]
+
+    cache.invalidate(key='c')
+    assert build() == [2, 2, 2]
+
+    cache.invalidate(dep='product:3')
+    assert build() == [2, 2, 2]
+
+    cache.clear()
+    assert build() == [3, 3, 3]
+
+    with pytest.raises(ValueError):
+        cache.invalidate()
+
+
+def test_fragment_cache_stale_build(cache):
+    """Test for validating that a fragment built while its dependency key is
+    invalidated is stale.
+    """
+    def factory():
+        cache.invalidate(dep='product:1')
+        return DT(text='abcd')
+
+    cache.cached('a', factory, deps=['product:1'])
+    other = Factory()
+    cache.cached('a', other, deps=['product:1'])
+
+    assert other.calls == 1
+
+
+def test_fragment_cache_evicted_version():
+    """Test for validating that a fragment is stale when the version of its
+    dependency key was evicted from the storage.
+    """
+    storage = MemoryStorage()
+    cache = FragmentCache(storage)
+    factory = Factory()
+
+    cache.cached('a', factory, deps=['product:1'])
+    storage.remove(fragment_cache.DEPENDENCY_PREFIX + 'product:1')
+    cache.cached('a', factory, deps=['product:1'])
+
+    assert factory.calls == 2
+
+
+def test_fragment_cache_functions():
+    """Test for validating the functions using the fragment cache of the
+    process.
+    """
+    previous = get_fragment_cache()
+    set_fragment_cache(FragmentCache())
+    try:
+        factory = Factory()
+        assert cached('a', factory, deps=['b']) == \
+            cached('a', factory, deps=['b'])
+
+        invalidate(dep='b')
+        cached('a', factory, deps=['b'])
+        assert factory.calls == 2
+    finally:
+        set_fragment_cache(previous)
+
+
+def test_file_storage(tmpdir):
+    """Test for validating that the values of a file storage are shared by
+    the storages of the same directory.
+    """
+    directory = str(tmpdir.join('fragments'))
+    storage = FileStorage(directory)
+    storage.set('a', ('abcd', None))
+    storage.set('b', 'efgh')
+
+    assert FileStorage(directory).get('a') == ('abcd', None)
+    assert storage.get('c') is None
+    assert storage.remove('b')
+    assert not storage.remove('b')
+
+    with open(storage.get_path('a'), 'wb') as stream:
+        stream.write(b'')
+    assert storage.get('a') is None
+
+    storage.clear()
+    assert os.listdir(directory) == []
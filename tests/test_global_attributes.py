@@ -2,9 +2,10 @@
 
 import pytest
 
-from .fixtures import parametrize
+from .fixtures import backend, parametrize
 
 from korona.html.root.global_attributes import GlobalAttributes
+from korona.html.tags import A, Abbr, Div, H1, HR, Input
 from korona.templates.html.global_attributes import global_attributes
 from korona.exceptions import AttributeValueError, TagAttributeError
 
@@ -78,3 +79,76 @@ def test_construct_global_attributes_error(attributes, exception, error_msg):
         GlobalAttributes(**attributes)
 
     assert error_msg in str(exc)
+
+
+@parametrize('attributes,exception,error_msg', [
+    ({'id': 'a b', 'spellcheck': 'abcd'},
+     AttributeValueError,
+     'id attribute value should not have any spaces'),
+    ({'id': '12', 'tabindex': 'abcd', 'translate': 'abcd'},
+     AttributeValueError,
+     'id attribute value must contain at least one character'),
+    ({'hidden': 'abcd', 'id': 'a b'},
+     AttributeError,
+     'hidden attribute should be a boolean value')
+])
+def test_construct_global_attributes_first_error(attributes, exception,
+                                                 error_msg):
+    """Test for validating that the global attributes are validated in the
+    same order as before their validations were compiled.
+    """
+    with pytest.raises(exception) as exc:
+        GlobalAttributes(**attributes)
+
+    assert error_msg in str(exc)
+
+
+@parametrize('tag,attributes,expected', [
+    (A, {'href': 'www.google.com', 'text': 'google', 'id': 'link',
+         'class_': 'external', 'style': 'color:blue;'},
+     '<a href="www.google.com" class="external" id="link" '
+     'style="color:blue;" >google</a>'),
+    (Abbr, {'text': 'WHO'}, '<abbr>WHO</abbr>'),
+    (Abbr, {'text': 'WHO', 'title': 'World Health Organization'},
+     '<abbr title="World Health Organization" >WHO</abbr>'),
+    (Div, {'hidden': True, 'dir': 'rtl'}, '<div dir="rtl" hidden ></div>'),
+    (H1, {'align': 'left', 'tabindex': 2, 'text': 'abcd'},
+     '<h1 align="left" tabindex="2" >abcd</h1>'),
+    (HR, {'class_': 'line'}, '<hr class="line" >'),
+    (Input, {'type': 'text', 'id': 'name', 'hidden': False},
+     '<input type="text" id="name" >')
+])
+def test_construct_tag_with_global_attributes(tag, attributes, expected,
+                                              backend):
+    """Test for validating that the global attributes of a tag are rendered
+    with its other attributes, by both the renderer backends.
+    """
+    assert tag(**attributes).construct() == expected
+    assert tag.trusted(**attributes).construct() == expected
+
+
+def test_construct_many_with_global_attributes():
+    """Test for validating the tags with global attributes constructed in
+    bulk.
+    """
+    rows = [{'href': 'www.google.com', 'class_': 'a'},
+            {'href': 'www.yahoo.com', 'id': 'b'}]
+
+    assert A.construct_many(rows, separator='') == (
+        '<a href="www.google.com" class="a" ></a>'
+        '<a href="www.yahoo.com" id="b" ></a>')
+
+
+@parametrize('attributes,exception,error_msg', [
+    ({'class_': '1class'}, AttributeValueError, 'must begin with a letter'),
+    ({'dir': 'temp'}, TagAttributeError, '<div>: dir attribute values'),
+    ({'id': 'temp id'}, AttributeValueError, 'should not have any spaces'),
+    ({'abcd': 'temp'}, TypeError, "Div() got an unexpected keyword argument"),
+    ({'data-abcd': 'temp'}, TypeError, 'unexpected keyword argument')
+])
+def test_tag_global_attributes_error(attributes, exception, error_msg):
+    """Test for validating the global attributes of a tag."""
+    with pytest.raises(exception) as exc:
+        Div(**attributes)
+
+    assert error_msg in str(exc)
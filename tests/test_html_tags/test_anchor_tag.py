@@ -104,6 +104,28 @@ def test_construct_anchor_tag_error(attributes, exception, error_msg):
     assert error_msg in str(exc)
 
 
+@parametrize('attributes,exception,error_msg', [
+    ({'type': 'abc', 'rev': 'abc'},
+     TagAttributeError,
+     'rev attribute values should be one of'),
+    ({'type': 'abc', 'shape': 'abc'},
+     TagAttributeError,
+     'shape attribute values should be one of'),
+    ({'download': 'www.google.com', 'rel': 'abc'},
+     TagAttributeError,
+     'download attribute is only used when href'),
+    ({'hreflang': 'en', 'href': 532}, ValueError, 'is not a valid url')
+])
+def test_construct_anchor_tag_first_error(attributes, exception, error_msg):
+    """Test for validating that the attributes of the anchor tag are
+    validated in the same order as before their validations were compiled.
+    """
+    with pytest.raises(exception) as exc:
+        A(**attributes)
+
+    assert error_msg in str(exc)
+
+
 @parametrize('attributes,warning', [
     ({'charset': 'temp'}, 'Common character sets used are')
 ])
@@ -41,3 +41,24 @@ def test_construct_col_tag_error(attributes, exception, error_msg):
         Col(**attributes)
 
     assert error_msg in str(exc)
+
+
+@parametrize('attributes,exception,error_msg', [
+    ({'char': '.', 'valign': 'abc'},
+     AttributeError,
+     'The char attribute can only be used'),
+    ({'align': 'char', 'charoff': '2', 'valign': 'abc'},
+     AttributeError,
+     'The charoff attribute can only be used'),
+    ({'align': 'abc', 'char': '.'},
+     TagAttributeError,
+     'align attribute values should be one of')
+])
+def test_construct_col_tag_first_error(attributes, exception, error_msg):
+    """Test for validating that the attributes of the col tag are
+    validated in the same order as before their validations were compiled.
+    """
+    with pytest.raises(exception) as exc:
+        Col(**attributes)
+
+    assert error_msg in str(exc)
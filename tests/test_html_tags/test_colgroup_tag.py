@@ -40,3 +40,21 @@ def test_construct_colgroup_tag_error(attributes, exception, error_msg):
         ColGroup(**attributes)
 
     assert error_msg in str(exc)
+
+
+@parametrize('attributes,exception,error_msg', [
+    ({'char': '.', 'valign': 'abc'},
+     AttributeError,
+     'The char attribute can only be used'),
+    ({'align': 'char', 'charoff': '2', 'valign': 'abc'},
+     AttributeError,
+     'The charoff attribute can only be used')
+])
+def test_construct_colgroup_tag_first_error(attributes, exception, error_msg):
+    """Test for validating that the attributes of the colgroup tag are
+    validated in the same order as before their validations were compiled.
+    """
+    with pytest.raises(exception) as exc:
+        ColGroup(**attributes)
+
+    assert error_msg in str(exc)
@@ -46,3 +46,21 @@ def test_construct_form_tag_error(attributes, exception, error_msg):
         Form(**attributes)
 
     assert error_msg in str(exc)
+
+
+@parametrize('attributes,exception,error_msg', [
+    ({'enctype': 'abc'},
+     AttributeError,
+     'The enctype attribute can be used/set only if method="post"'),
+    ({'autocomplete': 'abc', 'enctype': 'text/plain'},
+     TagAttributeError,
+     'autocomplete attribute values should be one of')
+])
+def test_construct_form_tag_first_error(attributes, exception, error_msg):
+    """Test for validating that the attributes of the form tag are
+    validated in the same order as before their validations were compiled.
+    """
+    with pytest.raises(exception) as exc:
+        Form(**attributes)
+
+    assert error_msg in str(exc)
@@ -145,3 +145,14 @@ def test_construct_h6_tag_error(attributes, exception, error_msg):
         H6(**attributes)
 
     assert error_msg in str(exc)
+
+
+@parametrize('tag', [H1, H2, H3, H4, H5, H6])
+def test_heading_tag_error_names_the_tag(tag):
+    """Test for validating that the validation shared by the headings raises
+    errors naming the heading.
+    """
+    with pytest.raises(TagAttributeError) as exc:
+        tag(align='abcd')
+
+    assert '<{0}>: align'.format(tag.__name__.lower()) in str(exc)
@@ -53,3 +53,21 @@ def test_construct_iframe_tag_error(attributes, exception, error_msg):
         IFrame(**attributes)
 
     assert error_msg in str(exc)
+
+
+@parametrize('attributes,exception,error_msg', [
+    ({'sandbox': 'abc', 'scrolling': 'abc'},
+     TagAttributeError,
+     'sandbox attribute values should be one of'),
+    ({'sandbox': 'abc', 'src': 532},
+     TagAttributeError,
+     'sandbox attribute values should be one of')
+])
+def test_construct_iframe_tag_first_error(attributes, exception, error_msg):
+    """Test for validating that the attributes of the iframe tag are
+    validated in the same order as before their validations were compiled.
+    """
+    with pytest.raises(exception) as exc:
+        IFrame(**attributes)
+
+    assert error_msg in str(exc)
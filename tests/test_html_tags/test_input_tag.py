@@ -7,6 +7,11 @@ import pytest
 from ..fixtures import parametrize
 
 from korona.html.tags import Input
+from korona.html.tags.input import (
+    ATTRIBUTES,
+    ATTRIBUTES_FOR_INPUT_TYPES,
+    INPUT_TYPES_FOR_ATTRIBUTES
+)
 from korona.templates.html.tags import input as tag
 from korona.exceptions import TagAttributeError, AttributeValueError
 
@@ -403,3 +408,48 @@ def test_construct_input_tag_error(attributes, exception, error_msg):
         Input(**attributes)
 
     assert error_msg in str(exc)
+
+
+def test_attributes_for_input_types():
+    """Test for validating that the attributes permitted by each input type
+    are the same as the input types given for each attribute.
+    """
+    for name, attribute in INPUT_TYPES_FOR_ATTRIBUTES.items():
+        for input_type in ATTRIBUTES['type']['values']:
+            assert ((name in ATTRIBUTES_FOR_INPUT_TYPES.get(input_type, ())) ==
+                    (input_type in attribute['types']))
+
+
+@parametrize('attributes,error_msg', [
+    ({'accept': 'audio/*', 'align': 'left', 'type': 'text'},
+     'accept attribute can only be used with'),
+    ({'width': '100', 'height': '100', 'type': 'file'},
+     'height attribute is used only with'),
+    ({'max': 10, 'step': 2}, 'max attribute works with'),
+    ({'placeholder': 'abcd', 'type': ['text']},
+     'placeholder attribute works with')
+])
+def test_construct_input_tag_first_error(attributes, error_msg):
+    """Test for validating that the error of the first attribute which is not
+    permitted by the input type is raised.
+    """
+    with pytest.raises(AttributeError) as exc:
+        Input(**attributes)
+
+    assert error_msg in str(exc)
+
+
+@parametrize('attributes,error_msg', [
+    ({'align': 'abcd', 'type': 'text'}, 'align attribute is only used with'),
+    ({'formmethod': 'abcd', 'type': 'text'},
+     'formmethod attribute can be used with'),
+    ({'height': 'abcd', 'type': 'text'}, 'height attribute is used only with')
+])
+def test_construct_input_tag_type_error_first(attributes, error_msg):
+    """Test for validating that the attributes are validated against the
+    input type before their values are validated.
+    """
+    with pytest.raises(AttributeError) as exc:
+        Input(**attributes)
+
+    assert error_msg in str(exc)
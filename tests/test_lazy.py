@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+
+from korona.lib import lazy
+from korona.lib.lazy import lazy_attributes
+
+MODULES = {'A': 'anchor', 'Div': 'div'}
+
+
+def test_lazy_attributes():
+    """Test for validating that the attributes of a package are imported the
+    first time they are accessed.
+    """
+    namespace = {}
+    getattr_, dir_ = lazy_attributes('korona.html.tags', MODULES, namespace)
+
+    assert namespace == {}
+    assert dir_() == ['A', 'Div']
+
+    tag = getattr_('A')
+    assert tag.__module__ == 'korona.html.tags.anchor'
+    assert namespace == {'A': tag}
+
+    with pytest.raises(AttributeError) as exc:
+        getattr_('Span')
+
+    assert "'korona.html.tags' has no attribute 'Span'" in str(exc)
+
+
+def test_lazy_attributes_before_python_37(monkeypatch):
+    """Test for validating that all the attributes are imported right away
+    when module level ``__getattr__`` is not supported.
+    """
+    monkeypatch.setattr(lazy.sys, 'version_info', (3, 6, 0))
+    namespace = {}
+    lazy_attributes('korona.html.tags', MODULES, namespace)
+
+    assert sorted(namespace) == ['A', 'Div']
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+
+import multiprocessing
+import pickle
+
+import pytest
+
+from .fixtures import backend, parametrize
+
+from korona.html.root.element import Element
+from korona.html.root.parallel import partition, render_parallel
+from korona.html.tags import A, Div, H1, Head, Html, Input
+
+futures = pytest.importorskip('concurrent.futures')
+
+
+def page(rows=50):
+    """Returns a page with a table-like tree of tags."""
+    return Html(text=[Head(),
+                      Div(align='center',
+                          text=[Div(text=[Div(text='cell {0}'.format(cell),
+                                              class_='cell')
+                                          for cell in range(5)] +
+                                         ['abcd', 1, None])
+                                for _ in range(rows)]),
+                      H1(text=[A(href='www.google.com', text='google')])])
+
+
+@parametrize('tree', [
+    page(),
+    Div(text='abcd'),
+    H1(text=A(href='www.google.com', text='google')),
+    Div(text=[[Div(text='abcd')], (Div(text='efgh'),)])
+])
+def test_render_parallel(tree, backend):
+    """Test for validating that a tag constructed across a pool of processes
+    is the same as the serially constructed tag, with both the renderer
+    backends.
+    """
+    assert render_parallel(tree, workers=2) == tree.construct()
+
+
+@parametrize('executor_class', [
+    futures.ThreadPoolExecutor,
+    futures.ProcessPoolExecutor
+])
+def test_render_parallel_executor(executor_class):
+    """Test for validating a tag constructed with a given pool."""
+    tree = page()
+    with executor_class(2) as executor:
+        assert render_parallel(tree, executor=executor) == tree.construct()
+
+
+def test_render_parallel_without_start_method(monkeypatch):
+    """Test for validating that the batches are sent pickled to the workers
+    when the start method of the processes is unknown (python 3.3 or
+    older).
+    """
+    monkeypatch.delattr(multiprocessing, 'get_start_method')
+    tree = page()
+    assert render_parallel(tree, workers=2) == tree.construct()
+
+
+def test_render_parallel_single_worker():
+    """Test for validating that a tag is constructed serially with a single
+    worker.
+    """
+    tree = page()
+    assert render_parallel(tree, workers=1) == tree.construct()
+
+
+def test_partition():
+    """Test for validating that a tree is split level by level into its
+    tags until there are enough subtrees.
+    """
+    tree = page(rows=10)
+    pieces = partition(tree, 8)
+
+    assert pieces[:3] == ['<html >', tree.children[0], '<div align="center" >']
+    assert sum(1 for piece in pieces if isinstance(piece, Element)) == 12
+    assert ''.join(piece if isinstance(piece, str) else piece.construct()
+                   for piece in pieces) == tree.construct()
+    assert partition(Div(text='abcd'), 8)[0].construct() == '<div >abcd</div>'
+
+
+def test_pickle_tags():
+    """Test for validating that the tags are pickled in a compact form with
+    only the attributes which are set.
+    """
+    tree = page()
+    data = pickle.dumps(tree, protocol=pickle.HIGHEST_PROTOCOL)
+    restored = pickle.loads(data)
+
+    assert isinstance(restored, Html)
+    assert restored.construct() == tree.construct()
+    assert b'_values' not in data
+
+    tag = pickle.loads(pickle.dumps(Input(type='text', name='abcd')))
+    assert tag.tag == 'input'
+    assert tag._values == {'type': 'text', 'name': 'abcd'}
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+
+import time
+
+import pytest
+
+from korona.exceptions import AttributeValueError
+from korona.html.root.placeholder import SWAP_SCRIPT, Placeholder
+from korona.html.tags import Div, H1, Head, Html
+
+futures = pytest.importorskip('concurrent.futures')
+
+
+def swap(id, fragment):
+    """Returns the rendered fragment of a placeholder without the swap
+    function.
+    """
+    return ('<template id="{0}-content">{1}</template>'
+            '<script>koronaSwap("{0}")</script>'.format(id, fragment))
+
+
+def test_placeholder():
+    """Test for validating that the slot of a placeholder is rendered in
+    document order and its fragment at the end.
+    """
+    page = Html(text=[Head(),
+                      Placeholder(Div(text='abcd'), fallback='loading',
+                                  id='slot'),
+                      H1(text='efgh')])
+
+    assert page.construct() == (
+        '<html ><head></head><div id="slot" >loading</div><h1 >efgh</h1>'
+        '</html>' + SWAP_SCRIPT + swap('slot', '<div >abcd</div>'))
+
+
+def test_placeholder_fragments_order():
+    """Test for validating that the fragments are written in the order they
+    are ready and that the placeholders of a fragment are rendered.
+    """
+    slow = futures.Future()
+    fast = futures.Future()
+    page = Div(text=[Placeholder(slow, id='slow'),
+                     Placeholder(fast, id='fast')])
+    chunks = page.iter_render(chunk_size=1024)
+
+    assert next(chunks) == '<div ><div id="slow" ></div><div id="fast" >' \
+                           '</div></div>'
+
+    fast.set_result(['abcd', Placeholder('efgh', id='nested')])
+    assert next(chunks) == SWAP_SCRIPT + swap(
+        'fast', 'abcd<div id="nested" ></div>')
+    assert next(chunks) == swap('nested', 'efgh')
+
+    slow.set_result(H1(text='ijkl'))
+    assert list(chunks) == [swap('slow', '<h1 >ijkl</h1>')]
+
+
+def test_placeholder_time_to_first_chunk():
+    """Test for validating that a slow fragment does not delay the first
+    chunk of a page.
+    """
+    def query():
+        time.sleep(0.2)
+        return Div(text='abcd')
+
+    with futures.ThreadPoolExecutor(1) as executor:
+        page = Html(text=[Head(),
+                          Placeholder(executor.submit(query), id='query'),
+                          Div(text='efgh')])
+        start = time.time()
+        chunks = page.iter_render(chunk_size=1024)
+        first = next(chunks)
+        first_time = time.time() - start
+        rest = ''.join(chunks)
+        total_time = time.time() - start
+
+    assert first == '<html ><head></head>'
+    assert rest.endswith(swap('query', '<div >abcd</div>'))
+    assert first_time < 0.1
+    assert total_time >= 0.2
+
+
+def test_placeholder_errors():
+    """Test for validating the errors of the placeholders."""
+    with pytest.raises(AttributeValueError):
+        Placeholder('abcd', id='ab cd')
+
+    class Awaitable(object):
+        def __await__(self):
+            return iter(())
+
+    with pytest.raises(TypeError) as exc:
+        Div(text=Placeholder(Awaitable())).construct()
+
+    assert 'rendered with render_async()' in str(exc)
+
+
+def test_placeholder_script_escaping():
+    """Test for validating that the id of a placeholder is escaped in its
+    swap script.
+    """
+    parts = Placeholder('abcd', id='a</script>').get_swap('abcd')
+    assert parts[-1] == '<script>koronaSwap("a<\\/script>")</script>'
@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+
+from .fixtures import backend
+
+from korona.exceptions import TagAttributeError
+from korona.html.root.element import FLUSH
+from korona.html.root.placeholder import SWAP_SCRIPT, Placeholder
+from korona.html.root.plan import RenderPlan, compile_plan
+from korona.html.root.slot import Slot
+from korona.html.tags import A, B, Div, H1, Head, Html, Input
+
+
+def get_page(title=Slot('title'), content=Slot('content', default='empty')):
+    """Returns a page with the given title and content."""
+    rows = [Div(text=str(row)) for row in range(3)]
+    return Html(text=[Head(),
+                      H1(text=title),
+                      Div(align='center', text=rows + [content]),
+                      A(href='www.google.com', text='google')])
+
+
+def test_compile_plan():
+    """Test for validating that a plan renders the same as the tree with the
+    slots filled.
+    """
+    plan = compile_plan(get_page())
+
+    assert plan.render(title='abcd', content=Div(text='efgh')) == \
+        get_page('abcd', Div(text='efgh')).construct()
+    assert plan.render({'title': 'abcd'}) == get_page('abcd', 'empty') \
+        .construct()
+
+
+def test_compile_plan_static_parts():
+    """Test for validating that the static parts of a tree are rendered once
+    into literal strings between the slots and the flush points.
+    """
+    plan = compile_plan(get_page())
+
+    assert plan.parts == (
+        '<html ><head></head>', FLUSH, '<h1 >', plan.slots['title'],
+        '</h1><div align="center" ><div >0</div><div >1</div><div >2</div>',
+        plan.slots['content'],
+        '</div><a href="www.google.com" >google</a></html>')
+    assert sorted(plan.slots) == ['content', 'title']
+
+
+def test_compile_plan_without_slots():
+    """Test for validating that a tree without slots is rendered into a single
+    string.
+    """
+    page = Div(text=[H1(text='abcd'), (str(row) for row in range(3))])
+    plan = compile_plan(page, flush_after=())
+
+    assert plan.parts == ('<div ><h1 >abcd</h1>012</div>',)
+    assert plan.render() == plan.render()
+
+
+def test_render_plan_slot_errors():
+    """Test for validating that the slots without defaults have to be filled
+    and that unknown slots are rejected.
+    """
+    plan = compile_plan(get_page())
+
+    with pytest.raises(TypeError):
+        plan.render(content='abcd')
+
+    with pytest.raises(TypeError):
+        plan.render(title='abcd', footer='efgh')
+
+
+def test_render_plan_iter_render():
+    """Test for validating that a plan is streamed in chunks with the flush
+    points of the tree and of the slot values.
+    """
+    plan = compile_plan(Div(text=[Head(), Slot('content'), 'abcd']))
+    chunks = list(plan.iter_render({'content': [Head(), 'efgh']},
+                                   chunk_size=1024))
+
+    assert chunks == ['<div ><head></head>', '<head></head>', 'efghabcd</div>']
+    assert ''.join(plan.iter_render({'content': 'efgh'})) == \
+        '<div ><head></head>efghabcd</div>'
+    assert ''.join(plan.iter_render(content='efgh', chunk_size=1024)) == \
+        '<div ><head></head>efghabcd</div>'
+
+
+def test_render_plan_placeholders():
+    """Test for validating that the placeholders of a plan are rendered every
+    time the plan is rendered.
+    """
+    plan = compile_plan(Div(text=Placeholder(H1(text='abcd'), id='slot')))
+
+    assert isinstance(plan.parts[1], Placeholder)
+    assert plan.render() == ('<div ><div id="slot" ></div></div>' +
+                             SWAP_SCRIPT +
+                             '<template id="slot-content"><h1 >abcd</h1>'
+                             '</template>'
+                             '<script>koronaSwap("slot")</script>')
+
+
+def test_slot_default():
+    """Test for validating that a slot renders its default without a plan."""
+    assert Div(text=Slot('content')).construct() == '<div ></div>'
+    assert Div(text=['abcd', Slot('content', default=H1(text='efgh'))]) \
+        .construct() == '<div >abcd<h1 >efgh</h1></div>'
+
+
+def test_render_plan_parts():
+    """Test for validating that a plan can be created from parts."""
+    plan = RenderPlan(['<div >', Slot('content'), '</div>'])
+
+    assert plan.render(content='abcd') == '<div >abcd</div>'
+
+
+def test_compile_plan_attribute_slots():
+    """Test for validating that the attribute slots are rendered like the
+    other attributes, and only when they are not empty.
+    """
+    link = A.with_slots(rel='nofollow',
+                        href=Slot('href', default='www.google.com'),
+                        class_=Slot('kind', default=''),
+                        text=Slot('title'))
+    plan = compile_plan(Div(text=link))
+
+    assert plan.render(title='abcd', href='www.yahoo.com', kind='efgh') == \
+        Div(text=A(rel='nofollow', href='www.yahoo.com', class_='efgh',
+                   text='abcd')).construct()
+    assert plan.render(title='abcd') == Div(text=A(
+        rel='nofollow', href='www.google.com', text='abcd')).construct()
+
+
+@pytest.mark.parametrize('tag, attributes', [
+    (B, {'class_': 'kind'}),
+    (B, {'class_': 'kind', 'id': 'name'}),
+    (B, {'class_': 'kind', 'style': 'style'}),
+    (Div, {'class_': 'kind'}),
+    (Div, {'class_': 'kind', 'align': 'align'}),
+])
+@pytest.mark.parametrize('values', [
+    {},
+    {'kind': 'abcd'},
+    {'name': 'efgh'},
+    {'style': 'color: red'},
+    {'kind': 'abcd', 'name': 'efgh', 'style': 'color: red', 'align': 'left'},
+])
+@pytest.mark.parametrize('text', [None, 'text', [H1(text='title')]])
+def test_compile_plan_attribute_slots_construct(tag, attributes, values,
+                                                text, backend):
+    """Test for validating that the attribute slots, empty or filled, are
+    rendered the same as the tag constructed with their values, by both the
+    renderer backends.
+    """
+    slots = dict((name, Slot(slot, default=''))
+                 for name, slot in attributes.items())
+    filled = dict((name, values.get(slot))
+                  for name, slot in attributes.items())
+    slot_values = dict((slot, values.get(slot, ''))
+                       for slot in attributes.values())
+
+    plan = compile_plan(tag.with_slots(text=text, **slots))
+
+    assert plan.render(slot_values) == tag(text=text, **filled).construct()
+
+
+@pytest.mark.parametrize('tag,attributes,expected', [
+    (A, {'href': Slot('href', default='www.google.com'), 'text': 'google'},
+     A(href='www.google.com', text='google')),
+    (A, {'href': Slot('href'), 'text': Slot('text', default='google')},
+     A(text='google')),
+    (Input, {'type': 'checkbox', 'checked': Slot('checked', default=True)},
+     Input(type='checkbox', checked=True)),
+    (Input, {'type': 'text', 'value': Slot('value', default='')},
+     Input(type='text')),
+])
+def test_with_slots_construct(tag, attributes, expected, backend):
+    """Test for validating that a tag with attribute slots is constructed
+    with the defaults of the slots outside of a plan, by both the renderer
+    backends.
+    """
+    tree = Div(text=tag.with_slots(**attributes))
+
+    assert tag.with_slots(**attributes).construct() == expected.construct()
+    assert tree.construct() == Div(text=expected).construct()
+
+
+def test_with_slots_validation():
+    """Test for validating that the attributes of a tag with slots are
+    validated with the defaults of the slots.
+    """
+    with pytest.raises(TagAttributeError):
+        A.with_slots(rel='nofollow', href=Slot('href'))
+
+    with pytest.raises(TagAttributeError):
+        A.with_slots(rel='abcd', href=Slot('href', default='www.google.com'))
+
+    with pytest.raises(TypeError):
+        compile_plan(Input.with_slots(type='checkbox',
+                                      checked=Slot('checked')))
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+
+import pickle
+
+import pytest
+
+from korona.exceptions import AttributeValueError, TagAttributeError
+from korona.html.root.element import Element
+from korona.html.tags import A, Div, Input
+
+
+@pytest.mark.parametrize('tag, prototype, variants', [
+    (A,
+     {'rel': 'nofollow', 'target': '_blank'},
+     [{'href': 'www.google.com', 'text': 'google'},
+      {'href': 'www.yahoo.com', 'text': 'yahoo'},
+      {'href': 'www.bing.com', 'text': None},
+      {'href': 'www.bing.com', 'text': 'bing', 'class_': 'external'},
+      {'href': 'www.bing.com', 'text': 'bing', 'class_': None},
+      {'href': 'www.bing.com', 'rel': 'help'}]),
+    (Input,
+     {'type': 'text', 'required': True},
+     [{'name': 'first', 'value': 'abcd'},
+      {'name': 'last', 'value': 'efgh'},
+      {'name': 'last', 'value': None},
+      {'placeholder': 'ijkl'}]),
+    (Div,
+     {'align': 'center', 'id': 'main'},
+     [{'text': 'abcd'},
+      {'text': 'efgh'},
+      {'align': 'left', 'text': 'ijkl'}]),
+])
+def test_prototype_variants(tag, prototype, variants):
+    """Test for validating that the variants of a prototype are the same as
+    the tags created with all their attributes.
+    """
+    proto = tag.prototype(**prototype)
+    for attributes in variants:
+        variant = proto.with_(**attributes)
+        expected = tag(**dict(prototype, **attributes))
+
+        assert isinstance(variant, tag)
+        assert variant._values == expected._values
+        assert variant.construct() == expected.construct()
+
+
+def test_prototype_validates_variants_once(monkeypatch):
+    """Test for validating that the variants setting the same attributes are
+    only validated in full once.
+    """
+    calls = []
+    init = A.__init__
+
+    def validate(self, **attributes):
+        calls.append(attributes)
+        init(self, **attributes)
+
+    monkeypatch.setattr(A, '__init__', validate)
+    proto = A.prototype(rel='nofollow', target='_blank')
+    for index in range(5):
+        proto.with_(href='www.google.com/{0}'.format(index), text=str(index))
+    proto.with_(text='abcd', href='www.google.com', name='efgh')
+
+    assert len(calls) == 2
+
+
+@pytest.mark.parametrize('tag, prototype, valid, invalid, error', [
+    (A, {'rel': 'nofollow'},
+     {'href': 'www.google.com', 'text': 'abcd'},
+     {'href': None, 'text': 'abcd'},
+     TagAttributeError),
+    (A, {'rel': 'nofollow'},
+     {'href': 'www.google.com', 'text': 'abcd'},
+     {'href': '', 'text': 'abcd'},
+     TagAttributeError),
+    (A, {'rel': 'nofollow'},
+     {'href': 'www.google.com', 'id': 'abcd'},
+     {'href': 'www.google.com', 'id': '1 2'},
+     AttributeValueError),
+    (A, {'rel': 'nofollow'},
+     {'href': 'www.google.com'},
+     {'href': 'www.google.com', 'unknown': True},
+     TypeError),
+    (Input, {'type': 'file'},
+     {'value': None},
+     {'value': 'abcd'},
+     AttributeError),
+    (Input, {'type': 'checkbox'},
+     {'placeholder': None},
+     {'placeholder': 'abcd'},
+     AttributeError),
+    (Input, {'type': 'text', 'dirname': 'abcd.dir'},
+     {'name': 'abcd'},
+     {'name': 'efgh'},
+     AttributeError),
+])
+def test_prototype_invalid_variants(tag, prototype, valid, invalid, error):
+    """Test for validating that the invalid variants of a prototype raise the
+    same errors as the tags, after a valid variant setting the same
+    attributes.
+    """
+    proto = tag.prototype(**prototype)
+    proto.with_(**valid)
+
+    with pytest.raises(error):
+        proto.with_(**invalid)
+
+
+def test_prototype_variant_pickle():
+    """Test for validating that a variant is pickled as a tag of the tag class
+    of its prototype.
+    """
+    variant = A.prototype(rel='nofollow').with_(href='www.google.com')
+    tag = pickle.loads(pickle.dumps(variant))
+
+    assert tag.__class__ is A
+    assert tag.construct() == variant.construct()
+
+
+def test_element_validate_variant():
+    """Test for validating that only the text of a tag can be changed on its
+    own by default.
+    """
+    tag = Div(text='abcd')
+
+    assert Element._validate_variant(tag, {'text': 'efgh'})
+    assert not Element._validate_variant(tag, {'align': 'left'})
@@ -0,0 +1,266 @@
+# -*- coding: utf-8 -*-
+
+import subprocess
+import sys
+import threading
+
+import pytest
+
+from jinja2 import Environment
+
+from .fixtures import parametrize
+
+from korona.html.tags import A, Div, Input
+from korona.templates.html import global_attributes as global_templates
+from korona.templates.html import tags as tag_templates
+from korona.templates.html.environment import SOURCES
+from korona.templates.html.renderer import (
+    ElementTemplate,
+    Template,
+    compile_renderer,
+    get_backend,
+    set_backend
+)
+
+
+@pytest.fixture
+def sources():
+    """Removes the template sources registered by a test afterwards."""
+    registered = dict(SOURCES)
+    yield SOURCES
+    SOURCES.clear()
+    SOURCES.update(registered)
+
+
+def get_templates():
+    """Returns all the html templates defined in korona."""
+    templates = [getattr(tag_templates, name)
+                 for name in tag_templates.__all__]
+    templates.append(global_templates.global_attributes)
+    return sorted(templates, key=lambda template: template.source)
+
+
+def get_values(template, attributes=None):
+    """Returns a list of values to be rendered with the given template."""
+    if attributes is None:
+        attributes = template.attributes
+
+    names = list(attributes) + ['text']
+    values = [{},
+              dict((name, name.upper()) for name in names),
+              dict((name, 0) for name in names),
+              dict((name, '') for name in names)]
+
+    for name in names:
+        values.append({name: '{0} value'.format(name)})
+        values.append({name: 1})
+
+    return values
+
+
+@pytest.fixture
+def compiled_backend():
+    """Renders the templates with the compiled backend during a test."""
+    backend = get_backend()
+    set_backend('compiled')
+    yield
+    set_backend(backend)
+
+
+@parametrize('template', get_templates())
+def test_compiled_renderer_output(template):
+    """Test for validating that the compiled renderer produces the same output
+    as the jinja template.
+    """
+    for values in get_values(template):
+        assert template.renderer(values) == template.template.render(values)
+
+
+@parametrize('tag,template,attributes', [
+    (A, tag_templates.anchor,
+     {'href': 'www.google.com', 'rel': 'nofollow', 'text': 'google'}),
+    (Div, tag_templates.div, {'align': 'center', 'text': 'abcd'}),
+    (Input, tag_templates.input,
+     {'type': 'checkbox', 'checked': True, 'name': 'abc'})
+])
+def test_construct_tag_with_compiled_backend(compiled_backend,
+                                             tag,
+                                             template,
+                                             attributes):
+    """Test for validating that the tags are constructed with the compiled
+    backend.
+    """
+    assert get_backend() == 'compiled'
+    assert tag(**attributes).construct() == template.template.render(
+        attributes)
+
+
+@parametrize('args,kwargs', [
+    (({'align': 'left', 'text': 'abcd'},), {}),
+    ((), {'align': 'left', 'text': 'abcd'}),
+    (({'align': 'left'},), {'text': 'abcd'})
+])
+def test_template_render_arguments(compiled_backend, args, kwargs):
+    """Test for validating that the compiled backend accepts the same
+    arguments as jinja's render method.
+    """
+    assert (tag_templates.div.render(*args, **kwargs) ==
+            tag_templates.div.template.render(*args, **kwargs))
+
+
+@parametrize('options,values,expected', [
+    ({'tag': 'p', 'attributes': ['id']}, {'id': 1, 'text': 'x'},
+     '<p id="1" >x</p>'),
+    ({'tag': 'br', 'text': False, 'closing': False}, {}, '<br>'),
+    ({'attributes': ['hidden'], 'boolean_attributes': ['hidden'],
+      'text': False}, {'hidden': True}, 'hidden ')
+])
+def test_compile_renderer(options, values, expected):
+    """Test for validating the generated python render functions."""
+    assert compile_renderer(**options)(values) == expected
+
+
+def test_compile_renderer_constants():
+    """Test for validating that the constant attributes are pre-rendered and
+    that other values of the same attributes are rendered.
+    """
+    align = 'center'
+    render = compile_renderer(tag='div', attributes=['align', 'hidden'],
+                              boolean_attributes=['hidden'],
+                              constants={'align': align, 'hidden': True})
+
+    assert render({'align': align, 'hidden': True}) == \
+        '<div align="center" hidden ></div>'
+    assert render({'align': 'left'}) == '<div align="left" ></div>'
+    assert render({}) == '<div ></div>'
+
+
+def test_template_specialize():
+    """Test for validating that a specialized template renders the same as
+    the template.
+    """
+    template = tag_templates.anchor.specialize({'rel': 'nofollow',
+                                                'text': 'abcd'})
+    values = {'rel': 'nofollow', 'href': 'www.google.com', 'text': 'abcd'}
+
+    assert template.constants == {'rel': 'nofollow'}
+    assert template.renderer(values) == tag_templates.anchor.renderer(values)
+    assert template.template.render(values) == template.renderer(values)
+
+
+def test_set_invalid_backend():
+    """Test for validating the error for an unknown renderer backend."""
+    with pytest.raises(ValueError) as exc:
+        set_backend('mako')
+
+    assert 'Renderer backend should be one of these' in str(exc)
+
+
+def test_template_is_compiled_lazily(sources):
+    """Test for validating that the jinja template is compiled only when it is
+    rendered for the first time.
+    """
+    template = Template(tag='p', source='<p>{{ text }}</p>',
+                        name='test_lazy_p.html')
+    assert template._template is None
+
+    assert template.template.render({'text': 'abcd'}) == '<p>abcd</p>'
+    assert template._template is not None
+
+
+def test_template_registered_name(sources):
+    """Test for validating that a template can not replace the source of
+    another template registered under the same name.
+    """
+    Template(tag='p', source='<p>{{ text }}</p>', name='test_p.html')
+    Template(tag='p', source='<p>{{ text }}</p>', name='test_p.html')
+    assert 'test_p.html' in sources
+
+    with pytest.raises(ValueError) as exc:
+        Template(tag='p', source='<p>{{ title }}</p>', name='test_p.html')
+
+    assert "already registered as 'test_p.html'" in str(exc)
+
+    with pytest.raises(ValueError):
+        Template(tag='a', source='<a>{{ text }}</a>')
+
+    assert sources['a.html'] == tag_templates.anchor.source
+
+
+def test_import_does_not_compile_templates():
+    """Test for validating that importing the html tags does not compile any
+    of the templates.
+    """
+    code = ('import korona.html.tags\n'
+            'from korona.templates.html import global_attributes, tags\n'
+            'from korona.templates.html.renderer import Template\n'
+            'templates = [getattr(tags, name) for name in tags.__all__]\n'
+            'templates.append(global_attributes.global_attributes)\n'
+            'print(sum(template._template is not None\n'
+            '          for template in templates))\n')
+    output = subprocess.check_output([sys.executable, '-c', code])
+    assert output.strip() == b'0'
+
+
+@parametrize('template,source', [
+    (tag_templates.abbr,
+     '<abbr>{%- if text -%} {{ text }} {%- endif -%}</abbr>'),
+    (tag_templates.h1,
+     '<h1 {% if align -%} align="{{ align }}" {% endif -%}>'
+     '{%- if text -%} {{ text }} {%- endif -%}</h1>')
+])
+def test_element_template(template, source):
+    """Test for validating that the generic element template renders a tag
+    the same as a jinja template of the tag.
+    """
+    jinja_template = Environment().from_string(source)
+    for values in get_values(template, template.tag_attributes):
+        assert template.render(values) == jinja_template.render(values)
+
+
+@parametrize('options', [
+    {'tag': 'p', 'attributes': ['id', 'hidden'],
+     'boolean_attributes': ['hidden']},
+    {'tag': 'br', 'text': False, 'closing': False},
+    {'tag': 'canvas', 'attributes': ['height', 'width'], 'text': False}
+])
+def test_element_template_options(options):
+    """Test for validating the generic element template for the different
+    shapes of tags.
+    """
+    template = ElementTemplate(**options)
+    for values in get_values(template):
+        assert template.template.render(values) == template.renderer(values)
+
+
+def test_element_templates_are_shared():
+    """Test for validating that all the element templates are rendered by the
+    same jinja template.
+    """
+    assert (tag_templates.h1.template.template is
+            tag_templates.abbr.template.template)
+    assert tag_templates.h1.template.element is tag_templates.h1
+
+
+def test_template_is_built_once_by_threads():
+    """Test for validating that a template rendered for the first time by many
+    threads at the same time is built only once.
+    """
+    template = ElementTemplate(tag='p', attributes=['align'])
+    barrier = threading.Barrier(8) if hasattr(threading, 'Barrier') else None
+    built = []
+
+    def build():
+        if barrier is not None:
+            barrier.wait()
+        built.append((template.template, template.renderer,
+                      template.opening_renderer))
+
+    threads = [threading.Thread(target=build) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(built) == 8
+    assert len(set(built)) == 1
@@ -1,9 +1,13 @@
 # -*- coding: utf-8 -*-
 
+import subprocess
+import sys
+
 import pytest
 
 from .fixtures import parametrize
 
+from korona.html import tags
 from korona.lib.utils import validate_tag
 
 
@@ -17,3 +21,34 @@ def test_validate_invalid_tags(tag, error, error_msg):
         validate_tag(tag)
 
     assert error_msg in str(exc)
+
+
+def test_lazy_tag_imports():
+    """Test for validating that importing a tag class only imports its own
+    module.
+    """
+    code = ('import sys\n'
+            'from korona.html.tags import A\n'
+            'print(sorted(module for module in sys.modules\n'
+            '             if module.startswith("korona.html.tags.") or\n'
+            '             module.startswith("korona.templates.html.tags.")))')
+    output = subprocess.check_output([sys.executable, '-c', code])
+    assert output.decode().strip() == ("['korona.html.tags.anchor', "
+                                       "'korona.templates.html.tags.anchor']")
+
+
+def test_tags_module_attributes():
+    """Test for validating that all the tag classes are listed and can be
+    accessed from the tags module.
+    """
+    assert set(tags.__all__) <= set(dir(tags))
+
+    for name in tags.__all__:
+        tag = getattr(tags, name)
+        assert tag.__name__ == name
+        assert tag.__module__.startswith('korona.html.tags.')
+
+    with pytest.raises(AttributeError) as exc:
+        tags.Span
+
+    assert "has no attribute 'Span'" in str(exc)
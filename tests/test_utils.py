@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+
+import datetime
+
+import pytest
+
+from .fixtures import parametrize
+
+from korona.exceptions import TagAttributeError
+from korona.lib.utils import (
+    compile_validator,
+    format_coords,
+    validate_attribute_values,
+    validate_boolean_attribute,
+    validate_date_attribute,
+    validate_number_attribute,
+    validate_string_attribute,
+    validate_time_attribute,
+    validate_url
+)
+
+ATTRIBUTES = {
+    'align': {
+        'description': 'Specifies the alignment of the text',
+        'values': ['left', 'right', 'center']
+    }
+}
+
+RULES = [('align', 'string', 'values'),
+         ('hidden', 'boolean'),
+         ('size', 'number'),
+         ('max', 'date'),
+         ('start', 'time'),
+         ('src', 'url')]
+
+
+def validate(**attributes):
+    """Validates the given attributes one by one with the generic validation
+    functions.
+    """
+    validate_string_attribute('p', 'align', attributes.get('align'))
+    validate_attribute_values('p', 'align', attributes.get('align'),
+                              ATTRIBUTES['align']['values'])
+    validate_boolean_attribute('p', 'hidden', attributes.get('hidden'))
+    validate_number_attribute('p', 'size', attributes.get('size'))
+    validate_date_attribute('p', 'max', attributes.get('max'))
+    validate_time_attribute('p', 'start', attributes.get('start'))
+    validate_url('src', attributes.get('src'))
+
+
+@parametrize('attributes', [
+    {},
+    {'align': 'left', 'hidden': True, 'size': 2.5,
+     'max': datetime.date(2017, 1, 1), 'start': datetime.time(10, 30),
+     'src': 'www.google.com'},
+    {'align': '', 'hidden': False, 'size': 0, 'src': None},
+    {'size': '2.5'},
+    {'max': datetime.datetime(2017, 1, 1, 10, 30)}
+])
+def test_compile_validator(attributes):
+    """Test for validating that the valid attributes pass the compiled
+    validator.
+    """
+    compile_validator('p', ATTRIBUTES, RULES)(**attributes)
+    validate(**attributes)
+
+
+@parametrize('attributes', [
+    {'align': 1},
+    {'align': 'top'},
+    {'align': ['left']},
+    {'hidden': 'true'},
+    {'size': 'abcd'},
+    {'max': '2017-01-01'},
+    {'start': '10:30'},
+    {'src': 123},
+    {'align': 'top', 'size': 'abcd'}
+])
+def test_compile_validator_error(attributes):
+    """Test for validating that the compiled validator raises the same errors
+    as the generic validation functions.
+    """
+    with pytest.raises(Exception) as expected:
+        validate(**attributes)
+
+    with pytest.raises(expected.type) as exc:
+        compile_validator('p', ATTRIBUTES, RULES)(**attributes)
+
+    assert str(exc.value) == str(expected.value)
+
+
+def test_compile_validator_keyword_attribute():
+    """Test for validating that attribute names which are python keywords get
+    a trailing underscore.
+    """
+    attributes = {'class': {'values': ['a', 'b']}}
+    validator = compile_validator('p', attributes, [('class', 'values')])
+    validator(class_='a')
+
+    with pytest.raises(TagAttributeError) as exc:
+        validator(class_='c')
+
+    assert 'class attribute values should be one of these: a,b' in str(exc)
+
+
+def test_compile_validator_invalid_rule():
+    """Test for validating the error for an unknown validation rule."""
+    with pytest.raises(ValueError) as exc:
+        compile_validator('p', ATTRIBUTES, [('align', 'integer')])
+
+    assert 'Validation rule should be one of these' in str(exc)
+
+
+@pytest.mark.parametrize('coords, expected', [
+    ([0, 0, 82, 126], '0,0,82,126'),
+    ((90, 58, 3), '90,58,3'),
+    ('0,0,82,126', '0,0,82,126'),
+    (None, None),
+])
+def test_format_coords(coords, expected):
+    """Test for validating that the coordinates of a trusted tag are joined
+    into a string.
+    """
+    assert format_coords({'coords': coords, 'shape': 'rect'}) == \
+        {'coords': expected, 'shape': 'rect'}